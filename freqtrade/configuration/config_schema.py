@@ -4,8 +4,10 @@ from freqtrade.constants import (
     AVAILABLE_DATAHANDLERS,
     AVAILABLE_PAIRLISTS,
     BACKTEST_BREAKDOWNS,
+    BACKTEST_ENGINES,
     DRY_RUN_WALLET,
     EXPORT_OPTIONS,
+    HYPEROPT_DATA_STORES,
     MARGIN_MODES,
     ORDERTIF_POSSIBILITIES,
     ORDERTYPE_POSSIBILITIES,
@@ -212,6 +214,41 @@ CONF_SCHEMA = {
             "type": "array",
             "items": {"type": "string", "enum": BACKTEST_BREAKDOWNS},
         },
+        "backtest_engine": {
+            "description": (
+                "Engine used to run backtests. `numpy` keeps data as arrays and only processes "
+                "pairs with a signal or an open trade. `list` is the reference implementation."
+            ),
+            "type": "string",
+            "enum": BACKTEST_ENGINES,
+            "default": "list",
+        },
+        "backtest_signal_cache": {
+            "description": (
+                "Cache analyzed dataframes per pair on disk, so only new pairs and candles are "
+                "analyzed by subsequent backtests."
+            ),
+            "type": "boolean",
+            "default": False,
+        },
+        "hyperopt_data_store": {
+            "description": (
+                "How hyperopt passes the analyzed data to its worker processes. `memmap` "
+                "stores numeric columns as memory-mapped arrays shared by all workers."
+            ),
+            "type": "string",
+            "enum": HYPEROPT_DATA_STORES,
+            "default": "pickle",
+        },
+        "hyperopt_indicator_cache_mb": {
+            "description": (
+                "Memory (in MB) each hyperopt worker may use to cache indicators calculated "
+                "with `cached_indicator()`. 0 disables the cache."
+            ),
+            "type": "integer",
+            "minimum": 0,
+            "default": 256,
+        },
         "bot_name": {
             "description": "Name of the trading bot. Passed via API to a client.",
             "type": "string",
@@ -702,6 +739,12 @@ CONF_SCHEMA = {
                     "description": "Enable systemd notify.",
                     "type": "boolean",
                 },
+                "analyze_workers": {
+                    "description": "Number of threads used to analyze pairs.",
+                    "type": "integer",
+                    "minimum": 1,
+                    "default": 1,
+                },
             },
         },
         "dataformat_ohlcv": {
@@ -776,6 +819,14 @@ CONF_SCHEMA = {
                     "type": "number",
                     "minimum": 0.0,
                 },
+                "compact": {
+                    "description": (
+                        "Store trades, orderflow and imbalances as numpy arrays "
+                        "instead of lists and dicts."
+                    ),
+                    "type": "boolean",
+                    "default": False,
+                },
             },
             "required": [
                 "max_candles",
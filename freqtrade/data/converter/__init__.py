@@ -8,15 +8,21 @@ from freqtrade.data.converter.converter import (
     trim_dataframe,
     trim_dataframes,
 )
-from freqtrade.data.converter.orderflow import populate_dataframe_with_trades
+from freqtrade.data.converter.orderflow import (
+    candle_trades_to_dataframe,
+    orderflow_to_dataframe,
+    populate_dataframe_with_trades,
+)
 from freqtrade.data.converter.trade_converter import (
     convert_trades_format,
     convert_trades_to_ohlcv,
+    trades_chunks_to_ohlcv_timeframes,
     trades_convert_types,
     trades_df_remove_duplicates,
     trades_dict_to_list,
     trades_list_to_df,
     trades_to_ohlcv,
+    trades_to_ohlcv_timeframes,
 )
 
 
@@ -31,10 +37,14 @@ __all__ = [
     "trim_dataframes",
     "convert_trades_format",
     "convert_trades_to_ohlcv",
+    "candle_trades_to_dataframe",
+    "orderflow_to_dataframe",
     "populate_dataframe_with_trades",
+    "trades_chunks_to_ohlcv_timeframes",
     "trades_convert_types",
     "trades_df_remove_duplicates",
     "trades_dict_to_list",
     "trades_list_to_df",
     "trades_to_ohlcv",
+    "trades_to_ohlcv_timeframes",
 ]
@@ -4,7 +4,6 @@ Functions to convert orderflow data from public_trades
 
 import logging
 import time
-from datetime import datetime
 
 import numpy as np
 import pandas as pd
@@ -29,6 +28,21 @@ ORDERFLOW_ADDED_COLUMNS = [
     "total_trades",
 ]
 
+# Compact representation (`orderflow.compact`) - one structured array per candle
+ORDERFLOW_DTYPE = np.dtype(
+    [
+        ("price", "f8"),
+        ("bid", "i8"),
+        ("ask", "i8"),
+        ("delta", "f8"),
+        ("bid_amount", "f8"),
+        ("ask_amount", "f8"),
+        ("total_volume", "f8"),
+        ("total_trades", "i8"),
+    ]
+)
+IMBALANCES_DTYPE = np.dtype([("price", "f8"), ("bid_imbalance", "?"), ("ask_imbalance", "?")])
+
 
 def _init_dataframe_with_trades_columns(dataframe: pd.DataFrame):
     """
@@ -119,76 +133,36 @@ def populate_dataframe_with_trades(
         # get date of earliest max_candles candle
         max_candles = config_orderflow["max_candles"]
         start_date = dataframe.tail(max_candles).date.iat[0]
-        # slice of trades that are before current ohlcv candles to make groupby faster
+        # slice of trades that are before current ohlcv candles
         trades = trades.loc[trades["candle_start"] >= start_date]
-        trades.reset_index(inplace=True, drop=True)
-
-        # group trades by candle start
-        trades_grouped_by_candle_start = trades.groupby("candle_start", group_keys=False)
-
-        candle_start: datetime
-        for candle_start, trades_grouped_df in trades_grouped_by_candle_start:
-            is_between = candle_start == dataframe["date"]
-            if is_between.any():
-                # there can only be one row with the same date
-                index = dataframe.index[is_between][0]
-
-                if (
-                    cached_grouped_trades is not None
-                    and (candle_start == cached_grouped_trades["date"]).any()
-                ):
-                    # Check if the trades are already in the cache
-                    cache_idx = cached_grouped_trades.index[
-                        cached_grouped_trades["date"] == candle_start
-                    ][0]
-                    for col in ORDERFLOW_ADDED_COLUMNS:
-                        dataframe.at[index, col] = cached_grouped_trades.at[cache_idx, col]
-                    continue
-
-                dataframe.at[index, "trades"] = trades_grouped_df.drop(
-                    columns=["candle_start", "candle_end"]
-                ).to_dict(orient="records")
-
-                # Calculate orderflow for each candle
-                orderflow = trades_to_volumeprofile_with_total_delta_bid_ask(
-                    trades_grouped_df, scale=config_orderflow["scale"]
-                )
-                dataframe.at[index, "orderflow"] = orderflow.to_dict(orient="index")
-                # orderflow_series.loc[[index]] = [orderflow.to_dict(orient="index")]
-                # Calculate imbalances for each candle's orderflow
-                imbalances = trades_orderflow_to_imbalances(
-                    orderflow,
-                    imbalance_ratio=config_orderflow["imbalance_ratio"],
-                    imbalance_volume=config_orderflow["imbalance_volume"],
-                )
-                dataframe.at[index, "imbalances"] = imbalances.to_dict(orient="index")
-
-                stacked_imbalance_range = config_orderflow["stacked_imbalance_range"]
-                dataframe.at[index, "stacked_imbalances_bid"] = stacked_imbalance_bid(
-                    imbalances, stacked_imbalance_range=stacked_imbalance_range
-                )
-
-                dataframe.at[index, "stacked_imbalances_ask"] = stacked_imbalance_ask(
-                    imbalances, stacked_imbalance_range=stacked_imbalance_range
-                )
-
-                bid = np.where(
-                    trades_grouped_df["side"].str.contains("sell"), trades_grouped_df["amount"], 0
-                )
-
-                ask = np.where(
-                    trades_grouped_df["side"].str.contains("buy"), trades_grouped_df["amount"], 0
-                )
-                deltas_per_trade = ask - bid
-                dataframe.at[index, "max_delta"] = deltas_per_trade.cumsum().max()
-                dataframe.at[index, "min_delta"] = deltas_per_trade.cumsum().min()
-
-                dataframe.at[index, "bid"] = bid.sum()
-                dataframe.at[index, "ask"] = ask.sum()
-                dataframe.at[index, "delta"] = (
-                    dataframe.at[index, "ask"] - dataframe.at[index, "bid"]
-                )
-                dataframe.at[index, "total_trades"] = len(trades_grouped_df)
+
+        # position of the candle of every trade (-1 if the candle is not in the dataframe)
+        candle_pos = pd.Index(dataframe["date"]).get_indexer(trades["candle_start"])
+        columns = {col: dataframe[col].to_numpy(copy=True) for col in ORDERFLOW_ADDED_COLUMNS}
+
+        if cached_grouped_trades is not None:
+            # Candles which are already in the cache aren't calculated again
+            candles = np.unique(candle_pos[candle_pos >= 0])
+            cache_pos = pd.Index(cached_grouped_trades["date"]).get_indexer(
+                dataframe["date"].iloc[candles]
+            )
+            cached = candles[cache_pos >= 0]
+            for col in ORDERFLOW_ADDED_COLUMNS:
+                columns[col][cached] = cached_grouped_trades[col].to_numpy()[
+                    cache_pos[cache_pos >= 0]
+                ]
+            candle_pos[np.isin(candle_pos, cached)] = -1
+
+        in_dataframe = candle_pos >= 0
+        if in_dataframe.any():
+            _populate_candles(
+                columns,
+                trades.loc[in_dataframe].reset_index(drop=True),
+                candle_pos[in_dataframe],
+                config_orderflow,
+            )
+        for col in ORDERFLOW_ADDED_COLUMNS:
+            dataframe[col] = columns[col]
 
         logger.debug(f"trades.groups_keys in {time.time() - start_time} seconds")
 
@@ -202,20 +176,210 @@ def populate_dataframe_with_trades(
     return dataframe, cached_grouped_trades
 
 
-def trades_to_volumeprofile_with_total_delta_bid_ask(
-    trades: pd.DataFrame, scale: float
-) -> pd.DataFrame:
+def _populate_candles(
+    columns: dict[str, np.ndarray],
+    trades: pd.DataFrame,
+    candle_pos: np.ndarray,
+    config_orderflow: dict,
+) -> None:
+    """
+    Calculates the orderflow columns of all candles at once.
+    :param columns: Orderflow columns of the dataframe - updated in place
+    :param trades: Trades belonging to the candles to calculate
+    :param candle_pos: Position of the candle of every trade within the dataframe
+    :param config_orderflow: Orderflow configuration
+    """
+    # Sort trades by candle (keeping the order of trades within a candle)
+    order = np.argsort(candle_pos, kind="stable")
+    trades = trades.iloc[order].reset_index(drop=True)
+    candle_pos = candle_pos[order]
+    candles, starts, counts = np.unique(candle_pos, return_index=True, return_counts=True)
+    bounds = list(zip(starts.tolist(), (starts + counts).tolist(), strict=True))
+
+    compact = config_orderflow.get("compact", False)
+    candle_trades: list | np.ndarray
+    if compact:
+        candle_trades = _trades_to_array(trades)
+    else:
+        candle_trades = _to_records(trades.drop(columns=["candle_start", "candle_end"]))
+    levels = _trades_to_levels(trades, scale=config_orderflow["scale"])
+    bid = levels["bid_amount"].to_numpy()
+    ask = levels["ask_amount"].to_numpy()
+    bid_sum = np.add.reduceat(bid, starts)
+    ask_sum = np.add.reduceat(ask, starts)
+    cum_deltas = _cumsum_per_candle(ask - bid, starts, counts)
+
+    columns["trades"][candles] = _split(candle_trades, bounds)
+    columns["max_delta"][candles] = np.maximum.reduceat(cum_deltas, starts)
+    columns["min_delta"][candles] = np.minimum.reduceat(cum_deltas, starts)
+    columns["bid"][candles] = bid_sum
+    columns["ask"][candles] = ask_sum
+    columns["delta"][candles] = ask_sum - bid_sum
+    columns["total_trades"][candles] = counts
+
+    # group to bins per candle aka apply scale
+    levels["candle"] = candle_pos
+    orderflow = levels.groupby(["candle", "price"]).sum(numeric_only=True)
+    level_candles = orderflow.index.get_level_values("candle").to_numpy()
+    prices = orderflow.index.get_level_values("price").to_numpy()
+    level_ends = np.cumsum(np.unique(level_candles, return_counts=True)[1])
+    level_bounds = list(zip([0, *level_ends[:-1].tolist()], level_ends.tolist(), strict=True))
+
+    # Compare bid and ask diagonally - not beyond the last level of a candle
+    last_level = np.append(level_candles[1:] != level_candles[:-1], True)
+    bid_count = orderflow["bid"].to_numpy(dtype=np.float64)
+    ask_next = np.where(last_level, np.nan, np.roll(orderflow["ask"].to_numpy(np.float64), -1))
+    enough_volume = orderflow["total_volume"].to_numpy() >= config_orderflow["imbalance_volume"]
+    ratio = config_orderflow["imbalance_ratio"]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        bid_imbalance = enough_volume & ((bid_count / ask_next) > ratio)
+        ask_imbalance = enough_volume & ((ask_next / bid_count) > ratio)
+    imbalances = pd.DataFrame({"bid_imbalance": bid_imbalance, "ask_imbalance": ask_imbalance})
+
+    if compact:
+        orderflow_array = np.empty(len(orderflow), dtype=ORDERFLOW_DTYPE)
+        orderflow_array["price"] = prices
+        for col in orderflow.columns:
+            orderflow_array[col] = orderflow[col].to_numpy()
+        imbalances_array = np.empty(len(imbalances), dtype=IMBALANCES_DTYPE)
+        imbalances_array["price"] = prices
+        imbalances_array["bid_imbalance"] = bid_imbalance
+        imbalances_array["ask_imbalance"] = ask_imbalance
+        columns["orderflow"][candles] = _split(orderflow_array, level_bounds)
+        columns["imbalances"][candles] = _split(imbalances_array, level_bounds)
+    else:
+        price_keys = prices.tolist()
+        orderflow_records = _to_records(orderflow)
+        imbalance_records = _to_records(imbalances)
+        columns["orderflow"][candles] = [
+            dict(zip(price_keys[s:e], orderflow_records[s:e], strict=True)) for s, e in level_bounds
+        ]
+        columns["imbalances"][candles] = [
+            dict(zip(price_keys[s:e], imbalance_records[s:e], strict=True)) for s, e in level_bounds
+        ]
+
+    stacked_imbalance_range = config_orderflow["stacked_imbalance_range"]
+    columns["stacked_imbalances_bid"][candles] = _stacked_imbalance_prices(
+        bid_imbalance, level_candles, prices, candles, stacked_imbalance_range, last=False
+    )
+    columns["stacked_imbalances_ask"][candles] = _stacked_imbalance_prices(
+        ask_imbalance, level_candles, prices, candles, stacked_imbalance_range, last=True
+    )
+
+
+def _to_records(df: pd.DataFrame) -> list[dict]:
+    """
+    Faster equivalent of `df.to_dict(orient="records")` - converting column by column.
+    """
+    columns = df.columns.tolist()
+    values = zip(*(df[col].tolist() for col in columns), strict=True)
+    return [dict(zip(columns, row, strict=True)) for row in values]
+
+
+def _trades_to_array(trades: pd.DataFrame) -> np.ndarray:
+    """
+    Trades as structured array - the compact representation of the `trades` column.
+    """
+    ids = trades["id"].to_numpy(dtype=str)
+    sides = trades["side"].to_numpy(dtype=str)
+    result = np.empty(
+        len(trades),
+        dtype=[
+            ("timestamp", "i8"),
+            ("id", ids.dtype),
+            ("side", sides.dtype),
+            ("price", "f8"),
+            ("amount", "f8"),
+            ("cost", "f8"),
+        ],
+    )
+    result["id"] = ids
+    result["side"] = sides
+    for col in ("timestamp", "price", "amount", "cost"):
+        result[col] = trades[col].to_numpy()
+    return result
+
+
+def _cumsum_per_candle(values: np.ndarray, starts: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    """
+    Cumulative sum of the values of every candle - same result as `values[start:end].cumsum()`.
+    Candles with a similar number of values are stacked as rows of a 2D array (padded with
+    zeros to at most twice their length), which is summed along its rows at once.
+    :param values: Values, sorted by candle
+    :param starts: Position of the first value of every candle
+    :param counts: Number of values of every candle
+    """
+    result = np.empty_like(values)
+    # Position of every value within its candle
+    positions = np.arange(len(values)) - np.repeat(starts, counts)
+    size_classes = np.ceil(np.log2(counts)).astype(np.int64)
+    value_classes = np.repeat(size_classes, counts)
+    for size_class in np.unique(size_classes):
+        class_counts = counts[size_classes == size_class]
+        in_class = value_classes == size_class
+        rows = np.repeat(np.arange(len(class_counts)), class_counts)
+        stacked = np.zeros((len(class_counts), class_counts.max()), dtype=values.dtype)
+        stacked[rows, positions[in_class]] = values[in_class]
+        result[in_class] = np.cumsum(stacked, axis=1)[rows, positions[in_class]]
+    return result
+
+
+def _split(values: list | np.ndarray, bounds: list[tuple[int, int]]) -> np.ndarray:
+    """
+    Splits values into one slice per (start, end) bound, as object array.
+    Slices of arrays are views - all candles share the memory of one array.
+    """
+    result = np.empty(len(bounds), dtype=object)
+    for idx, (start, end) in enumerate(bounds):
+        result[idx] = values[start:end]
+    return result
+
+
+def _stacked_imbalance_prices(
+    imbalance: np.ndarray,
+    level_candles: np.ndarray,
+    prices: np.ndarray,
+    candles: np.ndarray,
+    stacked_imbalance_range: int,
+    last: bool,
+) -> np.ndarray:
+    """
+    Vectorized `stacked_imbalance()` for the price levels of multiple candles.
+    :param imbalance: Imbalance per price level
+    :param level_candles: Candle of every price level (levels sorted by candle and price)
+    :param prices: Price of every price level
+    :param candles: Candles to return the stacked imbalance price for
+    :param last: Return the price of the highest (instead of the lowest) stacked imbalance
+    :return: Stacked imbalance price per candle - nan if there's none
+    """
+    positions = np.arange(len(imbalance))
+    # consecutive imbalances - restarting at every candle
+    new_run = np.ones(len(imbalance), dtype=bool)
+    new_run[1:] = (imbalance[1:] != imbalance[:-1]) | (level_candles[1:] != level_candles[:-1])
+    run_start = np.maximum.accumulate(np.where(new_run, positions, 0))
+    stacked = np.where(imbalance, positions - run_start + 1, 0)
+
+    is_stacked = stacked >= stacked_imbalance_range
+    stacked_prices = pd.Series(prices[is_stacked]).groupby(level_candles[is_stacked])
+    stacked_prices = stacked_prices.last() if last else stacked_prices.first()
+    return stacked_prices.reindex(candles).to_numpy()
+
+
+def _trades_to_levels(trades: pd.DataFrame, scale: float) -> pd.DataFrame:
     """
     :param trades: dataframe
     :param scale: scale aka bin size e.g. 0.5
-    :return: trades binned to levels according to scale aka orderflow
+    :return: bid and ask of every trade, with the price rounded to its level
     """
     df = pd.DataFrame([], columns=DEFAULT_ORDERFLOW_COLUMNS)
-    # create bid, ask where side is sell or buy
-    df["bid_amount"] = np.where(trades["side"].str.contains("sell"), trades["amount"], 0)
-    df["ask_amount"] = np.where(trades["side"].str.contains("buy"), trades["amount"], 0)
-    df["bid"] = np.where(trades["side"].str.contains("sell"), 1, 0)
-    df["ask"] = np.where(trades["side"].str.contains("buy"), 1, 0)
+    # create bid, ask where side is sell or buy - checking every distinct side only once
+    codes, sides = pd.factorize(trades["side"], use_na_sentinel=False)
+    is_sell = pd.Series(sides).str.contains("sell").to_numpy()[codes]
+    is_buy = pd.Series(sides).str.contains("buy").to_numpy()[codes]
+    df["bid_amount"] = np.where(is_sell, trades["amount"], 0)
+    df["ask_amount"] = np.where(is_buy, trades["amount"], 0)
+    df["bid"] = np.where(is_sell, 1, 0)
+    df["ask"] = np.where(is_buy, 1, 0)
     # round the prices to the nearest multiple of the scale
     df["price"] = ((trades["price"] / scale).round() * scale).astype("float64").values
     if df.empty:
@@ -226,12 +390,55 @@ def trades_to_volumeprofile_with_total_delta_bid_ask(
     df["delta"] = df["ask_amount"] - df["bid_amount"]
     df["total_volume"] = df["ask_amount"] + df["bid_amount"]
     df["total_trades"] = df["ask"] + df["bid"]
+    return df
+
+
+def trades_to_volumeprofile_with_total_delta_bid_ask(
+    trades: pd.DataFrame, scale: float
+) -> pd.DataFrame:
+    """
+    :param trades: dataframe
+    :param scale: scale aka bin size e.g. 0.5
+    :return: trades binned to levels according to scale aka orderflow
+    """
+    df = _trades_to_levels(trades, scale)
+    if df.empty:
+        return df
 
     # group to bins aka apply scale
     df = df.groupby("price").sum(numeric_only=True)
     return df
 
 
+def orderflow_to_dataframe(orderflow: dict | list | np.ndarray | float) -> pd.DataFrame:
+    """
+    Price levels of one candle as dataframe, indexed by price.
+    Works for the `orderflow` and `imbalances` columns, in both the default and the
+    compact representation - also after serialization, where compact values are
+    lists of records (see `freqtrade.misc.structured_arrays_to_records()`).
+    :param orderflow: Value of the `orderflow` or `imbalances` column of one candle
+    :return: Dataframe with one row per price level (empty if the candle has no trades)
+    """
+    if isinstance(orderflow, np.ndarray) or (isinstance(orderflow, list) and orderflow):
+        return pd.DataFrame(orderflow).set_index("price")
+    if isinstance(orderflow, dict):
+        return pd.DataFrame.from_dict(orderflow, orient="index").rename_axis("price")
+    return pd.DataFrame(index=pd.Index([], name="price", dtype="float64"))
+
+
+def candle_trades_to_dataframe(trades: list | np.ndarray | float) -> pd.DataFrame:
+    """
+    Trades of one candle as dataframe.
+    Works in both the default and the compact representation of the `trades` column -
+    also after serialization, where compact values are lists of records.
+    :param trades: Value of the `trades` column of one candle
+    :return: Dataframe with one row per trade (empty if the candle has no trades)
+    """
+    if isinstance(trades, np.ndarray | list):
+        return pd.DataFrame(trades)
+    return pd.DataFrame()
+
+
 def trades_orderflow_to_imbalances(df: pd.DataFrame, imbalance_ratio: int, imbalance_volume: int):
     """
     :param df: dataframes with bid and ask
@@ -3,7 +3,9 @@ Functions to convert data from one format to another
 """
 
 import logging
+from collections.abc import Iterable
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import pandas as pd
 from pandas import DataFrame, to_datetime
@@ -20,6 +22,10 @@ from freqtrade.enums import CandleType, TradingMode
 from freqtrade.exceptions import OperationalException
 
 
+if TYPE_CHECKING:
+    from freqtrade.data.history.datahandlers import IDataHandler
+
+
 logger = logging.getLogger(__name__)
 
 
@@ -67,11 +73,15 @@ def trades_list_to_df(trades: TradeList, convert: bool = True):
     return df
 
 
-def trades_to_ohlcv(trades: DataFrame, timeframe: str) -> DataFrame:
+def trades_to_ohlcv(
+    trades: DataFrame, timeframe: str, origin: str | pd.Timestamp = "start_day"
+) -> DataFrame:
     """
     Converts trades list to OHLCV list
     :param trades: List of trades, as returned by ccxt.fetch_trades.
     :param timeframe: Timeframe to resample data to
+    :param origin: Timestamp candles are aligned to (passed to `DataFrame.resample()`).
+        Defaults to the midnight of the first trade.
     :return: OHLCV Dataframe.
     :raises: ValueError if no trades are provided
     """
@@ -81,14 +91,143 @@ def trades_to_ohlcv(trades: DataFrame, timeframe: str) -> DataFrame:
         raise ValueError("Trade-list empty.")
     df = trades.set_index("date", drop=True)
     resample_interval = timeframe_to_resample_freq(timeframe)
-    df_new = df["price"].resample(resample_interval).ohlc()
-    df_new["volume"] = df["amount"].resample(resample_interval).sum()
+    df_new = df["price"].resample(resample_interval, origin=origin).ohlc()
+    df_new["volume"] = df["amount"].resample(resample_interval, origin=origin).sum()
     df_new["date"] = df_new.index
     # Drop 0 volume rows
     df_new = df_new.dropna()
     return df_new.loc[:, DEFAULT_DATAFRAME_COLUMNS]
 
 
+def trades_to_ohlcv_timeframes(
+    trades: DataFrame, timeframes: list[str], origin: str | pd.Timestamp = "start_day"
+) -> dict[str, DataFrame]:
+    """
+    Converts trades to OHLCV for multiple timeframes.
+    Only the lowest timeframe is resampled from the trades - higher timeframes are derived
+    from the candles of the lowest timeframe where its candles line up with them.
+    :param trades: Trades dataframe (as returned by `trades_list_to_df()`)
+    :param timeframes: Timeframes to resample data to
+    :param origin: Timestamp candles are aligned to (passed to `DataFrame.resample()`).
+        Defaults to the midnight of the first trade.
+    :return: OHLCV Dataframe per timeframe.
+    :raises: ValueError if no trades are provided
+    """
+    from freqtrade.exchange import timeframe_to_resample_freq, timeframe_to_seconds
+
+    if trades.empty:
+        raise ValueError("Trade-list empty.")
+    base = min(timeframes, key=timeframe_to_seconds)
+    base_seconds = timeframe_to_seconds(base)
+    base_ohlcv = trades_to_ohlcv(trades, base, origin)
+    result = {}
+    for timeframe in timeframes:
+        resample_interval = timeframe_to_resample_freq(timeframe)
+        if timeframe_to_seconds(timeframe) == base_seconds:
+            result[timeframe] = base_ohlcv
+        elif (
+            resample_interval.endswith("s") and timeframe_to_seconds(timeframe) % base_seconds == 0
+        ) or (resample_interval.endswith(("MS", "YS")) and 86400 % base_seconds == 0):
+            # Base candles are completely within one candle of this timeframe.
+            # Weekly candles are labeled on the right - so they're resampled from the trades.
+            df_new = (
+                base_ohlcv.set_index("date", drop=False)
+                .resample(resample_interval, origin=origin)
+                .agg(
+                    {
+                        "open": "first",
+                        "high": "max",
+                        "low": "min",
+                        "close": "last",
+                        "volume": "sum",
+                    }
+                )
+            )
+            df_new["date"] = df_new.index
+            result[timeframe] = df_new.dropna().loc[:, DEFAULT_DATAFRAME_COLUMNS]
+        else:
+            result[timeframe] = trades_to_ohlcv(trades, timeframe, origin)
+    return result
+
+
+def trades_chunks_to_ohlcv_timeframes(
+    chunks: Iterable[DataFrame], timeframes: list[str]
+) -> dict[str, DataFrame]:
+    """
+    Converts time-ordered chunks of trades to OHLCV for multiple timeframes.
+    Only the candles are kept in memory - candles spanning multiple chunks are merged.
+    All chunks are resampled from the midnight of the first trade - as when converting
+    all trades at once - so multi-day candles of all chunks line up.
+    :param chunks: Trades dataframes (as returned by `IDataHandler.trades_load_chunks()`)
+    :param timeframes: Timeframes to resample data to
+    :return: OHLCV Dataframe per timeframe.
+    :raises: ValueError if no trades are provided
+    """
+    parts: dict[str, list[DataFrame]] = {timeframe: [] for timeframe in timeframes}
+    origin: pd.Timestamp | None = None
+    for chunk in chunks:
+        if chunk.empty:
+            continue
+        if origin is None:
+            origin = chunk["date"].iloc[0].floor("D")
+        for timeframe, ohlcv in trades_to_ohlcv_timeframes(chunk, timeframes, origin).items():
+            parts[timeframe].append(ohlcv)
+    if not parts[timeframes[0]]:
+        raise ValueError("Trade-list empty.")
+    result = {}
+    for timeframe in timeframes:
+        df = pd.concat(parts[timeframe], ignore_index=True)
+        if df["date"].duplicated().any():
+            df = (
+                df.groupby("date", as_index=False, sort=True)
+                .agg(
+                    {
+                        "open": "first",
+                        "high": "max",
+                        "low": "min",
+                        "close": "last",
+                        "volume": "sum",
+                    }
+                )
+                .loc[:, DEFAULT_DATAFRAME_COLUMNS]
+            )
+        result[timeframe] = df
+    return result
+
+
+def _convert_pair_trades_to_ohlcv(
+    pair: str,
+    timeframes: list[str],
+    data_handler_trades: "IDataHandler",
+    data_handler_ohlcv: "IDataHandler",
+    erase: bool,
+    candle_type: CandleType,
+) -> tuple[list[str], bool]:
+    """
+    Convert stored trades of one pair to ohlcv data - reading the trades only once,
+    in chunks.
+    Runs in worker processes - so logging is left to the caller.
+    :return: Timeframes with deleted existing data, and if the conversion failed
+    """
+    trading_mode = TradingMode.FUTURES if candle_type != CandleType.SPOT else TradingMode.SPOT
+    deleted = []
+    if erase:
+        for timeframe in timeframes:
+            if data_handler_ohlcv.ohlcv_purge(pair, timeframe, candle_type=candle_type):
+                deleted.append(timeframe)
+    try:
+        ohlcv = trades_chunks_to_ohlcv_timeframes(
+            data_handler_trades.trades_load_chunks(pair, trading_mode), timeframes
+        )
+    except ValueError:
+        return deleted, False
+    for timeframe in timeframes:
+        data_handler_ohlcv.ohlcv_store(
+            pair, timeframe, data=ohlcv[timeframe], candle_type=candle_type
+        )
+    return deleted, True
+
+
 def convert_trades_to_ohlcv(
     pairs: list[str],
     timeframes: list[str],
@@ -101,7 +240,11 @@ def convert_trades_to_ohlcv(
 ) -> None:
     """
     Convert stored trades data to ohlcv data
+    Pairs are converted in parallel - using one process per cpu core.
     """
+    from joblib import cpu_count
+    from joblib.externals.loky import ProcessPoolExecutor
+
     from freqtrade.data.history import get_datahandler
 
     data_handler_trades = get_datahandler(datadir, data_format=data_format_trades)
@@ -111,19 +254,22 @@ def convert_trades_to_ohlcv(
         f"About to convert pairs: '{', '.join(pairs)}', "
         f"intervals: '{', '.join(timeframes)}' to {datadir}"
     )
-    trading_mode = TradingMode.FUTURES if candle_type != CandleType.SPOT else TradingMode.SPOT
-    for pair in pairs:
-        trades = data_handler_trades.trades_load(pair, trading_mode)
-        for timeframe in timeframes:
-            if erase:
-                if data_handler_ohlcv.ohlcv_purge(pair, timeframe, candle_type=candle_type):
-                    logger.info(f"Deleting existing data for pair {pair}, interval {timeframe}.")
-            try:
-                ohlcv = trades_to_ohlcv(trades, timeframe)
-                # Store ohlcv
-                data_handler_ohlcv.ohlcv_store(pair, timeframe, data=ohlcv, candle_type=candle_type)
-            except ValueError:
-                logger.warning(f"Could not convert {pair} to OHLCV.")
+    args = (timeframes, data_handler_trades, data_handler_ohlcv, erase, candle_type)
+    workers = min(len(pairs), cpu_count())
+    if workers <= 1:
+        results = [_convert_pair_trades_to_ohlcv(pair, *args) for pair in pairs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(_convert_pair_trades_to_ohlcv, pair, *args) for pair in pairs
+            ]
+            results = [future.result() for future in futures]
+
+    for pair, (deleted, success) in zip(pairs, results, strict=True):
+        for timeframe in deleted:
+            logger.info(f"Deleting existing data for pair {pair}, interval {timeframe}.")
+        if not success:
+            logger.warning(f"Could not convert {pair} to OHLCV.")
 
 
 def convert_trades_format(config: Config, convert_from: str, convert_to: str, erase: bool):
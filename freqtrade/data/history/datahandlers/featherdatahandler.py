@@ -1,19 +1,41 @@
+import json
 import logging
+from collections.abc import Iterator
+from datetime import datetime
+from pathlib import Path
+from shutil import rmtree
 
-from pandas import DataFrame, read_feather, to_datetime
+from pandas import DataFrame, concat, read_feather, to_datetime
 
 from freqtrade.configuration import TimeRange
 from freqtrade.constants import DEFAULT_DATAFRAME_COLUMNS, DEFAULT_TRADES_COLUMNS
 from freqtrade.enums import CandleType, TradingMode
+from freqtrade.util import dt_ts
 
 from .idatahandler import IDataHandler
 
 
 logger = logging.getLogger(__name__)
 
+# Schema metadata key holding the date (epoch ms) of the first candle of every record batch
+BLOCK_STARTS_KEY = b"freqtrade_block_starts"
+
 
 class FeatherDataHandler(IDataHandler):
     _columns = DEFAULT_DATAFRAME_COLUMNS
+    _OHLCV_APPEND_SUPPORTED = True
+    # Appended candles are written to separate part files, which are merged into the main file
+    # once this many parts exist.
+    _OHLCV_MAX_PARTS = 20
+
+    @staticmethod
+    def _parts_dir(filename: Path) -> Path:
+        return filename.with_name(f"{filename.name}.parts")
+
+    @classmethod
+    def _part_files(cls, filename: Path) -> list[Path]:
+        parts_dir = cls._parts_dir(filename)
+        return sorted(parts_dir.glob("*.feather")) if parts_dir.is_dir() else []
 
     def ohlcv_store(
         self, pair: str, timeframe: str, data: DataFrame, candle_type: CandleType
@@ -28,12 +50,63 @@ class FeatherDataHandler(IDataHandler):
         :param candle_type: Any of the enum CandleType (must match trading mode!)
         :return: None
         """
+        from pyarrow import Table, feather
+
         filename = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
         self.create_dir_if_needed(filename)
 
-        data.reset_index(drop=True).loc[:, self._columns].to_feather(
-            filename, compression_level=9, compression="lz4"
+        data = data.reset_index(drop=True).loc[:, self._columns]
+        # Write candles in blocks of fixed size, remembering the first date of each block -
+        # so a timerange can be loaded without reading the whole file.
+        block_starts = [
+            dt_ts(d)
+            for d in to_datetime(data["date"].iloc[:: self._OHLCV_BLOCK_SIZE], unit="ms", utc=True)
+        ]
+        table = Table.from_pandas(data, preserve_index=False)
+        table = table.replace_schema_metadata(
+            {**(table.schema.metadata or {}), BLOCK_STARTS_KEY: json.dumps(block_starts)}
         )
+        feather.write_feather(
+            table,
+            filename,
+            compression_level=9,
+            compression="lz4",
+            chunksize=self._OHLCV_BLOCK_SIZE,
+        )
+        # All candles are in the main file now
+        rmtree(self._parts_dir(filename), ignore_errors=True)
+
+    def _read_ohlcv(self, filename: Path, timerange: TimeRange | None) -> DataFrame:
+        """
+        Read candles from file - only reading the record batches required for the timerange.
+        Files without block information are read completely.
+        Appended parts are always read completely.
+        """
+        data = self._read_ohlcv_main(filename, timerange)
+        parts = [read_feather(part) for part in self._part_files(filename)]
+        if not parts:
+            return data
+        return concat([data, *parts], ignore_index=True)
+
+    def _read_ohlcv_main(self, filename: Path, timerange: TimeRange | None) -> DataFrame:
+        if timerange is None:
+            return read_feather(filename)
+        from pyarrow import ArrowInvalid, Table, ipc, memory_map
+
+        try:
+            with memory_map(str(filename)) as source:
+                reader = ipc.open_file(source)
+                block_starts = (reader.schema.metadata or {}).get(BLOCK_STARTS_KEY)
+                if block_starts is None:
+                    return reader.read_pandas()
+                blocks = self._timerange_blocks(json.loads(block_starts), timerange)
+                table = Table.from_batches(
+                    [reader.get_batch(i) for i in blocks], schema=reader.schema
+                )
+                return table.to_pandas().reset_index(drop=True)
+        except ArrowInvalid:
+            # Not an arrow IPC file (feather v1)
+            return read_feather(filename)
 
     def _ohlcv_load(
         self, pair: str, timeframe: str, timerange: TimeRange | None, candle_type: CandleType
@@ -45,8 +118,7 @@ class FeatherDataHandler(IDataHandler):
         :param pair: Pair to load data
         :param timeframe: Timeframe (e.g. "5m")
         :param timerange: Limit data to be loaded to this timerange.
-                        Optionally implemented by subclasses to avoid loading
-                        all data where possible.
+                        Only the record batches covering the timerange are read.
         :param candle_type: Any of the enum CandleType (must match trading mode!)
         :return: DataFrame with ohlcv data, or empty DataFrame
         """
@@ -59,7 +131,7 @@ class FeatherDataHandler(IDataHandler):
             if not filename.exists():
                 return DataFrame(columns=self._columns)
         try:
-            pairdata = read_feather(filename)
+            pairdata = self._read_ohlcv(filename, timerange)
             pairdata.columns = self._columns
             pairdata = pairdata.astype(
                 dtype={
@@ -82,13 +154,92 @@ class FeatherDataHandler(IDataHandler):
         self, pair: str, timeframe: str, data: DataFrame, candle_type: CandleType
     ) -> None:
         """
-        Append data to existing data structures
+        Append data to existing data structures.
+        New candles are written to a separate part file - existing data is not rewritten
+        until the number of parts exceeds `_OHLCV_MAX_PARTS`.
         :param pair: Pair
         :param timeframe: Timeframe this ohlcv data is for
-        :param data: Data to append.
+        :param data: Data to append. All candles must be newer than the last stored candle.
         :param candle_type: Any of the enum CandleType (must match trading mode!)
         """
-        raise NotImplementedError()
+        filename = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
+        if not filename.exists():
+            self.ohlcv_store(pair, timeframe, data, candle_type)
+            return
+        if data.empty:
+            return
+        parts = self._part_files(filename)
+        if len(parts) >= self._OHLCV_MAX_PARTS:
+            # Compact - merging all parts into the main file
+            existing = self._ohlcv_load(pair, timeframe, None, candle_type)
+            self.ohlcv_store(
+                pair, timeframe, concat([existing, data], ignore_index=True), candle_type
+            )
+            return
+        part = self._parts_dir(filename) / f"{int(parts[-1].stem) + 1 if parts else 0:06d}.feather"
+        part.parent.mkdir(exist_ok=True)
+        data.reset_index(drop=True).loc[:, self._columns].to_feather(
+            part, compression_level=9, compression="lz4"
+        )
+
+    def ohlcv_purge(self, pair: str, timeframe: str, candle_type: CandleType) -> bool:
+        """
+        Remove data for this pair - including appended parts.
+        :param pair: Delete data for this pair.
+        :param timeframe: Timeframe (e.g. "5m")
+        :param candle_type: Any of the enum CandleType (must match trading mode!)
+        :return: True when deleted, false if file did not exist.
+        """
+        filename = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
+        rmtree(self._parts_dir(filename), ignore_errors=True)
+        return super().ohlcv_purge(pair, timeframe, candle_type)
+
+    def rename_futures_data(
+        self, pair: str, new_pair: str, timeframe: str, candle_type: CandleType
+    ):
+        file_old = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
+        file_new = self._pair_data_filename(self._datadir, new_pair, timeframe, candle_type)
+        super().rename_futures_data(pair, new_pair, timeframe, candle_type)
+        if self._parts_dir(file_old).is_dir() and file_new.exists() and not file_old.exists():
+            self._parts_dir(file_old).rename(self._parts_dir(file_new))
+
+    def ohlcv_data_min_max(
+        self, pair: str, timeframe: str, candle_type: CandleType
+    ) -> tuple[datetime, datetime, int]:
+        """
+        Returns the min and max timestamp for the given pair and timeframe.
+        Only reads the first and last record batch, and appended parts.
+        :param pair: Pair to get min/max for
+        :param timeframe: Timeframe to get min/max for
+        :param candle_type: Any of the enum CandleType (must match trading mode!)
+        :return: (min, max, len)
+        """
+        filename = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
+        if not filename.exists():
+            return super().ohlcv_data_min_max(pair, timeframe, candle_type)
+        from pyarrow import ArrowInvalid, ipc, memory_map
+
+        try:
+            with memory_map(str(filename)) as source:
+                reader = ipc.open_file(source)
+                block_starts = (reader.schema.metadata or {}).get(BLOCK_STARTS_KEY)
+                batches = reader.num_record_batches
+                if block_starts is None or batches == 0 or len(json.loads(block_starts)) != batches:
+                    return super().ohlcv_data_min_max(pair, timeframe, candle_type)
+                first = reader.get_batch(0).slice(0, 1).to_pandas()
+                last_batch = reader.get_batch(batches - 1)
+                last = last_batch.slice(last_batch.num_rows - 1).to_pandas()
+                # All batches but the last one have the same length
+                length = (batches - 1) * reader.get_batch(0).num_rows + last_batch.num_rows
+        except ArrowInvalid:
+            return super().ohlcv_data_min_max(pair, timeframe, candle_type)
+        for part in self._part_files(filename):
+            part_data = read_feather(part, columns=["date"])
+            if not part_data.empty:
+                last = part_data.iloc[-1:]
+                length += len(part_data)
+        dates = to_datetime(concat([first["date"], last["date"]]), unit="ms", utc=True)
+        return dates.iloc[0].to_pydatetime(), dates.iloc[-1].to_pydatetime(), length
 
     def _trades_store(self, pair: str, data: DataFrame, trading_mode: TradingMode) -> None:
         """
@@ -98,9 +249,25 @@ class FeatherDataHandler(IDataHandler):
                      column sequence as in DEFAULT_TRADES_COLUMNS
         :param trading_mode: Trading mode to use (used to determine the filename)
         """
+        from pyarrow import Table, feather
+
         filename = self._pair_trades_filename(self._datadir, pair, trading_mode)
         self.create_dir_if_needed(filename)
-        data.reset_index(drop=True).to_feather(filename, compression_level=9, compression="lz4")
+        data = data.reset_index(drop=True)
+        # Write trades in blocks, remembering the first timestamp of each block -
+        # so trades can be loaded block by block, and blocks outside a timerange skipped.
+        block_starts = [int(ts) for ts in data["timestamp"].iloc[:: self._TRADES_BLOCK_SIZE]]
+        table = Table.from_pandas(data, preserve_index=False)
+        table = table.replace_schema_metadata(
+            {**(table.schema.metadata or {}), BLOCK_STARTS_KEY: json.dumps(block_starts)}
+        )
+        feather.write_feather(
+            table,
+            filename,
+            compression_level=9,
+            compression="lz4",
+            chunksize=self._TRADES_BLOCK_SIZE,
+        )
 
     def trades_append(self, pair: str, data: DataFrame):
         """
@@ -130,6 +297,37 @@ class FeatherDataHandler(IDataHandler):
 
         return tradesdata
 
+    def _trades_load_chunks(
+        self, pair: str, trading_mode: TradingMode, timerange: TimeRange | None
+    ) -> Iterator[DataFrame]:
+        """
+        Load trades from file one record batch at a time.
+        Batches outside of the timerange are skipped for files storing the start of every batch.
+        :param pair: Load trades for this pair
+        :param trading_mode: Trading mode to use (used to determine the filename)
+        :param timerange: Limit trades to be loaded to this timerange.
+        :return: Iterator of Dataframes containing trades
+        """
+        filename = self._pair_trades_filename(self._datadir, pair, trading_mode)
+        if not filename.exists():
+            return
+        from pyarrow import ArrowInvalid, ipc, memory_map
+
+        with memory_map(str(filename)) as source:
+            try:
+                reader = ipc.open_file(source)
+            except ArrowInvalid:
+                # Not an arrow IPC file (feather v1)
+                yield read_feather(filename)
+                return
+            block_starts = (reader.schema.metadata or {}).get(BLOCK_STARTS_KEY)
+            if block_starts is None:
+                blocks = range(reader.num_record_batches)
+            else:
+                blocks = self._timerange_blocks(json.loads(block_starts), timerange)
+            for i in blocks:
+                yield reader.get_batch(i).to_pandas()
+
     @classmethod
     def _get_file_extension(cls):
         return "feather"
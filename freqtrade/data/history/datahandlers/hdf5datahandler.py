@@ -15,6 +15,7 @@ logger = logging.getLogger(__name__)
 
 class HDF5DataHandler(IDataHandler):
     _columns = DEFAULT_DATAFRAME_COLUMNS
+    _OHLCV_APPEND_SUPPORTED = True
 
     def ohlcv_store(
         self, pair: str, timeframe: str, data: pd.DataFrame, candle_type: CandleType
@@ -103,13 +104,28 @@ class HDF5DataHandler(IDataHandler):
         self, pair: str, timeframe: str, data: pd.DataFrame, candle_type: CandleType
     ) -> None:
         """
-        Append data to existing data structures
+        Append data to existing data structures - rows are added to the existing table.
         :param pair: Pair
         :param timeframe: Timeframe this ohlcv data is for
-        :param data: Data to append.
+        :param data: Data to append. All candles must be newer than the last stored candle.
         :param candle_type: Any of the enum CandleType (must match trading mode!)
         """
-        raise NotImplementedError()
+        filename = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
+        if not filename.exists():
+            self.ohlcv_store(pair, timeframe, data, candle_type)
+            return
+        if data.empty:
+            return
+        data.loc[:, self._columns].to_hdf(
+            filename,
+            key=self._pair_ohlcv_key(pair, timeframe),
+            mode="a",
+            append=True,
+            complevel=9,
+            complib="blosc",
+            format="table",
+            data_columns=["date"],
+        )
 
     def _trades_store(self, pair: str, data: pd.DataFrame, trading_mode: TradingMode) -> None:
         """
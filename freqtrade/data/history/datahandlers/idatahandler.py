@@ -7,11 +7,13 @@ It's subclasses handle and storing data from disk.
 import logging
 import re
 from abc import ABC, abstractmethod
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterator
 from copy import deepcopy
 from datetime import datetime, timezone
 from pathlib import Path
 
-from pandas import DataFrame, to_datetime
+from pandas import DataFrame, concat, to_datetime
 
 from freqtrade import misc
 from freqtrade.configuration import TimeRange
@@ -32,6 +34,13 @@ logger = logging.getLogger(__name__)
 class IDataHandler(ABC):
     _OHLCV_REGEX = r"^([a-zA-Z_\d-]+)\-(\d+[a-zA-Z]{1,2})\-?([a-zA-Z_]*)?(?=\.)"
     _TRADES_REGEX = r"^([a-zA-Z_\d-]+)\-(trades)?(?=\.)"
+    # Candles per block (row group / record batch) for columnar formats - blocks allow
+    # loading a timerange without reading the whole file.
+    _OHLCV_BLOCK_SIZE = 20_000
+    # Trades per block for columnar formats - trades are loaded in chunks of (at most) one block.
+    _TRADES_BLOCK_SIZE = 500_000
+    # Handler implements ohlcv_append() - without rewriting existing data
+    _OHLCV_APPEND_SUPPORTED = False
 
     def __init__(self, datadir: Path) -> None:
         self._datadir = datadir
@@ -43,6 +52,13 @@ class IDataHandler(ABC):
         """
         raise NotImplementedError()
 
+    @classmethod
+    def ohlcv_append_supported(cls) -> bool:
+        """
+        Handler can append candles to stored data (`ohlcv_append()`) - without rewriting it
+        """
+        return cls._OHLCV_APPEND_SUPPORTED
+
     @classmethod
     def ohlcv_get_available_data(
         cls, datadir: Path, trading_mode: TradingMode
@@ -140,6 +156,27 @@ class IDataHandler(ABC):
         :return: DataFrame with ohlcv data, or empty DataFrame
         """
 
+    @staticmethod
+    def _timerange_blocks(block_starts: list[int], timerange: TimeRange | None) -> range:
+        """
+        Blocks of a file (sorted by date) required to load the given timerange.
+        The blocks containing the last candle before and the first candle after the timerange
+        are included, so trimming and validation behave as if the whole file had been loaded.
+        :param block_starts: Date (epoch ms) of the first candle of every block
+        :param timerange: Timerange to load
+        :return: Range of block indexes
+        """
+        if not block_starts:
+            return range(0)
+        first = 0
+        last = len(block_starts) - 1
+        if timerange:
+            if timerange.starttype == "date":
+                first = max(bisect_left(block_starts, timerange.startts * 1000) - 1, 0)
+            if timerange.stoptype == "date":
+                last = min(bisect_right(block_starts, timerange.stopts * 1000), last)
+        return range(first, max(first, last) + 1)
+
     def ohlcv_purge(self, pair: str, timeframe: str, candle_type: CandleType) -> bool:
         """
         Remove data for this pair
@@ -159,7 +196,9 @@ class IDataHandler(ABC):
         self, pair: str, timeframe: str, data: DataFrame, candle_type: CandleType
     ) -> None:
         """
-        Append data to existing data structures
+        Append data to existing data structures.
+        Only implemented by handlers supporting it (see `ohlcv_append_supported()`).
+        All candles must be newer than the last stored candle.
         :param pair: Pair
         :param timeframe: Timeframe this ohlcv data is for
         :param data: Data to append.
@@ -256,6 +295,45 @@ class IDataHandler(ABC):
         :return: Dataframe containing trades
         """
 
+    def _trades_load_chunks(
+        self, pair: str, trading_mode: TradingMode, timerange: TimeRange | None
+    ) -> Iterator[DataFrame]:
+        """
+        Load trades for a pair from file in time-ordered chunks.
+        Handlers storing trades in blocks should only read the blocks covering the timerange,
+        one at a time. By default, all trades are loaded as one chunk.
+        Duplicate removal and timerange trimming happens outside of this method.
+        :param pair: Load trades for this pair
+        :param trading_mode: Trading mode to use (used to determine the filename)
+        :param timerange: Limit trades to be loaded to this timerange.
+        :return: Iterator of Dataframes containing trades
+        """
+        yield self._trades_load(pair, trading_mode, timerange=timerange)
+
+    def _trades_chunks(
+        self, pair: str, trading_mode: TradingMode, timerange: TimeRange | None
+    ) -> Iterator[DataFrame]:
+        """
+        Chunks of trades trimmed to the timerange, with duplicates removed.
+        Trades are sorted by timestamp - so only trades with the last timestamp of a chunk
+        can be duplicated in the next chunk.
+        """
+        boundary: DataFrame | None = None
+        for chunk in self._trades_load_chunks(pair, trading_mode, timerange):
+            if timerange:
+                if timerange.starttype == "date":
+                    chunk = chunk.loc[chunk["timestamp"] >= timerange.startts * 1000]
+                if timerange.stoptype == "date":
+                    chunk = chunk.loc[chunk["timestamp"] < timerange.stopts * 1000]
+            if boundary is not None:
+                chunk = trades_df_remove_duplicates(concat([boundary, chunk]))[len(boundary) :]
+            else:
+                chunk = trades_df_remove_duplicates(chunk)
+            if chunk.empty:
+                continue
+            boundary = chunk.loc[chunk["timestamp"] == chunk["timestamp"].iat[-1]]
+            yield chunk.reset_index(drop=True)
+
     def trades_store(self, pair: str, data: DataFrame, trading_mode: TradingMode) -> None:
         """
         Store trades data (list of Dicts) to file
@@ -288,20 +366,46 @@ class IDataHandler(ABC):
         Removes duplicates in the process.
         :param pair: Load trades for this pair
         :param trading_mode: Trading mode to use (used to determine the filename)
-        :param timerange: Timerange to load trades for - currently not implemented
+        :param timerange: Only load trades within this timerange.
+                          Only the blocks covering the timerange are read where supported.
         :return: List of trades
         """
         try:
-            trades = self._trades_load(pair, trading_mode, timerange=timerange)
+            if timerange is None:
+                trades = trades_df_remove_duplicates(self._trades_load(pair, trading_mode))
+            else:
+                chunks = list(self._trades_chunks(pair, trading_mode, timerange))
+                trades = (
+                    concat(chunks, ignore_index=True)
+                    if chunks
+                    else DataFrame(columns=DEFAULT_TRADES_COLUMNS)
+                )
         except Exception:
             logger.exception(f"Error loading trades for {pair}")
             return DataFrame(columns=DEFAULT_TRADES_COLUMNS)
 
-        trades = trades_df_remove_duplicates(trades)
-
         trades = trades_convert_types(trades)
         return trades
 
+    def trades_load_chunks(
+        self, pair: str, trading_mode: TradingMode, timerange: TimeRange | None = None
+    ) -> Iterator[DataFrame]:
+        """
+        Load trades for a pair in time-ordered chunks - to process large trade histories
+        without loading all trades into memory.
+        Removes duplicates and converts types as trades_load() does.
+        Loading stops at the first chunk which can't be read.
+        :param pair: Load trades for this pair
+        :param trading_mode: Trading mode to use (used to determine the filename)
+        :param timerange: Only load trades within this timerange.
+        :return: Iterator of trades dataframes
+        """
+        try:
+            for chunk in self._trades_chunks(pair, trading_mode, timerange):
+                yield trades_convert_types(chunk)
+        except Exception:
+            logger.exception(f"Error loading trades for {pair}")
+
     @classmethod
     def create_dir_if_needed(cls, datadir: Path):
         """
@@ -567,6 +671,10 @@ def get_datahandlerclass(datatype: str) -> type[IDataHandler]:
         from .parquetdatahandler import ParquetDataHandler
 
         return ParquetDataHandler
+    elif datatype == "memmap":
+        from .memmapdatahandler import MemmapDataHandler
+
+        return MemmapDataHandler
     else:
         raise ValueError(f"No datahandler for datatype {datatype} available.")
 
@@ -0,0 +1,203 @@
+import logging
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+from pandas import DataFrame, to_datetime
+
+from freqtrade.configuration import TimeRange
+from freqtrade.constants import DEFAULT_DATAFRAME_COLUMNS
+from freqtrade.enums import CandleType, TradingMode
+
+from .featherdatahandler import FeatherDataHandler
+
+
+logger = logging.getLogger(__name__)
+
+# File layout: magic (8 bytes), number of candles (int64),
+# followed by one column after the other - date (int64, epoch ms), open, high, low, close,
+# volume (float64). All values are little endian.
+MAGIC = b"FTOHLCV1"
+HEADER_SIZE = 16
+
+
+class MemmapDataHandler(FeatherDataHandler):
+    """
+    Stores candles as uncompressed, fixed-width columns, which are memory-mapped on load.
+    Only the candles within the requested timerange are read from disk.
+    Trades data is stored in the feather format.
+    """
+
+    _columns = DEFAULT_DATAFRAME_COLUMNS
+    _OHLCV_APPEND_SUPPORTED = False
+
+    def ohlcv_store(
+        self, pair: str, timeframe: str, data: DataFrame, candle_type: CandleType
+    ) -> None:
+        """
+        Store data as fixed-width columns.
+        :param pair: Pair - used to generate filename
+        :param timeframe: Timeframe - used to generate filename
+        :param data: Dataframe containing OHLCV data
+        :param candle_type: Any of the enum CandleType (must match trading mode!)
+        :return: None
+        """
+        filename = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
+        self.create_dir_if_needed(filename)
+
+        dates = (
+            to_datetime(data["date"], utc=True)
+            .dt.tz_localize(None)
+            .to_numpy(dtype="datetime64[ms]")
+            .view("<i8")
+        )
+        columns = np.empty((len(self._columns), len(data)), dtype="<f8")
+        columns[0] = dates.view("<f8")
+        columns[1:] = data[self._columns[1:]].to_numpy(dtype="<f8").T
+
+        # Write to a temporary file first - so concurrent readers never see a partial file.
+        tmp_file = filename.with_name(f"{filename.name}.tmp")
+        with tmp_file.open("wb") as f:
+            f.write(MAGIC)
+            f.write(np.array([len(data)], dtype="<i8").tobytes())
+            f.write(columns.tobytes())
+        tmp_file.replace(filename)
+
+    @classmethod
+    def _map_file(cls, filename: Path) -> np.ndarray:
+        """
+        Memory-map all columns of a file.
+        :return: Array of shape (columns, candles) - the date column has to be viewed as int64.
+        """
+        with filename.open("rb") as f:
+            header = f.read(HEADER_SIZE)
+        if len(header) != HEADER_SIZE or header[:8] != MAGIC:
+            raise ValueError("Invalid file header.")
+        rows = int(np.frombuffer(header[8:], dtype="<i8")[0])
+        if filename.stat().st_size != HEADER_SIZE + rows * len(cls._columns) * 8:
+            raise ValueError("File size doesn't match the number of candles.")
+        if rows == 0:
+            return np.empty((len(cls._columns), 0), dtype="<f8")
+        return np.memmap(
+            filename, dtype="<f8", mode="r", offset=HEADER_SIZE, shape=(len(cls._columns), rows)
+        )
+
+    def _ohlcv_file(self, pair: str, timeframe: str, candle_type: CandleType) -> Path | None:
+        filename = self._pair_data_filename(self._datadir, pair, timeframe, candle_type=candle_type)
+        if not filename.exists():
+            # Fallback mode for 1M files
+            filename = self._pair_data_filename(
+                self._datadir, pair, timeframe, candle_type=candle_type, no_timeframe_modify=True
+            )
+            if not filename.exists():
+                return None
+        return filename
+
+    @staticmethod
+    def _timerange_slice(dates: np.ndarray, timerange: TimeRange | None) -> slice:
+        """
+        Rows required for the timerange, found by binary search.
+        One candle before and after the timerange is included, so trimming and the
+        validation of the loaded data behave as if the whole file had been loaded.
+        """
+        start = 0
+        stop = len(dates)
+        if timerange:
+            if timerange.starttype == "date":
+                start = max(int(np.searchsorted(dates, timerange.startts * 1000)) - 1, 0)
+            if timerange.stoptype == "date":
+                stop = int(np.searchsorted(dates, timerange.stopts * 1000, side="right")) + 1
+        return slice(start, max(start, stop))
+
+    def _ohlcv_load(
+        self, pair: str, timeframe: str, timerange: TimeRange | None, candle_type: CandleType
+    ) -> DataFrame:
+        """
+        Internal method used to load data for one pair from disk.
+        Implements the loading and conversion to a Pandas dataframe.
+        Timerange trimming and dataframe validation happens outside of this method.
+        :param pair: Pair to load data
+        :param timeframe: Timeframe (e.g. "5m")
+        :param timerange: Limit data to be loaded to this timerange.
+                        Only candles within the timerange are read from disk.
+        :param candle_type: Any of the enum CandleType (must match trading mode!)
+        :return: DataFrame with ohlcv data, or empty DataFrame
+        """
+        filename = self._ohlcv_file(pair, timeframe, candle_type)
+        if filename is None:
+            return DataFrame(columns=self._columns)
+        try:
+            columns = self._map_file(filename)
+            dates = columns[0].view("<i8")
+            rows = self._timerange_slice(dates, timerange)
+            pairdata = DataFrame(
+                {
+                    "date": to_datetime(dates[rows], unit="ms", utc=True),
+                    **{
+                        col: np.array(columns[idx, rows])
+                        for idx, col in enumerate(self._columns[1:], start=1)
+                    },
+                }
+            )
+            return pairdata
+        except Exception as e:
+            logger.exception(
+                f"Error loading data from {filename}. Exception: {e}. Returning empty dataframe."
+            )
+            return DataFrame(columns=self._columns)
+
+    def ohlcv_append(
+        self, pair: str, timeframe: str, data: DataFrame, candle_type: CandleType
+    ) -> None:
+        """
+        Append data to existing data structures
+        :param pair: Pair
+        :param timeframe: Timeframe this ohlcv data is for
+        :param data: Data to append.
+        :param candle_type: Any of the enum CandleType (must match trading mode!)
+        """
+        raise NotImplementedError()
+
+    def ohlcv_data_min_max(
+        self, pair: str, timeframe: str, candle_type: CandleType
+    ) -> tuple[datetime, datetime, int]:
+        """
+        Returns the min and max timestamp for the given pair and timeframe.
+        Only reads the first and last date from disk.
+        :param pair: Pair to get min/max for
+        :param timeframe: Timeframe to get min/max for
+        :param candle_type: Any of the enum CandleType (must match trading mode!)
+        :return: (min, max, len)
+        """
+        filename = self._ohlcv_file(pair, timeframe, candle_type)
+        try:
+            dates = self._map_file(filename)[0].view("<i8") if filename else np.empty(0)
+        except ValueError:
+            dates = np.empty(0)
+        if len(dates) == 0:
+            return (
+                datetime.fromtimestamp(0, tz=timezone.utc),
+                datetime.fromtimestamp(0, tz=timezone.utc),
+                0,
+            )
+        return (
+            datetime.fromtimestamp(int(dates[0]) / 1000, tz=timezone.utc),
+            datetime.fromtimestamp(int(dates[-1]) / 1000, tz=timezone.utc),
+            len(dates),
+        )
+
+    @classmethod
+    def trades_get_available_data(cls, datadir: Path, trading_mode: TradingMode) -> list[str]:
+        return FeatherDataHandler.trades_get_available_data(datadir, trading_mode)
+
+    @classmethod
+    def trades_get_pairs(cls, datadir: Path) -> list[str]:
+        return FeatherDataHandler.trades_get_pairs(datadir)
+
+    @classmethod
+    def _pair_trades_filename(cls, datadir: Path, pair: str, trading_mode: TradingMode) -> Path:
+        return FeatherDataHandler._pair_trades_filename(datadir, pair, trading_mode)
+
+    @classmethod
+    def _get_file_extension(cls):
+        return "memmap"
@@ -1,6 +1,8 @@
 import logging
+from collections.abc import Iterator
+from pathlib import Path
 
-from pandas import DataFrame, read_parquet, to_datetime
+from pandas import DataFrame, Timestamp, read_parquet, to_datetime
 
 from freqtrade.configuration import TimeRange
 from freqtrade.constants import DEFAULT_DATAFRAME_COLUMNS, DEFAULT_TRADES_COLUMNS
@@ -31,7 +33,36 @@ class ParquetDataHandler(IDataHandler):
         filename = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
         self.create_dir_if_needed(filename)
 
-        data.reset_index(drop=True).loc[:, self._columns].to_parquet(filename)
+        # Date-ordered row groups of fixed size - so a timerange can be loaded
+        # without reading the whole file.
+        data.reset_index(drop=True).loc[:, self._columns].to_parquet(
+            filename, row_group_size=self._OHLCV_BLOCK_SIZE
+        )
+
+    def _read_ohlcv(self, filename: Path, timerange: TimeRange | None) -> DataFrame:
+        """
+        Read candles from file - only reading the row groups required for the timerange,
+        based on the statistics of the date column.
+        Files without statistics are read completely.
+        """
+        if timerange is None:
+            return read_parquet(filename)
+        from pyarrow.parquet import ParquetFile
+
+        with ParquetFile(filename) as file:
+            metadata = file.metadata
+            date_idx = file.schema_arrow.get_field_index("date")
+            block_starts = []
+            for i in range(metadata.num_row_groups):
+                stats = metadata.row_group(i).column(date_idx).statistics if date_idx >= 0 else None
+                if stats is None or not stats.has_min_max:
+                    return file.read().to_pandas()
+                # Dates may have been stored as epoch ms
+                block_starts.append(
+                    stats.min if isinstance(stats.min, int) else Timestamp(stats.min).value // 10**6
+                )
+            blocks = self._timerange_blocks(block_starts, timerange)
+            return file.read_row_groups(list(blocks)).to_pandas().reset_index(drop=True)
 
     def _ohlcv_load(
         self, pair: str, timeframe: str, timerange: TimeRange | None, candle_type: CandleType
@@ -43,8 +74,7 @@ class ParquetDataHandler(IDataHandler):
         :param pair: Pair to load data
         :param timeframe: Timeframe (e.g. "5m")
         :param timerange: Limit data to be loaded to this timerange.
-                        Optionally implemented by subclasses to avoid loading
-                        all data where possible.
+                        Only the row groups covering the timerange are read.
         :param candle_type: Any of the enum CandleType (must match trading mode!)
         :return: DataFrame with ohlcv data, or empty DataFrame
         """
@@ -57,7 +87,7 @@ class ParquetDataHandler(IDataHandler):
             if not filename.exists():
                 return DataFrame(columns=self._columns)
         try:
-            pairdata = read_parquet(filename)
+            pairdata = self._read_ohlcv(filename, timerange)
             pairdata.columns = self._columns
             pairdata = pairdata.astype(
                 dtype={
@@ -98,7 +128,8 @@ class ParquetDataHandler(IDataHandler):
         """
         filename = self._pair_trades_filename(self._datadir, pair, trading_mode)
         self.create_dir_if_needed(filename)
-        data.reset_index(drop=True).to_parquet(filename)
+        # Time-ordered row groups - so trades can be loaded one row group at a time.
+        data.reset_index(drop=True).to_parquet(filename, row_group_size=self._TRADES_BLOCK_SIZE)
 
     def trades_append(self, pair: str, data: DataFrame):
         """
@@ -128,6 +159,37 @@ class ParquetDataHandler(IDataHandler):
 
         return tradesdata
 
+    def _trades_load_chunks(
+        self, pair: str, trading_mode: TradingMode, timerange: TimeRange | None
+    ) -> Iterator[DataFrame]:
+        """
+        Load trades from file one row group at a time.
+        Row groups outside of the timerange are skipped, based on the statistics
+        of the timestamp column.
+        :param pair: Load trades for this pair
+        :param trading_mode: Trading mode to use (used to determine the filename)
+        :param timerange: Limit trades to be loaded to this timerange.
+        :return: Iterator of Dataframes containing trades
+        """
+        filename = self._pair_trades_filename(self._datadir, pair, trading_mode)
+        if not filename.exists():
+            return
+        from pyarrow.parquet import ParquetFile
+
+        start = timerange.startts * 1000 if timerange and timerange.starttype == "date" else None
+        stop = timerange.stopts * 1000 if timerange and timerange.stoptype == "date" else None
+        with ParquetFile(filename) as file:
+            metadata = file.metadata
+            ts_idx = file.schema_arrow.get_field_index("timestamp")
+            for i in range(metadata.num_row_groups):
+                stats = metadata.row_group(i).column(ts_idx).statistics if ts_idx >= 0 else None
+                if stats is not None and stats.has_min_max:
+                    if (start is not None and stats.max < start) or (
+                        stop is not None and stats.min >= stop
+                    ):
+                        continue
+                yield file.read_row_group(i).to_pandas()
+
     @classmethod
     def _get_file_extension(cls):
         return "parquet"
@@ -1,5 +1,6 @@
 import logging
 import operator
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from pathlib import Path
 
@@ -166,6 +167,7 @@ def _load_cached_data_for_updating(
     data_handler: IDataHandler,
     candle_type: CandleType,
     prepend: bool = False,
+    tail_only: bool = False,
 ) -> tuple[DataFrame, int | None, int | None]:
     """
     Load cached data to download more data.
@@ -174,6 +176,8 @@ def _load_cached_data_for_updating(
     If that's the case then what's available should be completely overwritten.
     Otherwise downloads always start at the end of the available data to avoid data gaps.
     Note: Only used by download_pair_history().
+    :param tail_only: Only load the last candle of the stored data - sufficient when new
+                      candles are appended (not allowed in combination with prepend).
     """
     start = None
     end = None
@@ -183,28 +187,40 @@ def _load_cached_data_for_updating(
         if timerange.stoptype == "date":
             end = timerange.stopdt
 
-    # Intentionally don't pass timerange in - since we need to load the full dataset.
+    load_timerange = None
+    first_date = None
+    if tail_only:
+        first_date, last_date, length = data_handler.ohlcv_data_min_max(
+            pair, timeframe, candle_type
+        )
+        if length:
+            load_timerange = TimeRange("date", None, int(last_date.timestamp()), 0)
+    # Intentionally don't pass timerange in (unless tail_only) - to load the full dataset.
     data = data_handler.ohlcv_load(
         pair,
         timeframe=timeframe,
-        timerange=None,
+        timerange=load_timerange,
         fill_missing=False,
-        drop_incomplete=True,
+        # Stored candles are complete - only drop the last candle when rewriting all data,
+        # to be safe against data stored by older versions.
+        drop_incomplete=not tail_only,
         warn_no_data=False,
         candle_type=candle_type,
     )
     if not data.empty:
+        if first_date is None:
+            first_date = data.iloc[0]["date"]
         if prepend:
             end = data.iloc[0]["date"]
         else:
-            if start and start < data.iloc[0]["date"]:
+            if start and start < first_date:
                 # Earlier data than existing data requested, Update start date
                 logger.info(
                     f"{pair}, {timeframe}, {candle_type}: "
                     f"Requested start date {start:{DATETIME_PRINT_FORMAT}} earlier than local "
-                    f"data start date {data.iloc[0]['date']:{DATETIME_PRINT_FORMAT}}. "
+                    f"data start date {first_date:{DATETIME_PRINT_FORMAT}}. "
                     f"Use `--prepend` to download data prior "
-                    f"to {data.iloc[0]['date']:{DATETIME_PRINT_FORMAT}}, or "
+                    f"to {first_date:{DATETIME_PRINT_FORMAT}}, or "
                     "`--erase` to redownload all data."
                 )
             start = data.iloc[-1]["date"]
@@ -247,6 +263,9 @@ def _download_pair_history(
             if data_handler.ohlcv_purge(pair, timeframe, candle_type=candle_type):
                 logger.info(f"Deleting existing data for pair {pair}, {timeframe}, {candle_type}.")
 
+        # New candles are appended to the stored data where possible - without loading or
+        # rewriting all stored candles.
+        append = data_handler.ohlcv_append_supported() and not prepend
         data, since_ms, until_ms = _load_cached_data_for_updating(
             pair,
             timeframe,
@@ -254,6 +273,7 @@ def _download_pair_history(
             data_handler=data_handler,
             candle_type=candle_type,
             prepend=prepend,
+            tail_only=append,
         )
 
         logger.info(
@@ -286,6 +306,15 @@ def _download_pair_history(
             until_ms=until_ms if until_ms else None,
         )
         logger.info(f"Downloaded data for {pair} with length {len(new_dataframe)}.")
+        if append and not data.empty:
+            stored_end = data.iloc[-1]["date"]
+            new_dataframe = clean_ohlcv_dataframe(
+                new_dataframe, timeframe, pair, fill_missing=False, drop_incomplete=False
+            )
+            new_dataframe = new_dataframe.loc[new_dataframe["date"] > stored_end]
+            logger.debug(f"Appending {len(new_dataframe)} candles after {stored_end}.")
+            data_handler.ohlcv_append(pair, timeframe, data=new_dataframe, candle_type=candle_type)
+            return True
         if data.empty:
             data = new_dataframe
         else:
@@ -341,65 +370,62 @@ def refresh_backtest_ohlcv_data(
     pairs_not_available = []
     data_handler = get_datahandler(datadir, data_format)
     candle_type = CandleType.get_default(trading_mode)
-    with progress_tracker as progress:
-        tf_length = len(timeframes) if trading_mode != "futures" else len(timeframes) + 2
-        timeframe_task = progress.add_task("Timeframe", total=tf_length)
-        pair_task = progress.add_task("Downloading data...", total=len(pairs))
-
-        for pair in pairs:
-            progress.update(pair_task, description=f"Downloading {pair}")
-            progress.update(timeframe_task, completed=0)
-
-            if pair not in exchange.markets:
-                pairs_not_available.append(f"{pair}: Pair not available on exchange.")
-                logger.info(f"Skipping pair {pair}...")
-                continue
-            for timeframe in timeframes:
-                progress.update(timeframe_task, description=f"Timeframe {timeframe}")
-                logger.debug(f"Downloading pair {pair}, {candle_type}, interval {timeframe}.")
-                _download_pair_history(
-                    pair=pair,
-                    datadir=datadir,
-                    exchange=exchange,
-                    timerange=timerange,
-                    data_handler=data_handler,
-                    timeframe=str(timeframe),
-                    new_pairs_days=new_pairs_days,
-                    candle_type=candle_type,
-                    erase=erase,
-                    prepend=prepend,
-                )
-                progress.update(timeframe_task, advance=1)
-            if trading_mode == "futures":
-                # Predefined candletype (and timeframe) depending on exchange
-                # Downloads what is necessary to backtest based on futures data.
-                tf_mark = exchange.get_option("mark_ohlcv_timeframe")
-                tf_funding_rate = exchange.get_option("funding_fee_timeframe")
-
-                fr_candle_type = CandleType.from_string(exchange.get_option("mark_ohlcv_price"))
-                # All exchanges need FundingRate for futures trading.
-                # The timeframe is aligned to the mark-price timeframe.
-                combs = ((CandleType.FUNDING_RATE, tf_funding_rate), (fr_candle_type, tf_mark))
-                for candle_type_f, tf in combs:
-                    logger.debug(f"Downloading pair {pair}, {candle_type_f}, interval {tf}.")
-                    _download_pair_history(
-                        pair=pair,
-                        datadir=datadir,
-                        exchange=exchange,
-                        timerange=timerange,
-                        data_handler=data_handler,
-                        timeframe=str(tf),
-                        new_pairs_days=new_pairs_days,
-                        candle_type=candle_type_f,
-                        erase=erase,
-                        prepend=prepend,
-                    )
-                    progress.update(
-                        timeframe_task, advance=1, description=f"Timeframe {candle_type_f}, {tf}"
-                    )
+    jobs: list[tuple[str, str, CandleType]] = []
+    for pair in pairs:
+        if pair not in exchange.markets:
+            pairs_not_available.append(f"{pair}: Pair not available on exchange.")
+            logger.info(f"Skipping pair {pair}...")
+            continue
+        jobs.extend((pair, str(timeframe), candle_type) for timeframe in timeframes)
+        if trading_mode == "futures":
+            # Predefined candletype (and timeframe) depending on exchange
+            # Downloads what is necessary to backtest based on futures data.
+            tf_mark = exchange.get_option("mark_ohlcv_timeframe")
+            tf_funding_rate = exchange.get_option("funding_fee_timeframe")
+
+            fr_candle_type = CandleType.from_string(exchange.get_option("mark_ohlcv_price"))
+            # All exchanges need FundingRate for futures trading.
+            # The timeframe is aligned to the mark-price timeframe.
+            jobs.append((pair, str(tf_funding_rate), CandleType.FUNDING_RATE))
+            jobs.append((pair, str(tf_mark), fr_candle_type))
+
+    def download(pair: str, timeframe: str, candle_type_job: CandleType) -> None:
+        logger.debug(f"Downloading pair {pair}, {candle_type_job}, interval {timeframe}.")
+        _download_pair_history(
+            pair=pair,
+            datadir=datadir,
+            exchange=exchange,
+            timerange=timerange,
+            data_handler=data_handler,
+            timeframe=timeframe,
+            new_pairs_days=new_pairs_days,
+            candle_type=candle_type_job,
+            erase=erase,
+            prepend=prepend,
+        )
 
-            progress.update(pair_task, advance=1)
-            progress.update(timeframe_task, description="Timeframe")
+    with progress_tracker as progress:
+        task = progress.add_task("Downloading data...", total=len(jobs))
+        # Pairs / timeframes are downloaded (and stored) concurrently, sharing the
+        # exchange's rate limit.
+        with (
+            exchange.run_loop_in_background(),
+            ThreadPoolExecutor(
+                max_workers=max(1, min(exchange.parallel_downloads, len(jobs))),
+                thread_name_prefix="ft_download",
+            ) as executor,
+        ):
+            futures = {executor.submit(download, *job): job for job in jobs}
+            try:
+                for future in as_completed(futures):
+                    future.result()
+                    pair, timeframe, candle_type_job = futures[future]
+                    progress.update(task, advance=1, description=f"Downloaded {pair}, {timeframe}")
+            except BaseException:
+                # Don't start new downloads - running downloads are completed.
+                executor.shutdown(cancel_futures=True)
+                raise
+        progress.update(task, description="Downloading data...")
 
     return pairs_not_available
 
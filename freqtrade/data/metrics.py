@@ -261,21 +261,41 @@ def calculate_expectancy(trades: pd.DataFrame) -> tuple[float, float]:
     :return: expectancy, expectancy_ratio
     """
 
+    if len(trades) == 0:
+        return calculate_expectancy_from_sums(0.0, 0.0, 0, 0, 0)
+
+    winning_trades = trades.loc[trades["profit_abs"] > 0]
+    losing_trades = trades.loc[trades["profit_abs"] < 0]
+    return calculate_expectancy_from_sums(
+        winning_trades["profit_abs"].sum(),
+        abs(losing_trades["profit_abs"].sum()),
+        len(winning_trades),
+        len(losing_trades),
+        len(trades),
+    )
+
+
+def calculate_expectancy_from_sums(
+    profit_sum: float, loss_sum: float, nb_win_trades: int, nb_loss_trades: int, nb_trades: int
+) -> tuple[float, float]:
+    """
+    Calculate expectancy from the sums of winning and losing trades
+    :param profit_sum: Sum of profits of winning trades
+    :param loss_sum: Sum of losses of losing trades (as positive number)
+    :param nb_win_trades: Number of winning trades
+    :param nb_loss_trades: Number of losing trades
+    :param nb_trades: Number of trades
+    :return: expectancy, expectancy_ratio
+    """
+
     expectancy = 0.0
     expectancy_ratio = 100.0
 
-    if len(trades) > 0:
-        winning_trades = trades.loc[trades["profit_abs"] > 0]
-        losing_trades = trades.loc[trades["profit_abs"] < 0]
-        profit_sum = winning_trades["profit_abs"].sum()
-        loss_sum = abs(losing_trades["profit_abs"].sum())
-        nb_win_trades = len(winning_trades)
-        nb_loss_trades = len(losing_trades)
-
+    if nb_trades > 0:
         average_win = (profit_sum / nb_win_trades) if nb_win_trades > 0 else 0
         average_loss = (loss_sum / nb_loss_trades) if nb_loss_trades > 0 else 0
-        winrate = nb_win_trades / len(trades)
-        loserate = nb_loss_trades / len(trades)
+        winrate = nb_win_trades / nb_trades
+        loserate = nb_loss_trades / nb_trades
 
         expectancy = (winrate * average_win) - (loserate * average_loss)
         if average_loss > 0:
@@ -0,0 +1,103 @@
+"""
+Preallocated columnar storage, shared by the candle and trade buffers of the exchange.
+"""
+
+from typing import Any
+
+import numpy as np
+from pandas import DataFrame, Series
+from pandas.api.extensions import ExtensionDtype
+
+
+def _column_values(series: Series) -> Any:
+    # Extension arrays (e.g. timezone aware dates) are stored as they are - no conversion
+    if isinstance(series.dtype, ExtensionDtype):
+        return series.array
+    return series.to_numpy()
+
+
+def _allocate(values: Any, capacity: int) -> Any:
+    if isinstance(values, np.ndarray):
+        return np.empty(capacity, dtype=values.dtype)
+    # Extension array of the same dtype, filled with missing values
+    return values.take(np.full(capacity, -1), allow_fill=True)
+
+
+class ColumnBuffer:
+    """
+    Rows of a table, kept in preallocated arrays - one per column.
+    Rows are appended behind the stored rows, and age out by moving the start of the buffer.
+    Stored rows are never modified in place: rows are moved to new arrays once the arrays
+    are full, or before stored rows are rewritten.
+    Dataframes returned by `to_dataframe()` therefore share the arrays instead of copying them,
+    and remain unchanged by later updates of the buffer.
+    """
+
+    def __init__(self, data: DataFrame, headroom: int) -> None:
+        """
+        :param data: Initial rows. Defines the columns (and their dtypes) of the buffer.
+        :param headroom: Minimum number of rows which can be appended after moving the rows
+                         to new arrays
+        """
+        self.headroom = headroom
+        self._columns = {
+            col: _allocate(_column_values(data[col]), len(data) + headroom) for col in data.columns
+        }
+        self._start = 0
+        self._end = 0
+        self.append(data)
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    def column(self, name: str) -> Any:
+        """
+        Stored values of one column - a view, which must not be modified.
+        """
+        return self._columns[name][self._start : self._end]
+
+    def append(self, data: DataFrame) -> None:
+        """
+        Append rows behind the stored rows.
+        :param data: Rows to append, containing all columns of the buffer
+        """
+        count = len(data)
+        if self._end + count > len(self._columns[next(iter(self._columns))]):
+            self._reallocate(count)
+        for col, values in self._columns.items():
+            values[self._end : self._end + count] = _column_values(data[col])
+        self._end += count
+
+    def replace(self, pos: int, values: dict[str, np.ndarray]) -> None:
+        """
+        Rewrite stored rows. Rows are moved to new arrays first, as dataframes returned
+        previously share the current arrays.
+        :param pos: Position of the first row to rewrite, relative to the first stored row
+        :param values: New values, for some or all columns
+        """
+        self._reallocate(0)
+        for col, col_values in values.items():
+            start = self._start + pos
+            self._columns[col][start : start + len(col_values)] = col_values
+
+    def drop(self, count: int) -> None:
+        """
+        Age out the first `count` stored rows.
+        """
+        self._start += min(max(count, 0), len(self))
+
+    def to_dataframe(self) -> DataFrame:
+        """
+        Stored rows as dataframe, sharing the arrays of the buffer.
+        """
+        rows = slice(self._start, self._end)
+        return DataFrame({col: values[rows] for col, values in self._columns.items()}, copy=False)
+
+    def _reallocate(self, count: int) -> None:
+        size = len(self)
+        capacity = size + count + max(self.headroom, size)
+        for col, values in self._columns.items():
+            new_values = _allocate(values, capacity)
+            new_values[:size] = values[self._start : self._end]
+            self._columns[col] = new_values
+        self._start, self._end = 0, size
@@ -36,6 +36,9 @@ def _get_logging_mixin():
 API_RETRY_COUNT = 4
 API_FETCH_ORDER_RETRY_COUNT = 5
 
+# Maximum number of concurrent download jobs (see Exchange.parallel_downloads)
+MAX_PARALLEL_DOWNLOADS = 8
+
 BAD_EXCHANGES = {
     "bitmex": "Various reasons.",
     "probit": "Requires additional, regular calls to `signIn()`.",
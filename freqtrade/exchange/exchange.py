@@ -7,12 +7,13 @@ import asyncio
 import inspect
 import logging
 import signal
-from collections.abc import Coroutine, Generator
+from collections.abc import Coroutine, Generator, Iterator
+from contextlib import contextmanager
 from copy import deepcopy
 from datetime import datetime, timedelta, timezone
-from math import floor, isnan
-from threading import Lock
-from typing import Any, Literal, TypeGuard
+from math import ceil, floor, isnan
+from threading import Lock, Thread
+from typing import Any, Literal, TypeGuard, TypeVar
 
 import ccxt
 import ccxt.pro as ccxt_pro
@@ -64,6 +65,7 @@ from freqtrade.exceptions import (
 )
 from freqtrade.exchange.common import (
     API_FETCH_ORDER_RETRY_COUNT,
+    MAX_PARALLEL_DOWNLOADS,
     remove_exchange_credentials,
     retrier,
     retrier_async,
@@ -99,6 +101,8 @@ from freqtrade.exchange.exchange_utils_timeframe import (
     timeframe_to_seconds,
 )
 from freqtrade.exchange.exchange_ws import ExchangeWS
+from freqtrade.exchange.ohlcv_buffer import OHLCVBuffer
+from freqtrade.exchange.trades_buffer import TradesBuffer
 from freqtrade.misc import (
     chunks,
     deep_merge_dicts,
@@ -113,6 +117,8 @@ from freqtrade.util.periodic_cache import PeriodicCache
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 class Exchange:
     # Parameters to add directly to buy/sell calls (like agreeing to trading agreement)
@@ -211,10 +217,13 @@ class Exchange:
 
         # Holds candles
         self._klines: dict[PairWithTimeframe, DataFrame] = {}
+        # Columnar buffers backing _klines - cached dataframes share the arrays of their buffer
+        self._klines_buffers: dict[PairWithTimeframe, OHLCVBuffer] = {}
         self._expiring_candle_cache: dict[tuple[str, int], PeriodicCache] = {}
 
         # Holds public_trades
         self._trades: dict[PairWithTimeframe, DataFrame] = {}
+        self._trades_buffers: dict[PairWithTimeframe, TradesBuffer] = {}
 
         # Holds all open sell orders for dry_run
         self._dry_run_open_orders: dict[str, Any] = {}
@@ -326,6 +335,44 @@ class Exchange:
         asyncio.set_event_loop(loop)
         return loop
 
+    def _run_async(self, coro: Coroutine[Any, Any, T]) -> T:
+        """
+        Run a coroutine on the exchange's event loop and wait for its result.
+        Also works from other threads while the loop runs in the background
+        (see `run_loop_in_background()`).
+        """
+        if self.loop.is_running():
+            return asyncio.run_coroutine_threadsafe(coro, self.loop).result()
+        return self.loop.run_until_complete(coro)
+
+    @contextmanager
+    def run_loop_in_background(self) -> Iterator[None]:
+        """
+        Run the event loop in a background thread, allowing multiple threads to download
+        data concurrently.
+        All requests still go through the same ccxt object - so they share its rate limit.
+        Only methods using `_run_async()` may be used while the loop runs in the background.
+        """
+        thread = Thread(target=self.loop.run_forever, name="ft_exchange_loop", daemon=True)
+        thread.start()
+        try:
+            yield
+        finally:
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            thread.join()
+
+    @property
+    def parallel_downloads(self) -> int:
+        """
+        Number of download jobs to run concurrently.
+        Aims at one job per request allowed per second by ccxt's `rateLimit` (in milliseconds),
+        as most time of a job is spent waiting for the response.
+        """
+        rate_limit = float(self._api_async.rateLimit or 0)
+        if rate_limit <= 0:
+            return MAX_PARALLEL_DOWNLOADS
+        return max(1, min(MAX_PARALLEL_DOWNLOADS, ceil(1000 / rate_limit)))
+
     def validate_config(self, config: Config) -> None:
         # Check if timeframe is available
         self.validate_timeframes(config.get("timeframe"))
@@ -640,7 +687,7 @@ class Exchange:
 
     def _load_async_markets(self, reload: bool = False) -> dict[str, Any]:
         try:
-            markets = self.loop.run_until_complete(self._api_reload_markets(reload=reload))
+            markets = self._run_async(self._api_reload_markets(reload=reload))
 
             if isinstance(markets, Exception):
                 raise markets
@@ -2305,7 +2352,7 @@ class Exchange:
         :param until_ms: Timestamp in milliseconds to get history up to
         :return: Dataframe with candle (OHLCV) data
         """
-        pair, _, _, data, _ = self.loop.run_until_complete(
+        pair, _, _, data, _ = self._run_async(
             self._async_get_historic_ohlcv(
                 pair=pair,
                 timeframe=timeframe,
@@ -2415,7 +2462,7 @@ class Exchange:
                 logger.info(
                     f"Time jump detected. Evicting cache for {pair}, {timeframe}, {candle_type}"
                 )
-                del self._klines[(pair, timeframe, candle_type)]
+                self._evict_cached_ohlcv((pair, timeframe, candle_type))
 
         if not since_ms and (self._ft_has["ohlcv_require_since"] or not_all_data):
             # Multiple calls for one pair - to get more history
@@ -2473,6 +2520,13 @@ class Exchange:
 
         return input_coroutines, cached_pairs
 
+    def _evict_cached_ohlcv(self, pair_key: PairWithTimeframe) -> None:
+        """
+        Remove cached candles, together with the buffer backing them
+        """
+        self._klines.pop(pair_key, None)
+        self._klines_buffers.pop(pair_key, None)
+
     def _process_ohlcv_df(
         self,
         pair: str,
@@ -2491,23 +2545,35 @@ class Exchange:
             ticks, timeframe, pair=pair, fill_missing=True, drop_incomplete=drop_incomplete
         )
         if cache:
-            if (pair, timeframe, c_type) in self._klines:
-                old = self._klines[(pair, timeframe, c_type)]
-                # Reassign so we return the updated, combined df
-                ohlcv_df = clean_ohlcv_dataframe(
-                    concat([old, ohlcv_df], axis=0),
-                    timeframe,
-                    pair,
-                    fill_missing=True,
-                    drop_incomplete=False,
-                )
-                candle_limit = self.ohlcv_candle_limit(timeframe, self._config["candle_type_def"])
-                # Age out old candles
-                ohlcv_df = ohlcv_df.tail(candle_limit + self._startup_candle_count)
-                ohlcv_df = ohlcv_df.reset_index(drop=True)
-                self._klines[(pair, timeframe, c_type)] = ohlcv_df
+            pair_key = (pair, timeframe, c_type)
+            candle_limit = self.ohlcv_candle_limit(timeframe, self._config["candle_type_def"])
+            buffer = self._klines_buffers.get(pair_key)
+            if (
+                buffer is not None
+                and pair_key in self._klines
+                and buffer.dataframe is self._klines[pair_key]
+                and buffer.update(ohlcv_df)
+            ):
+                # Refreshed candles continue the cached candles - merged in place.
+                ohlcv_df = buffer.dataframe
             else:
-                self._klines[(pair, timeframe, c_type)] = ohlcv_df
+                if pair_key in self._klines:
+                    old = self._klines[pair_key]
+                    # Reassign so we return the updated, combined df
+                    ohlcv_df = clean_ohlcv_dataframe(
+                        concat([old, ohlcv_df], axis=0),
+                        timeframe,
+                        pair,
+                        fill_missing=True,
+                        drop_incomplete=False,
+                    )
+                    # Age out old candles
+                    ohlcv_df = ohlcv_df.tail(candle_limit + self._startup_candle_count)
+                    ohlcv_df = ohlcv_df.reset_index(drop=True)
+                self._klines_buffers[pair_key] = OHLCVBuffer(
+                    ohlcv_df, candle_limit + self._startup_candle_count
+                )
+            self._klines[pair_key] = ohlcv_df
         return ohlcv_df
 
     def refresh_latest_ohlcv(
@@ -2727,18 +2793,30 @@ class Exchange:
         trades_df = trades_list_to_df(ticks, True)
 
         if cache:
-            if (pair, timeframe, c_type) in self._trades:
-                old = self._trades[(pair, timeframe, c_type)]
-                # Reassign so we return the updated, combined df
-                combined_df = concat([old, trades_df], axis=0)
-                logger.debug(f"Clean duplicated ticks from Trades data {pair}")
-                trades_df = DataFrame(
-                    trades_df_remove_duplicates(combined_df), columns=combined_df.columns
-                )
-                # Age out old candles
-                trades_df = trades_df[first_required_candle_date < trades_df["timestamp"]]
-                trades_df = trades_df.reset_index(drop=True)
-            self._trades[(pair, timeframe, c_type)] = trades_df
+            pair_key = (pair, timeframe, c_type)
+            buffer = self._trades_buffers.get(pair_key)
+            if (
+                buffer is not None
+                and pair_key in self._trades
+                and buffer.dataframe is self._trades[pair_key]
+                and buffer.update(trades_df, first_required_candle_date)
+            ):
+                # Refreshed trades continue the cached trades - appended to the buffer.
+                trades_df = buffer.dataframe
+            else:
+                if pair_key in self._trades:
+                    old = self._trades[pair_key]
+                    # Reassign so we return the updated, combined df
+                    combined_df = concat([old, trades_df], axis=0)
+                    logger.debug(f"Clean duplicated ticks from Trades data {pair}")
+                    trades_df = DataFrame(
+                        trades_df_remove_duplicates(combined_df), columns=combined_df.columns
+                    )
+                    # Age out old candles
+                    trades_df = trades_df[first_required_candle_date < trades_df["timestamp"]]
+                    trades_df = trades_df.reset_index(drop=True)
+                self._trades_buffers[pair_key] = TradesBuffer(trades_df)
+            self._trades[pair_key] = trades_df
         return trades_df
 
     async def _build_trades_dl_jobs(
@@ -0,0 +1,72 @@
+"""
+Columnar buffer holding the most recent candles of one pair / timeframe / candle type.
+"""
+
+import numpy as np
+from pandas import DataFrame
+
+from freqtrade.exchange.column_buffer import ColumnBuffer
+
+
+_VALUE_COLUMNS = ["open", "high", "low", "close", "volume"]
+
+
+class OHLCVBuffer:
+    """
+    Keeps the candles of one pair in a ColumnBuffer, with room for `max_candles` more
+    candles than currently stored.
+    Refreshed candles which overlap the stored candles are merged, and new candles are
+    appended - avoiding the concatenation, regrouping and resampling of all candles on every
+    refresh. Old candles age out by moving the start of the buffer.
+    """
+
+    def __init__(self, data: DataFrame, max_candles: int) -> None:
+        """
+        :param data: Cleaned candles (as returned by `ohlcv_to_dataframe()`)
+        :param max_candles: Number of candles to keep after an update
+        """
+        self.max_candles = max_candles
+        self._buffer = ColumnBuffer(data[["date", *_VALUE_COLUMNS]], max_candles)
+        # Stored candles as dataframe - never modified, so it can be handed out without copying.
+        self.dataframe = data
+
+    def __len__(self) -> int:
+        return len(self._buffer)
+
+    def update(self, data: DataFrame) -> bool:
+        """
+        Merge refreshed candles into the buffer.
+        Candles with the same date are combined the same way as `clean_ohlcv_dataframe()` does.
+        The new dataframe shares the arrays of the buffer - only the new candles are copied.
+        Candles which change while merging (e.g. the incomplete last candle) require copying
+        all stored candles once.
+        :param data: Cleaned candles (as returned by `ohlcv_to_dataframe()`)
+        :return: False if the candles don't start within the stored candles, or don't line up
+                 with them. The buffer is unchanged in this case.
+        """
+        if data.empty:
+            return True
+        dates = data["date"].array.asi8
+        stored = self._buffer.column("date").asi8
+        pos = int(np.searchsorted(stored, dates[0]))
+        overlap = min(len(stored) - pos, len(dates))
+        if overlap <= 0 or not (stored[pos : pos + overlap] == dates[:overlap]).all():
+            return False
+
+        old = {col: self._buffer.column(col)[pos : pos + overlap] for col in _VALUE_COLUMNS}
+        new = {col: data[col].to_numpy(dtype=np.float64)[:overlap] for col in _VALUE_COLUMNS}
+        merged = {
+            "open": np.where(np.isnan(old["open"]), new["open"], old["open"]),
+            "high": np.fmax(old["high"], new["high"]),
+            "low": np.fmin(old["low"], new["low"]),
+            "close": np.where(np.isnan(new["close"]), old["close"], new["close"]),
+            "volume": np.fmax(old["volume"], new["volume"]),
+        }
+        if not all(np.array_equal(merged[col], old[col], equal_nan=True) for col in _VALUE_COLUMNS):
+            self._buffer.replace(pos, merged)
+
+        self._buffer.append(data.iloc[overlap:])
+        # Age out old candles
+        self._buffer.drop(len(self._buffer) - self.max_candles)
+        self.dataframe = self._buffer.to_dataframe()
+        return True
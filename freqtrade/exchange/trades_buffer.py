@@ -0,0 +1,72 @@
+"""
+Append-only buffer holding the recent public trades of one pair / timeframe / candle type.
+"""
+
+import numpy as np
+from pandas import DataFrame
+
+from freqtrade.constants import DEFAULT_TRADES_COLUMNS
+from freqtrade.exchange.column_buffer import ColumnBuffer
+
+
+class TradesBuffer:
+    """
+    Keeps the trades of one pair in a ColumnBuffer - including the converted `date` column.
+    Trades are refreshed starting at the last stored trade, so new trades only need to be
+    deduplicated against the last stored trades before they're appended - avoiding the
+    concatenation and deduplication of all trades on every refresh.
+    Old trades age out by moving the start of the buffer.
+    """
+
+    def __init__(self, data: DataFrame) -> None:
+        """
+        :param data: Trades, sorted by timestamp (as returned by `trades_list_to_df()`)
+        """
+        self._buffer = ColumnBuffer(data[[*DEFAULT_TRADES_COLUMNS, "date"]], max(len(data), 1000))
+        # Stored trades as dataframe - never modified by the buffer.
+        self.dataframe = data
+
+    def __len__(self) -> int:
+        return len(self._buffer)
+
+    def update(self, data: DataFrame, first_required_ms: int) -> bool:
+        """
+        Append refreshed trades to the buffer, and age out trades which are no longer required.
+        Trades which are already stored (same timestamp and id) are skipped.
+        The new dataframe shares the arrays of the buffer - only the new trades are copied.
+        :param data: Trades, sorted by timestamp (as returned by `trades_list_to_df()`)
+        :param first_required_ms: Trades up to (including) this timestamp are removed
+        :return: False if new trades are older than the last stored trade, or not sorted.
+                 The buffer is unchanged in this case.
+        """
+        data = data.drop_duplicates(subset=["timestamp", "id"])
+        timestamps = data["timestamp"].to_numpy()
+        if len(timestamps) and len(self):
+            stored = self._buffer.column("timestamp")
+            # Only stored trades at or after the first refreshed trade can be duplicates
+            overlap = int(np.searchsorted(stored, timestamps[0]))
+            known = set(
+                zip(
+                    stored[overlap:].tolist(),
+                    self._buffer.column("id")[overlap:].tolist(),
+                    strict=True,
+                )
+            )
+            if known:
+                is_new = [
+                    key not in known
+                    for key in zip(timestamps.tolist(), data["id"].tolist(), strict=True)
+                ]
+                data = data.loc[is_new]
+                timestamps = timestamps[is_new]
+            if len(timestamps) and timestamps[0] < stored[-1]:
+                return False
+        if (np.diff(timestamps) < 0).any():
+            return False
+
+        self._buffer.append(data)
+        # Age out old trades
+        stored = self._buffer.column("timestamp")
+        self._buffer.drop(int(np.searchsorted(stored, first_required_ms, side="right")))
+        self.dataframe = self._buffer.to_dataframe()
+        return True
@@ -8,7 +8,7 @@ from copy import deepcopy
 from datetime import datetime, time, timedelta, timezone
 from math import isclose
 from threading import Lock
-from time import sleep
+from time import perf_counter, sleep
 from typing import Any
 
 from schedule import Scheduler
@@ -47,7 +47,7 @@ from freqtrade.exchange.exchange_types import CcxtOrder
 from freqtrade.leverage.liquidation_price import update_liquidation_prices
 from freqtrade.misc import safe_value_fallback, safe_value_fallback2
 from freqtrade.mixins import LoggingMixin
-from freqtrade.persistence import Order, PairLocks, Trade, init_db
+from freqtrade.persistence import Order, PairLocks, Trade, TradeStatistics, init_db
 from freqtrade.persistence.key_value_store import set_startup_time
 from freqtrade.plugins.pairlistmanager import PairListManager
 from freqtrade.plugins.protectionmanager import ProtectionManager
@@ -64,7 +64,7 @@ from freqtrade.rpc.rpc_types import (
 )
 from freqtrade.strategy.interface import IStrategy
 from freqtrade.strategy.strategy_wrapper import strategy_safe_wrapper
-from freqtrade.util import FtPrecise, MeasureTime
+from freqtrade.util import FtPrecise, MeasureTime, PhaseTimings
 from freqtrade.util.migrations.binance_mig import migrate_binance_futures_names
 from freqtrade.wallets import Wallets
 
@@ -107,12 +107,15 @@ class FreqtradeBot(LoggingMixin):
         init_db(self.config["db_url"])
 
         self.wallets = Wallets(self.config, self.exchange)
+        self.trade_statistics = TradeStatistics()
 
         PairLocks.timeframe = self.config["timeframe"]
 
         self.trading_mode: TradingMode = self.config.get("trading_mode", TradingMode.SPOT)
         self.margin_mode: MarginMode = self.config.get("margin_mode", MarginMode.NONE)
         self.last_process: datetime | None = None
+        # Durations of the phases of process()
+        self.phase_timings = PhaseTimings()
 
         # RPC runs in separate threads, can start handling external commands just after
         # initialization, even before Freqtradebot has a chance to start its throttling,
@@ -130,6 +133,7 @@ class FreqtradeBot(LoggingMixin):
         self.strategy.dp = self.dataprovider
         # Attach Wallets to strategy instance
         self.strategy.wallets = self.wallets
+        self.strategy.phase_timings = self.phase_timings
 
         # Initializing Edge only if enabled
         self.edge = (
@@ -253,53 +257,63 @@ class FreqtradeBot(LoggingMixin):
         :return: True if one or more trades has been created or closed, False otherwise
         """
 
+        timings = self.phase_timings
+        start = perf_counter()
         # Check whether markets have to be reloaded and reload them when it's needed
-        self.exchange.reload_markets()
+        with timings.measure("reload_markets"):
+            self.exchange.reload_markets()
 
-        self.update_trades_without_assigned_fees()
+        with timings.measure("update_fees"):
+            self.update_trades_without_assigned_fees()
 
         # Query trades from persistence layer
         trades: list[Trade] = Trade.get_open_trades()
 
-        self.active_pair_whitelist = self._refresh_active_whitelist(trades)
+        with timings.measure("refresh_pairlist"):
+            self.active_pair_whitelist = self._refresh_active_whitelist(trades)
 
         # Refreshing candles
-        self.dataprovider.refresh(
-            self.pairlists.create_pair_list(self.active_pair_whitelist),
-            self.strategy.gather_informative_pairs(),
-        )
+        with timings.measure("refresh_data"):
+            self.dataprovider.refresh(
+                self.pairlists.create_pair_list(self.active_pair_whitelist),
+                self.strategy.gather_informative_pairs(),
+            )
 
-        strategy_safe_wrapper(self.strategy.bot_loop_start, supress_error=True)(
-            current_time=datetime.now(timezone.utc)
-        )
+        with timings.measure("bot_loop_start"):
+            strategy_safe_wrapper(self.strategy.bot_loop_start, supress_error=True)(
+                current_time=datetime.now(timezone.utc)
+            )
 
-        with self._measure_execution:
+        with self._measure_execution, timings.measure("analyze"):
             self.strategy.analyze(self.active_pair_whitelist)
 
-        with self._exit_lock:
+        with self._exit_lock, timings.measure("manage_open_orders"):
             # Check for exchange cancellations, timeouts and user requested replace
             self.manage_open_orders()
 
         # Protect from collisions with force_exit.
         # Without this, freqtrade may try to recreate stoploss_on_exchange orders
         # while exiting is in process, since telegram messages arrive in an different thread.
-        with self._exit_lock:
+        with self._exit_lock, timings.measure("exit_positions"):
             trades = Trade.get_open_trades()
             # First process current opened trades (positions)
             self.exit_positions(trades)
 
         # Check if we need to adjust our current positions before attempting to enter new trades.
         if self.strategy.position_adjustment_enable:
-            with self._exit_lock:
+            with self._exit_lock, timings.measure("adjust_positions"):
                 self.process_open_trade_positions()
 
         # Then looking for entry opportunities
         if self.get_free_open_trades():
-            self.enter_positions()
+            with timings.measure("enter_positions"):
+                self.enter_positions()
         self._schedule.run_pending()
-        Trade.commit()
+        with timings.measure("commit"):
+            Trade.commit()
         self.rpc.process_msg_queue(self.dataprovider._msg_queue)
         self.last_process = datetime.now(timezone.utc)
+        timings.observe("process", perf_counter() - start)
 
     def process_stopped(self) -> None:
         """
@@ -2272,6 +2286,8 @@ class FreqtradeBot(LoggingMixin):
                     self.strategy.ft_stoploss_adjust(
                         current_rate, trade, datetime.now(timezone.utc), profit, 0, after_fill=True
                     )
+            if not trade.is_open:
+                self.trade_statistics.trade_closed(trade)
             # Updating wallets when order is closed
             self.wallets.update()
         return trade
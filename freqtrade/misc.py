@@ -10,6 +10,7 @@ from pathlib import Path
 from typing import Any, TextIO
 from urllib.parse import urlparse
 
+import numpy as np
 import pandas as pd
 import rapidjson
 
@@ -189,13 +190,35 @@ def parse_db_uri_for_logging(uri: str):
     return parsed_db_uri.geturl().replace(f":{pwd}@", ":*****@")
 
 
+def _structured_array_to_records(value: Any) -> Any:
+    if isinstance(value, np.ndarray) and value.dtype.names:
+        names = value.dtype.names
+        return [dict(zip(names, row, strict=True)) for row in value.tolist()]
+    return value
+
+
+def structured_arrays_to_records(dataframe: pd.DataFrame) -> pd.DataFrame:
+    """
+    Convert cells containing numpy structured arrays (e.g. the compact orderflow columns)
+    to lists of records, so their field names are kept when serializing the dataframe.
+    :param dataframe: A pandas DataFrame
+    :returns: DataFrame with converted columns (the input dataframe if there are none)
+    """
+    converted = {
+        col: dataframe[col].map(_structured_array_to_records)
+        for col in dataframe.select_dtypes(include="object").columns
+        if any(isinstance(value, np.ndarray) for value in dataframe[col].tolist())
+    }
+    return dataframe.assign(**converted) if converted else dataframe
+
+
 def dataframe_to_json(dataframe: pd.DataFrame) -> str:
     """
     Serialize a DataFrame for transmission over the wire using JSON
     :param dataframe: A pandas DataFrame
     :returns: A JSON string of the pandas DataFrame
     """
-    return dataframe.to_json(orient="split")
+    return structured_arrays_to_records(dataframe).to_json(orient="split")
 
 
 def json_to_dataframe(data: str) -> pd.DataFrame:
@@ -5,22 +5,36 @@ from pathlib import Path
 import rapidjson
 
 
-def get_strategy_run_id(strategy) -> str:
+# Options which don't affect analyzed dataframes (indicators and signals).
+SIGNAL_INDEPENDENT_KEYS = (
+    "strategy_list",
+    "original_config",
+    "telegram",
+    "api_server",
+    "timerange",
+    "pairs",
+    "pairlists",
+    "export",
+    "exportfilename",
+    "backtest_cache",
+    "backtest_breakdown",
+    "backtest_engine",
+    "backtest_show_pair_list",
+    "max_open_trades",
+    "stake_amount",
+    "dry_run_wallet",
+    "timeframe_detail",
+    "enable_protections",
+    "position_stacking",
+    "fee",
+)
+
+
+def _get_strategy_hash(strategy, config: dict) -> str:
     """
-    Generate unique identification hash for a backtest run. Identical config and strategy file will
-    always return an identical hash.
-    :param strategy: strategy object.
-    :return: hex string id.
+    Hash config, parameter files and the strategy file.
     """
     digest = hashlib.sha1()  # noqa: S324
-    config = deepcopy(strategy.config)
-
-    # Options that have no impact on results of individual backtest.
-    not_important_keys = ("strategy_list", "original_config", "telegram", "api_server")
-    for k in not_important_keys:
-        if k in config:
-            del config[k]
-
     # Explicitly allow NaN values (e.g. max_open_trades).
     # as it does not matter for getting the hash.
     digest.update(
@@ -37,6 +51,42 @@ def get_strategy_run_id(strategy) -> str:
     return digest.hexdigest().lower()
 
 
+def get_strategy_run_id(strategy) -> str:
+    """
+    Generate unique identification hash for a backtest run. Identical config and strategy file will
+    always return an identical hash.
+    :param strategy: strategy object.
+    :return: hex string id.
+    """
+    config = deepcopy(strategy.config)
+
+    # Options that have no impact on results of individual backtest.
+    not_important_keys = ("strategy_list", "original_config", "telegram", "api_server")
+    for k in not_important_keys:
+        if k in config:
+            del config[k]
+
+    return _get_strategy_hash(strategy, config)
+
+
+def get_strategy_signal_id(strategy) -> str:
+    """
+    Generate identification hash for the signals of a strategy.
+    Unlike `get_strategy_run_id()`, the hash doesn't depend on the pairs and timerange
+    being backtested, nor on options only affecting the simulation of trades.
+    :param strategy: strategy object.
+    :return: hex string id.
+    """
+    config = deepcopy(strategy.config)
+
+    for k in SIGNAL_INDEPENDENT_KEYS:
+        config.pop(k, None)
+    config.get("exchange", {}).pop("pair_whitelist", None)
+    config.get("exchange", {}).pop("pair_blacklist", None)
+
+    return _get_strategy_hash(strategy, config)
+
+
 def get_backtest_metadata_filename(filename: Path | str) -> Path:
     """Return metadata filename for specified backtest results file."""
     filename = Path(filename)
@@ -6,12 +6,13 @@ This module contains the backtesting logic
 
 import logging
 from collections import defaultdict
+from collections.abc import Callable
 from copy import deepcopy
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
 from numpy import nan
-from pandas import DataFrame
+from pandas import DataFrame, Timestamp
 
 from freqtrade import constants
 from freqtrade.configuration import TimeRange, validate_config_consistency
@@ -41,6 +42,7 @@ from freqtrade.ft_types import BacktestResultType, get_BacktestResultType_defaul
 from freqtrade.leverage.liquidation_price import update_liquidation_prices
 from freqtrade.mixins import LoggingMixin
 from freqtrade.optimize.backtest_caching import get_strategy_run_id
+from freqtrade.optimize.bt_arrays import ExitScanner, PairArrays, build_entry_events
 from freqtrade.optimize.bt_progress import BTProgress
 from freqtrade.optimize.optimize_reports import (
     generate_backtest_stats,
@@ -49,6 +51,7 @@ from freqtrade.optimize.optimize_reports import (
     show_backtest_results,
     store_backtest_results,
 )
+from freqtrade.optimize.signal_cache import SignalCache
 from freqtrade.persistence import (
     CustomDataWrapper,
     LocalTrade,
@@ -213,6 +216,13 @@ class Backtesting:
         # strategies which define "can_short=True" will fail to load in Spot mode.
         self._can_short = self.trading_mode != TradingMode.SPOT
         self._position_stacking: bool = self.config.get("position_stacking", False)
+        self.backtest_engine: str = self.config.get("backtest_engine", "list")
+        # Reuse signals of the previous backtest - only valid if signals can't change between
+        # backtests (hyperopt only optimizing spaces which don't affect signals).
+        self.reuse_signals: bool = False
+        self._signal_data: tuple[Any, dict[str, DataFrame], dict[str, DataFrame]] | None = None
+        # Processed data already contains signals (loaded from the signal cache)
+        self._signals_advised = False
         self.enable_protections: bool = self.config.get("enable_protections", False)
         migrate_data(config, self.exchange)
 
@@ -274,6 +284,7 @@ class Backtesting:
         self._can_short = self.trading_mode != TradingMode.SPOT and strategy.can_short
 
         self.strategy.ft_bot_start()
+        self._signal_data = None
 
     def _load_protections(self, strategy: IStrategy):
         if self.config.get("enable_protections", False):
@@ -409,33 +420,40 @@ class Backtesting:
             self.abort = False
             raise DependencyException("Stop requested")
 
-    def _get_ohlcv_as_lists(self, processed: dict[str, DataFrame]) -> dict[str, tuple]:
+    def _get_signal_dataframes(
+        self, processed: dict[str, DataFrame], analyzed: dict[str, DataFrame] | None = None
+    ):
         """
-        Helper function to convert a processed dataframes into lists for performance reasons.
+        Generator advising signals for each pair, yielding the trimmed dataframe with signals
+        shifted by one candle, as used by the backtest loop.
 
         Used by backtest() - so keep this optimized for performance.
 
         :param processed: a processed dictionary with format {pair, data}, which gets cleared to
         optimize memory usage!
+        :param analyzed: Optional dict receiving the analyzed dataframes passed to the
+        dataprovider cache.
         """
-
-        data: dict = {}
         self.progress.init_step(BacktestState.CONVERT, len(processed))
 
-        # Create dict with data
         for pair in processed.keys():
             pair_data = processed[pair]
             self.check_abort()
             self.progress.increment()
 
-            if not pair_data.empty:
-                # Cleanup from prior runs
-                pair_data.drop(HEADERS[5:] + ["buy", "sell"], axis=1, errors="ignore")
-            df_analyzed = self.strategy.ft_advise_signals(pair_data, {"pair": pair})
+            if self._signals_advised:
+                df_analyzed = pair_data
+            else:
+                if not pair_data.empty:
+                    # Cleanup from prior runs
+                    pair_data.drop(HEADERS[5:] + ["buy", "sell"], axis=1, errors="ignore")
+                df_analyzed = self.strategy.ft_advise_signals(pair_data, {"pair": pair})
             # Update dataprovider cache
             self.dataprovider._set_cached_df(
                 pair, self.timeframe, df_analyzed, self.config["candle_type_def"]
             )
+            if analyzed is not None:
+                analyzed[pair] = df_analyzed
 
             # Trim startup period from analyzed dataframe
             df_analyzed = processed[pair] = pair_data = trim_dataframe(
@@ -460,12 +478,76 @@ class Backtesting:
                     df_analyzed[col] = 0 if not tag_col else None
 
             df_analyzed = df_analyzed.drop(df_analyzed.head(1).index)
+            yield pair, df_analyzed
+
+    @property
+    def has_signal_data(self) -> bool:
+        """
+        True if the next backtest reuses the signals of the previous backtest.
+        """
+        return self.reuse_signals and self._signal_data is not None
+
+    def _get_reusable_signal_data(self, processed: dict[str, DataFrame], convert: Callable) -> Any:
+        """
+        Convert processed data with `convert` (`_get_ohlcv_as_lists()` or
+        `_get_ohlcv_as_arrays()`).
+        With `reuse_signals` enabled, the result of the first conversion is kept, and returned
+        for all later backtests without advising signals again. `processed` and the
+        dataprovider cache are updated as `_get_signal_dataframes()` would.
+        """
+        if not self.reuse_signals:
+            return convert(processed)
+        if self._signal_data is None:
+            analyzed: dict[str, DataFrame] = {}
+            data = convert(processed, analyzed)
+            self._signal_data = (data, analyzed, dict(processed))
+            return data
+
+        data, analyzed, trimmed = self._signal_data
+        for pair, df_analyzed in analyzed.items():
+            self.dataprovider._set_cached_df(
+                pair, self.timeframe, df_analyzed, self.config["candle_type_def"]
+            )
+        processed.update(trimmed)
+        return data
+
+    def _get_ohlcv_as_lists(
+        self, processed: dict[str, DataFrame], analyzed: dict[str, DataFrame] | None = None
+    ) -> dict[str, tuple]:
+        """
+        Helper function to convert a processed dataframes into lists for performance reasons.
 
+        Used by backtest() - so keep this optimized for performance.
+
+        :param processed: a processed dictionary with format {pair, data}, which gets cleared to
+        optimize memory usage!
+        :param analyzed: See `_get_signal_dataframes()`
+        """
+
+        data: dict = {}
+        for pair, df_analyzed in self._get_signal_dataframes(processed, analyzed):
             # Convert from Pandas to list for performance reasons
             # (Looping Pandas is slow.)
             data[pair] = df_analyzed[HEADERS].values.tolist() if not df_analyzed.empty else []
         return data
 
+    def _get_ohlcv_as_arrays(
+        self, processed: dict[str, DataFrame], analyzed: dict[str, DataFrame] | None = None
+    ) -> dict[str, PairArrays]:
+        """
+        Columnar counterpart of `_get_ohlcv_as_lists()`, used by the "numpy" backtest engine.
+        Pairs without data are omitted.
+
+        :param processed: a processed dictionary with format {pair, data}, which gets cleared to
+        optimize memory usage!
+        :param analyzed: See `_get_signal_dataframes()`
+        """
+        return {
+            pair: PairArrays(df_analyzed)
+            for pair, df_analyzed in self._get_signal_dataframes(processed, analyzed)
+            if not df_analyzed.empty
+        }
+
     def _get_close_rate(
         self, row: tuple, trade: LocalTrade, exit_: ExitCheckTuple, trade_dur: int
     ) -> float:
@@ -1434,26 +1516,190 @@ class Backtesting:
             self.progress.increment()
             current_time += increment
 
-    def backtest(self, processed: dict, start_date: datetime, end_date: datetime) -> dict[str, Any]:
+    def _process_pair_candle(
+        self,
+        row: tuple,
+        pair: str,
+        row_index: int,
+        current_time: datetime,
+        is_last_row: bool,
+    ) -> None:
         """
-        Implement backtesting functionality
-
+        Process one candle (row) for one pair - spreading out into the detail timeframe
+        if necessary.
         NOTE: This method is used by Hyperopt at each iteration. Please keep it optimized.
-        Of course try to not have ugly code. By some accessor are sometime slower than functions.
-        Avoid extensive logging in this method and functions it calls.
+        :param row_index: Number of rows of this pair processed so far (including this one)
+        """
+        self.dataprovider._set_dataframe_max_index(self.required_startup + row_index)
+        self.dataprovider._set_dataframe_max_date(current_time)
+        current_detail_time: datetime = row[DATE_IDX].to_pydatetime()
+        trade_dir: LongShort | None = self.check_for_trade_entry(row)
 
-        :param processed: a processed dictionary with format {pair, data}, which gets cleared to
-        optimize memory usage!
-        :param start_date: backtesting timerange start datetime
-        :param end_date: backtesting timerange end datetime
-        :return: DataFrame with trades (results of backtesting)
+        if (
+            (trade_dir is not None or len(LocalTrade.bt_trades_open_pp[pair]) > 0)
+            and self.timeframe_detail
+            and pair in self.detail_data
+        ):
+            # Spread out into detail timeframe.
+            # Should only happen when we are either in a trade for this pair
+            # or when we got the signal for a new trade.
+            exit_candle_end = current_detail_time + self.timeframe_td
+
+            detail_data = self.detail_data[pair]
+            detail_data = detail_data.loc[
+                (detail_data["date"] >= current_detail_time)
+                & (detail_data["date"] < exit_candle_end)
+            ].copy()
+            if len(detail_data) == 0:
+                # Fall back to "regular" data if no detail data was found for this candle
+                self.dataprovider._set_dataframe_max_date(current_time)
+                self.backtest_loop(row, pair, current_time, trade_dir, not is_last_row)
+                return
+            detail_data.loc[:, "enter_long"] = row[LONG_IDX]
+            detail_data.loc[:, "exit_long"] = row[ELONG_IDX]
+            detail_data.loc[:, "enter_short"] = row[SHORT_IDX]
+            detail_data.loc[:, "exit_short"] = row[ESHORT_IDX]
+            detail_data.loc[:, "enter_tag"] = row[ENTER_TAG_IDX]
+            detail_data.loc[:, "exit_tag"] = row[EXIT_TAG_IDX]
+            is_first = True
+            current_time_det = current_time
+            for det_row in detail_data[HEADERS].values.tolist():
+                self.dataprovider._set_dataframe_max_date(current_time_det)
+                self.backtest_loop(
+                    det_row,
+                    pair,
+                    current_time_det,
+                    trade_dir,
+                    is_first and not is_last_row,
+                )
+                current_time_det += self.timeframe_detail_td
+                is_first = False
+        else:
+            self.dataprovider._set_dataframe_max_date(current_time)
+            self.backtest_loop(row, pair, current_time, trade_dir, not is_last_row)
+
+    def _start_candle(self, current_time: datetime) -> None:
+        """
+        Called once per candle, before any pair is processed.
+        """
+        self.check_abort()
+        # Reset open trade count for this candle
+        # Critical to avoid exceeding max_open_trades in backtesting
+        # when timeframe-detail is used and trades close within the opening candle.
+        LocalTrade.bt_open_open_trade_count_candle = LocalTrade.bt_open_open_trade_count
+        strategy_safe_wrapper(self.strategy.bot_loop_start, supress_error=True)(
+            current_time=current_time
+        )
+
+    def _can_skip_idle_candles(self) -> bool:
+        """
+        Candles without entry candidate and without open trade can only be skipped
+        if the strategy doesn't need to be called on every candle.
+        """
+        return getattr(self.strategy.bot_loop_start, "__func__", None) is IStrategy.bot_loop_start
+
+    def _can_fast_forward_trades(self) -> bool:
+        """
+        Open trades can only be fast-forwarded to their next possible exit if exits solely
+        depend on exit signals, ROI and the (trailing) stoploss.
+        """
+        strategy = self.strategy
+        return (
+            self.trading_mode == TradingMode.SPOT
+            and not self.timeframe_detail
+            and not self._position_stacking
+            and not strategy.use_custom_stoploss
+            and not strategy.position_adjustment_enable
+            and getattr(strategy.custom_exit, "__func__", None) is IStrategy.custom_exit
+            # The trailing stop must not move down with rising prices
+            and (
+                strategy.trailing_stop_positive is None
+                or strategy.trailing_stop_positive <= abs(strategy.stoploss)
+            )
+        )
+
+    def _catch_up_trade(
+        self, trade: LocalTrade, pair_data: PairArrays, start: int, end: int, start_date: datetime
+    ) -> None:
+        """
+        Apply the candles start to end (exclusive) a trade was fast-forwarded over.
+        None of these candles caused an exit, so the trade state only depends on
+        the highest high and the lowest low.
+        """
+        if end <= start:
+            return
+        high = float(pair_data.high[start:end].max())
+        low = float(pair_data.low[start:end].min())
+        current_rate = float(pair_data.open[end - 1])
+        trade.adjust_min_max_rates(high, low)
+        self.strategy.ft_stoploss_adjust(
+            current_rate,
+            trade,  # type: ignore[arg-type]
+            start_date + self.timeframe_td * int(pair_data.ticks[end - 1]),
+            trade.calc_profit_ratio(current_rate),
+            0,
+            low=low,
+            high=high,
+        )
+
+    @staticmethod
+    def _fast_forward_trade(
+        scanner: ExitScanner,
+        pair: str,
+        pair_data: PairArrays,
+        row_index: int,
+        forwarded: dict[str, tuple[int, int]],
+    ) -> None:
+        """
+        Skip the open trade of this pair up to the next row it may exit on.
+        """
+        open_trades = LocalTrade.bt_trades_open_pp[pair]
+        if len(open_trades) != 1 or open_trades[0].is_short or open_trades[0].has_open_orders:
+            return
+        resume_row = scanner.first_candidate(pair_data, row_index + 1, open_trades[0])
+        if resume_row > row_index + 1:
+            forwarded[pair] = (row_index + 1, resume_row)
+
+    @staticmethod
+    def _next_trade_tick(
+        pair_data: PairArrays, tick: int, forwarded: tuple[int, int] | None
+    ) -> int:
+        """
+        Next tick on which an open trade of this pair has to be processed.
+        """
+        if forwarded is None:
+            return pair_data.next_tick(tick)
+        return pair_data.tick_at_row(forwarded[1])
+
+    def _catch_up_forwarded_trades(
+        self,
+        arrays: dict[str, PairArrays],
+        forwarded: dict[str, tuple[int, int]],
+        total_ticks: int,
+        start_date: datetime,
+    ) -> None:
+        """
+        Apply the remaining candles to trades still fast-forwarded at the end of the backtest.
+        """
+        for pair, (skipped_from, resume_row) in forwarded.items():
+            # Apply the candles processed by the list engine until the end of the backtest
+            pair_data = arrays[pair]
+            processed_rows = int(pair_data.ticks.searchsorted(total_ticks, side="right"))
+            self._catch_up_trade(
+                LocalTrade.bt_trades_open_pp[pair][0],
+                pair_data,
+                skipped_from,
+                min(resume_row, processed_rows),
+                start_date,
+            )
+
+    def _backtest_lists(self, processed: dict, start_date: datetime, end_date: datetime) -> None:
+        """
+        Reference backtest engine, looping over every candle and pair.
         """
-        self.prepare_backtest(self.enable_protections)
-        # Ensure wallets are up-to-date (important for --strategy-list)
-        self.wallets.update()
         # Use dict of lists with data for performance
         # (looping lists is a lot faster than pandas DataFrames)
-        data: dict = self._get_ohlcv_as_lists(processed)
+        data: dict = self._get_reusable_signal_data(processed, self._get_ohlcv_as_lists)
 
         # Indexes per pair, so some pairs are allowed to have a missing start.
         indexes: dict = defaultdict(int)
@@ -1463,14 +1709,7 @@ class Backtesting:
             start_date, end_date, self.timeframe_td, list(data.keys())
         ):
             if is_first_call:
-                self.check_abort()
-                # Reset open trade count for this candle
-                # Critical to avoid exceeding max_open_trades in backtesting
-                # when timeframe-detail is used and trades close within the opening candle.
-                LocalTrade.bt_open_open_trade_count_candle = LocalTrade.bt_open_open_trade_count
-                strategy_safe_wrapper(self.strategy.bot_loop_start, supress_error=True)(
-                    current_time=current_time
-                )
+                self._start_candle(current_time)
             row_index = indexes[pair]
             row = self.validate_row(data, pair, row_index, current_time)
             if not row:
@@ -1478,56 +1717,114 @@ class Backtesting:
 
             row_index += 1
             indexes[pair] = row_index
-            is_last_row = current_time == end_date
-            self.dataprovider._set_dataframe_max_index(self.required_startup + row_index)
-            self.dataprovider._set_dataframe_max_date(current_time)
-            current_detail_time: datetime = row[DATE_IDX].to_pydatetime()
-            trade_dir: LongShort | None = self.check_for_trade_entry(row)
+            self._process_pair_candle(row, pair, row_index, current_time, current_time == end_date)
 
-            if (
-                (trade_dir is not None or len(LocalTrade.bt_trades_open_pp[pair]) > 0)
-                and self.timeframe_detail
-                and pair in self.detail_data
-            ):
-                # Spread out into detail timeframe.
-                # Should only happen when we are either in a trade for this pair
-                # or when we got the signal for a new trade.
-                exit_candle_end = current_detail_time + self.timeframe_td
-
-                detail_data = self.detail_data[pair]
-                detail_data = detail_data.loc[
-                    (detail_data["date"] >= current_detail_time)
-                    & (detail_data["date"] < exit_candle_end)
-                ].copy()
-                if len(detail_data) == 0:
-                    # Fall back to "regular" data if no detail data was found for this candle
-                    self.dataprovider._set_dataframe_max_date(current_time)
-                    self.backtest_loop(row, pair, current_time, trade_dir, not is_last_row)
+        self.handle_left_open(LocalTrade.bt_trades_open_pp, data=data)
+
+    def _backtest_arrays(self, processed: dict, start_date: datetime, end_date: datetime) -> None:
+        """
+        Columnar backtest engine.
+        Produces the same results as `_backtest_lists()`, but only processes a pair on candles
+        where it has an entry signal or an open trade.
+        Candles on which no pair can change state are skipped entirely, unless the strategy
+        implements `bot_loop_start()`.
+        """
+        arrays = self._get_reusable_signal_data(processed, self._get_ohlcv_as_arrays)
+        pairs = list(arrays.keys())
+
+        start_ns = Timestamp(start_date).value
+        increment_ns = int(self.timeframe_secs * 1e9)
+        for pair_data in arrays.values():
+            pair_data.assign_ticks(start_ns, increment_ns)
+        # Plain lists are faster to index from python
+        event_ticks, event_pairs = (e.tolist() for e in build_entry_events(arrays, self._can_short))
+        event_pos = 0
+        event_cnt = len(event_ticks)
+
+        total_ticks = int((end_date - start_date) / self.timeframe_td)
+        self.progress.init_step(BacktestState.BACKTEST, total_ticks)
+        skip_idle = self._can_skip_idle_candles()
+        scanner = ExitScanner(self.strategy) if self._can_fast_forward_trades() else None
+        # Pairs whose open trade can't exit before a given row: {pair: (first skipped row, row)}
+        forwarded: dict[str, tuple[int, int]] = {}
+
+        tick = 1
+        while tick <= total_ticks:
+            current_time = start_date + self.timeframe_td * tick
+            self._start_candle(current_time)
+
+            # Pairs that have open trades should be processed first
+            active = [t.pair for t in LocalTrade.bt_trades_open]
+            while event_pos < event_cnt and event_ticks[event_pos] == tick:
+                active.append(pairs[event_pairs[event_pos]])
+                event_pos += 1
+
+            for pair in dict.fromkeys(active):
+                if pair not in arrays:
+                    continue
+                pair_data = arrays[pair]
+                i = pair_data.row_at_tick(tick)
+                if i < 0:
                     continue
-                detail_data.loc[:, "enter_long"] = row[LONG_IDX]
-                detail_data.loc[:, "exit_long"] = row[ELONG_IDX]
-                detail_data.loc[:, "enter_short"] = row[SHORT_IDX]
-                detail_data.loc[:, "exit_short"] = row[ESHORT_IDX]
-                detail_data.loc[:, "enter_tag"] = row[ENTER_TAG_IDX]
-                detail_data.loc[:, "exit_tag"] = row[EXIT_TAG_IDX]
-                is_first = True
-                current_time_det = current_time
-                for det_row in detail_data[HEADERS].values.tolist():
-                    self.dataprovider._set_dataframe_max_date(current_time_det)
-                    self.backtest_loop(
-                        det_row,
-                        pair,
-                        current_time_det,
-                        trade_dir,
-                        is_first and not is_last_row,
+                if pair in forwarded:
+                    skipped_from, resume_row = forwarded[pair]
+                    if i < resume_row:
+                        continue
+                    del forwarded[pair]
+                    trade = LocalTrade.bt_trades_open_pp[pair][0]
+                    self._catch_up_trade(trade, pair_data, skipped_from, i, start_date)
+                self._process_pair_candle(
+                    pair_data.row(i), pair, i + 1, current_time, current_time == end_date
+                )
+                if scanner is not None:
+                    self._fast_forward_trade(scanner, pair, pair_data, i, forwarded)
+
+            if skip_idle:
+                # Jump straight to the next candle which can change state - which is either
+                # the next entry candidate or the next candle of a pair with an open trade.
+                next_tick = event_ticks[event_pos] if event_pos < event_cnt else total_ticks + 1
+                for pair in dict.fromkeys(t.pair for t in LocalTrade.bt_trades_open):
+                    next_tick = min(
+                        next_tick, self._next_trade_tick(arrays[pair], tick, forwarded.get(pair))
                     )
-                    current_time_det += self.timeframe_detail_td
-                    is_first = False
+                tick = max(next_tick, tick + 1)
             else:
-                self.dataprovider._set_dataframe_max_date(current_time)
-                self.backtest_loop(row, pair, current_time, trade_dir, not is_last_row)
+                tick += 1
+            self.progress.set_new_value(min(tick - 1, total_ticks))
+
+        self._catch_up_forwarded_trades(arrays, forwarded, total_ticks, start_date)
+
+        self.handle_left_open(
+            LocalTrade.bt_trades_open_pp,
+            data={
+                pair: [arrays[pair].row(len(arrays[pair]) - 1)]
+                for pair, trades in LocalTrade.bt_trades_open_pp.items()
+                if trades and pair in arrays
+            },
+        )
 
-        self.handle_left_open(LocalTrade.bt_trades_open_pp, data=data)
+    def backtest(self, processed: dict, start_date: datetime, end_date: datetime) -> dict[str, Any]:
+        """
+        Implement backtesting functionality
+
+        NOTE: This method is used by Hyperopt at each iteration. Please keep it optimized.
+        Of course try to not have ugly code. By some accessor are sometime slower than functions.
+        Avoid extensive logging in this method and functions it calls.
+
+        :param processed: a processed dictionary with format {pair, data}, which gets cleared to
+        optimize memory usage!
+        :param start_date: backtesting timerange start datetime
+        :param end_date: backtesting timerange end datetime
+        :return: DataFrame with trades (results of backtesting)
+        """
+        self.prepare_backtest(self.enable_protections)
+        # Ensure wallets are up-to-date (important for --strategy-list)
+        self.wallets.update()
+
+        if self.backtest_engine == "numpy":
+            self._backtest_arrays(processed, start_date, end_date)
+        else:
+            self._backtest_lists(processed, start_date, end_date)
         self.wallets.update()
 
         results = trade_list_to_dataframe(LocalTrade.bt_trades)
@@ -1554,7 +1851,17 @@ class Backtesting:
         self._set_strategy(strat)
 
         # need to reprocess data every time to populate signals
-        preprocessed = self.strategy.advise_all_indicators(data)
+        if self.config.get("backtest_signal_cache", False):
+            if SignalCache.supports_strategy(self.strategy):
+                cache_dir = self.config["user_data_dir"] / "backtest_results" / "signal_cache"
+                preprocessed = SignalCache(cache_dir, self.strategy).analyze(data)
+                self._signals_advised = True
+            else:
+                logger.warning(
+                    f"Signal cache disabled for {strategy_name}, as it uses informative pairs."
+                )
+        if not self._signals_advised:
+            preprocessed = self.strategy.advise_all_indicators(data)
 
         # Trim startup period from analyzed dataframe
         # This only used to determine if trimming would result in an empty dataframe
@@ -1572,11 +1879,14 @@ class Backtesting:
             f"({(max_date - min_date).days} days)."
         )
         # Execute backtest and store results
-        results = self.backtest(
-            processed=preprocessed,
-            start_date=min_date,
-            end_date=max_date,
-        )
+        try:
+            results = self.backtest(
+                processed=preprocessed,
+                start_date=min_date,
+                end_date=max_date,
+            )
+        finally:
+            self._signals_advised = False
         backtest_end_time = datetime.now(timezone.utc)
         results.update(
             {
@@ -0,0 +1,267 @@
+"""
+Columnar (NumPy) representation of the analyzed backtest data.
+Used by the "numpy" backtest engine.
+"""
+
+import sys
+from typing import Any
+
+import numpy as np
+from ccxt import DECIMAL_PLACES, SIGNIFICANT_DIGITS, TICK_SIZE
+from pandas import DataFrame, Timestamp
+
+
+# Bits used in the signal bitmap
+SIGNAL_ENTER_LONG = 1
+SIGNAL_EXIT_LONG = 2
+SIGNAL_ENTER_SHORT = 4
+SIGNAL_EXIT_SHORT = 8
+
+_SIGNAL_BITS = (
+    ("enter_long", SIGNAL_ENTER_LONG),
+    ("exit_long", SIGNAL_EXIT_LONG),
+    ("enter_short", SIGNAL_ENTER_SHORT),
+    ("exit_short", SIGNAL_EXIT_SHORT),
+)
+
+# Tolerance for profit comparisons - trade profits are rounded to 8 decimals
+_PROFIT_EPS = 1e-6
+_MINUTE_NS = 60_000_000_000
+
+
+class PairArrays:
+    """
+    Contiguous arrays for one pair.
+    Rows are materialized (as the tuples used by the list engine) only on demand.
+    """
+
+    __slots__ = (
+        "dates",
+        "open",
+        "high",
+        "low",
+        "close",
+        "signals",
+        "enter_tag",
+        "exit_tag",
+        "ticks",
+    )
+
+    def __init__(self, df: DataFrame) -> None:
+        """
+        :param df: Analyzed dataframe, with signals already shifted.
+        """
+        self.dates: np.ndarray = df["date"].to_numpy(dtype="datetime64[ns]").view("int64")
+        self.open: np.ndarray = df["open"].to_numpy(dtype="float64")
+        self.high: np.ndarray = df["high"].to_numpy(dtype="float64")
+        self.low: np.ndarray = df["low"].to_numpy(dtype="float64")
+        self.close: np.ndarray = df["close"].to_numpy(dtype="float64")
+        signals = np.zeros(len(df), dtype=np.uint8)
+        for col, bit in _SIGNAL_BITS:
+            signals[df[col].to_numpy() == 1] |= bit
+        self.signals: np.ndarray = signals
+        self.enter_tag: np.ndarray = df["enter_tag"].to_numpy(dtype="object")
+        self.exit_tag: np.ndarray = df["exit_tag"].to_numpy(dtype="object")
+        # Position of each row on the shared time axis - set by `assign_ticks()`
+        self.ticks: np.ndarray = np.empty(0, dtype=np.int64)
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def assign_ticks(self, start_ns: int, increment_ns: int) -> None:
+        """
+        Map every row to the (1-based) candle of the shared time axis it's processed on.
+        Mirrors the list engine, which consumes at most one row per pair and candle,
+        and only once the candle date reached the row's date.
+        """
+        idx = np.arange(len(self.dates), dtype=np.int64)
+        earliest = np.maximum(-((start_ns - self.dates) // increment_ns), 1)
+        self.ticks = idx + np.maximum.accumulate(earliest - idx)
+
+    def row_at_tick(self, tick: int) -> int:
+        """
+        Row index processed at this tick, or -1 if this pair has no row for this tick.
+        """
+        i = int(np.searchsorted(self.ticks, tick))
+        if i < len(self.ticks) and self.ticks[i] == tick:
+            return i
+        return -1
+
+    def next_tick(self, tick: int) -> int:
+        """
+        First tick after `tick` with a row for this pair - or `sys.maxsize` if there is none.
+        """
+        i = int(np.searchsorted(self.ticks, tick, side="right"))
+        if i < len(self.ticks):
+            return int(self.ticks[i])
+        return sys.maxsize
+
+    def tick_at_row(self, i: int) -> int:
+        """
+        Tick row i is processed on - or `sys.maxsize` if there is no such row.
+        """
+        if i < len(self.ticks):
+            return int(self.ticks[i])
+        return sys.maxsize
+
+    def entry_candidates(self, can_short: bool) -> np.ndarray:
+        """
+        Rows on which `Backtesting.check_for_trade_entry()` can return a direction.
+        """
+        sig = self.signals
+        enter_long = (sig & SIGNAL_ENTER_LONG) > 0
+        exit_long = (sig & SIGNAL_EXIT_LONG) > 0
+        if not can_short:
+            return enter_long & ~exit_long
+        enter_short = (sig & SIGNAL_ENTER_SHORT) > 0
+        exit_short = (sig & SIGNAL_EXIT_SHORT) > 0
+        return (enter_long & ~(exit_long | enter_short)) | (
+            enter_short & ~(exit_short | enter_long)
+        )
+
+    def row(self, i: int) -> tuple:
+        """
+        Materialize row i in the format used by the list engine (see `backtesting.HEADERS`).
+        """
+        sig = int(self.signals[i])
+        return (
+            Timestamp(int(self.dates[i]), tz="UTC"),
+            float(self.open[i]),
+            float(self.high[i]),
+            float(self.low[i]),
+            float(self.close[i]),
+            1 if sig & SIGNAL_ENTER_LONG else 0,
+            1 if sig & SIGNAL_EXIT_LONG else 0,
+            1 if sig & SIGNAL_ENTER_SHORT else 0,
+            1 if sig & SIGNAL_EXIT_SHORT else 0,
+            self.enter_tag[i],
+            self.exit_tag[i],
+        )
+
+
+def build_entry_events(
+    arrays: dict[str, PairArrays], can_short: bool
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Combine the entry candidates of all pairs into one event list, sorted by tick and
+    (within one tick) by pair order.
+    :return: Tuple of (ticks, pair indexes)
+    """
+    ticks = []
+    pair_idx = []
+    for idx, pair_arrays in enumerate(arrays.values()):
+        cand_ticks = pair_arrays.ticks[pair_arrays.entry_candidates(can_short)]
+        ticks.append(cand_ticks)
+        pair_idx.append(np.full(len(cand_ticks), idx, dtype=np.int64))
+    if not ticks:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    all_ticks = np.concatenate(ticks)
+    all_pairs = np.concatenate(pair_idx)
+    order = np.lexsort((all_pairs, all_ticks))
+    return all_ticks[order], all_pairs[order]
+
+
+def _price_step(prices: np.ndarray, precision: float | None, precision_mode: int | None):
+    """
+    Upper bound of the amount `price_to_precision()` can round a price up by.
+    """
+    if precision is None or precision_mode is None:
+        return 0.0
+    if precision_mode == TICK_SIZE:
+        return precision
+    if precision_mode == DECIMAL_PLACES:
+        return 10.0**-precision
+    if precision_mode == SIGNIFICANT_DIGITS:
+        return np.abs(prices) * 10.0 ** (1 - precision)
+    return 0.0
+
+
+class ExitScanner:
+    """
+    Vectorized search for the next candle on which an open (spot, long) trade may exit,
+    based on exit signals, ROI and the (trailing) stoploss of the strategy.
+    The search is conservative - it may return candles on which the trade won't exit,
+    but will never skip a candle on which it does.
+    Only valid for strategies that don't use callbacks which may cause an exit or modify
+    the trade (custom_stoploss, custom_exit, position adjustment).
+    """
+
+    # Number of candles checked in the first scan window. Grows for every further window.
+    CHUNK_SIZE = 64
+
+    def __init__(self, strategy: Any) -> None:
+        roi = sorted(strategy.minimal_roi.items())
+        self.roi_keys = np.array([int(k) for k, _ in roi], dtype=np.int64)
+        self.roi_values = np.array([float(v) for _, v in roi], dtype=np.float64)
+        self.stoploss = abs(strategy.stoploss)
+        self.trailing_stop = strategy.trailing_stop
+        self.trailing_stop_positive = strategy.trailing_stop_positive
+        self.trailing_offset = strategy.trailing_stop_positive_offset
+        self.trailing_only_offset = strategy.trailing_only_offset_is_reached
+        self.use_exit_signal = strategy.use_exit_signal
+
+    def first_candidate(self, pair_data: PairArrays, start: int, trade: Any) -> int:
+        """
+        First row (starting at `start`) on which the trade may exit.
+        :return: Row index - or `len(pair_data)` if the trade can't exit on the remaining rows.
+        """
+        size = len(pair_data)
+        stop = trade.stop_loss
+        chunk = self.CHUNK_SIZE
+        while start < size:
+            end = min(start + chunk, size)
+            hits, stop = self._scan(pair_data, start, end, trade, stop)
+            if hits.any():
+                return start + int(hits.argmax())
+            start = end
+            chunk *= 4
+        return size
+
+    def _scan(
+        self, pair_data: PairArrays, start: int, end: int, trade: Any, stop: float
+    ) -> tuple[np.ndarray, float]:
+        """
+        Flag possible exits on rows start to end (exclusive).
+        :param stop: Upper bound of the stoploss before row `start`
+        :return: Tuple of (flags, upper bound of the stoploss after the last row)
+        """
+        high = pair_data.high[start:end]
+        low = pair_data.low[start:end]
+        profit_high = (
+            high
+            * (1 - (trade.fee_close or 0.0))
+            / (trade.open_rate * (1 + (trade.fee_open or 0.0)))
+            - 1
+        )
+
+        hits = np.zeros(end - start, dtype=np.bool_)
+        if self.use_exit_signal:
+            hits |= (pair_data.signals[start:end] & SIGNAL_EXIT_LONG) > 0
+
+        if len(self.roi_keys):
+            open_ns = Timestamp(trade.open_date_utc).value
+            trade_dur = (pair_data.dates[start:end] - open_ns) // _MINUTE_NS
+            roi_idx = np.searchsorted(self.roi_keys, trade_dur, side="right") - 1
+            roi = np.where(roi_idx >= 0, self.roi_values[np.maximum(roi_idx, 0)], np.inf)
+            hits |= profit_high > roi - _PROFIT_EPS
+
+        stops = np.full(end - start, stop, dtype=np.float64)
+        if self.trailing_stop:
+            # Stoploss each candle would trail to. Ambiguous cases (profit too close to
+            # the offset) use the higher of both possible values.
+            above = profit_high > self.trailing_offset + _PROFIT_EPS
+            below = profit_high < self.trailing_offset - _PROFIT_EPS
+            dist_above = (
+                self.trailing_stop_positive
+                if self.trailing_stop_positive is not None
+                else self.stoploss
+            )
+            dist = np.where(above, dist_above, self.stoploss)
+            dist = np.where(above | below, dist, min(dist_above, self.stoploss))
+            trailed = high * (1 - dist)
+            trailed += _price_step(trailed, trade.price_precision, trade.precision_mode_price)
+            if self.trailing_only_offset:
+                trailed = np.where(below, -np.inf, trailed)
+            stops = np.maximum(stops, np.maximum.accumulate(trailed))
+        hits |= low <= stops * (1 + 1e-9)
+        return hits, float(stops[-1]) if len(stops) else stop
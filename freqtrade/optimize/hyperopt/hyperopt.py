@@ -14,14 +14,16 @@ from pathlib import Path
 from typing import Any
 
 import rapidjson
-from joblib import Parallel, cpu_count, delayed, wrap_non_picklable_objects
+from joblib import cpu_count, effective_n_jobs
 from joblib.externals import cloudpickle
+from joblib.externals.loky import ProcessPoolExecutor
 from rich.console import Console
 
 from freqtrade.constants import FTHYPT_FILEVERSION, LAST_BT_RESULT_FN, Config
 from freqtrade.enums import HyperoptState
 from freqtrade.exceptions import OperationalException
 from freqtrade.misc import file_dump_json, plural
+from freqtrade.optimize.hyperopt.hyperopt_data_store import HyperoptDataStore
 from freqtrade.optimize.hyperopt.hyperopt_logger import logging_mp_handle, logging_mp_setup
 from freqtrade.optimize.hyperopt.hyperopt_optimizer import HyperOptimizer
 from freqtrade.optimize.hyperopt.hyperopt_output import HyperoptOutput
@@ -44,6 +46,27 @@ SKOPT_MODEL_QUEUE_SIZE = 10
 
 log_queue: Any
 
+# HyperOptimizer of a worker process - sent to each worker once, when the worker starts.
+_worker_hyperopter: HyperOptimizer | None = None
+
+
+def _init_worker(hyperopter: HyperOptimizer, queue: Any, verbosity: int) -> None:
+    """
+    Initialize a hyperopt worker process.
+    """
+    global _worker_hyperopter
+    logging_mp_setup(queue, verbosity)
+    _worker_hyperopter = hyperopter
+
+
+def _run_worker_epoch(raw_params: list[Any]) -> dict[str, Any]:
+    """
+    Evaluate one epoch in a worker process initialized by `_init_worker()`.
+    """
+    if _worker_hyperopter is None:
+        raise OperationalException("Hyperopt worker has not been initialized.")
+    return _worker_hyperopter.generate_optimizer(raw_params)
+
 
 class Hyperopt:
     """
@@ -78,6 +101,9 @@ class Hyperopt:
         self.data_pickle_file = (
             self.config["user_data_dir"] / "hyperopt_results" / "hyperopt_tickerdata.pkl"
         )
+        self.data_store_dir = (
+            self.config["user_data_dir"] / "hyperopt_results" / "hyperopt_tickerdata"
+        )
         self.total_epochs = config.get("epochs", 0)
 
         self.current_best_loss = 100
@@ -111,6 +137,7 @@ class Hyperopt:
             if p.is_file():
                 logger.info(f"Removing `{p}`.")
                 p.unlink()
+        HyperoptDataStore(self.data_store_dir).clear()
 
     def hyperopt_pickle_magic(self, bases) -> None:
         """
@@ -164,18 +191,33 @@ class Hyperopt:
                 self.print_all,
             )
 
-    def run_optimizer_parallel(self, parallel: Parallel, asked: list[list]) -> list[dict[str, Any]]:
-        """Start optimizer in a parallel way"""
-
-        def optimizer_wrapper(*args, **kwargs):
-            # global log queue. This must happen in the file that initializes Parallel
-            logging_mp_setup(
-                log_queue, logging.INFO if self.config["verbosity"] < 1 else logging.DEBUG
-            )
-
-            return self.hyperopter.generate_optimizer(*args, **kwargs)
+    def _start_worker_pool(self, jobs: int) -> ProcessPoolExecutor | None:
+        """
+        Create the pool of worker processes.
+        Workers receive the prepared HyperOptimizer once, when they start - and keep it
+        (including strategy, data and Backtesting instance) for all epochs they evaluate.
+        :return: Executor - or None if epochs should be evaluated in this process.
+        """
+        if jobs == 1:
+            return None
+        return ProcessPoolExecutor(
+            max_workers=jobs,
+            initializer=_init_worker,
+            initargs=(
+                self.hyperopter,
+                log_queue,
+                logging.INFO if self.config["verbosity"] < 1 else logging.DEBUG,
+            ),
+        )
 
-        return parallel(delayed(wrap_non_picklable_objects(optimizer_wrapper))(v) for v in asked)
+    def run_optimizer_parallel(
+        self, executor: ProcessPoolExecutor | None, asked: list[list]
+    ) -> list[dict[str, Any]]:
+        """Start optimizer in a parallel way"""
+        if executor is None:
+            return [self.hyperopter.generate_optimizer(v) for v in asked]
+        # Only the parameters are sent to the workers, results are returned in order.
+        return list(executor.map(_run_worker_epoch, asked))
 
     def _set_random_state(self, random_state: int | None) -> int:
         return random_state or random.randint(1, 2**16 - 1)  # noqa: S311
@@ -277,54 +319,60 @@ class Hyperopt:
             config_jobs, self.random_state, INITIAL_POINTS, SKOPT_MODEL_QUEUE_SIZE
         )
         self._setup_logging_mp_workaround()
+        jobs = effective_n_jobs(config_jobs)
+        logger.info(f"Effective number of parallel workers used: {jobs}")
+        executor: ProcessPoolExecutor | None = None
         try:
-            with Parallel(n_jobs=config_jobs) as parallel:
-                jobs = parallel._effective_n_jobs()
-                logger.info(f"Effective number of parallel workers used: {jobs}")
-                console = Console(
-                    color_system="auto" if self.print_colorized else None,
-                )
-
-                # Define progressbar
-                with get_progress_tracker(
-                    console=console,
-                    cust_callables=[self._hyper_out],
-                ) as pbar:
-                    task = pbar.add_task("Epochs", total=self.total_epochs)
-
-                    start = 0
-
-                    if self.analyze_per_epoch:
-                        # First analysis not in parallel mode when using --analyze-per-epoch.
-                        # This allows dataprovider to load it's informative cache.
-                        asked, is_random = self.get_asked_points(n_points=1)
-                        f_val0 = self.hyperopter.generate_optimizer(asked[0])
-                        self.opt.tell(asked, [f_val0["loss"]])
-                        self.evaluate_result(f_val0, 1, is_random[0])
-                        pbar.update(task, advance=1)
-                        start += 1
-
-                    evals = ceil((self.total_epochs - start) / jobs)
-                    for i in range(evals):
-                        # Correct the number of epochs to be processed for the last
-                        # iteration (should not exceed self.total_epochs in total)
-                        n_rest = (i + 1) * jobs - (self.total_epochs - start)
-                        current_jobs = jobs - n_rest if n_rest > 0 else jobs
-
-                        asked, is_random = self.get_asked_points(n_points=current_jobs)
-                        f_val = self.run_optimizer_parallel(parallel, asked)
-                        self.opt.tell(asked, [v["loss"] for v in f_val])
-
-                        for j, val in enumerate(f_val):
-                            # Use human-friendly indexes here (starting from 1)
-                            current = i * jobs + j + 1 + start
+            console = Console(
+                color_system="auto" if self.print_colorized else None,
+            )
 
-                            self.evaluate_result(val, current, is_random[j])
-                            pbar.update(task, advance=1)
-                        logging_mp_handle(log_queue)
+            # Define progressbar
+            with get_progress_tracker(
+                console=console,
+                cust_callables=[self._hyper_out],
+            ) as pbar:
+                task = pbar.add_task("Epochs", total=self.total_epochs)
+
+                start = 0
+
+                if self.analyze_per_epoch:
+                    # First analysis not in parallel mode when using --analyze-per-epoch.
+                    # This allows dataprovider to load it's informative cache.
+                    asked, is_random = self.get_asked_points(n_points=1)
+                    f_val0 = self.hyperopter.generate_optimizer(asked[0])
+                    self.opt.tell(asked, [f_val0["loss"]])
+                    self.evaluate_result(f_val0, 1, is_random[0])
+                    pbar.update(task, advance=1)
+                    start += 1
+
+                # Workers are started after the first (in process) analysis, so they
+                # receive the dataprovider cache loaded by it.
+                executor = self._start_worker_pool(jobs)
+                evals = ceil((self.total_epochs - start) / jobs)
+                for i in range(evals):
+                    # Correct the number of epochs to be processed for the last
+                    # iteration (should not exceed self.total_epochs in total)
+                    n_rest = (i + 1) * jobs - (self.total_epochs - start)
+                    current_jobs = jobs - n_rest if n_rest > 0 else jobs
+
+                    asked, is_random = self.get_asked_points(n_points=current_jobs)
+                    f_val = self.run_optimizer_parallel(executor, asked)
+                    self.opt.tell(asked, [v["loss"] for v in f_val])
+
+                    for j, val in enumerate(f_val):
+                        # Use human-friendly indexes here (starting from 1)
+                        current = i * jobs + j + 1 + start
+
+                        self.evaluate_result(val, current, is_random[j])
+                        pbar.update(task, advance=1)
+                    logging_mp_handle(log_queue)
 
         except KeyboardInterrupt:
             print("User interrupted..")
+        finally:
+            if executor is not None:
+                executor.shutdown(kill_workers=True)
 
         logger.info(
             f"{self.num_epochs_saved} {plural(self.num_epochs_saved, 'epoch')} "
@@ -0,0 +1,133 @@
+"""
+Memory-mapped columnar store for the data used by hyperopt.
+The data is written once, and all hyperopt worker processes attach to the same files -
+numeric columns are therefore shared between workers instead of being copied into each of them.
+"""
+
+import logging
+import shutil
+from pathlib import Path
+from typing import Any
+from uuid import uuid4
+
+import numpy as np
+from joblib import dump, load
+from pandas import DataFrame, Index, Series
+
+
+logger = logging.getLogger(__name__)
+
+META_FILE = "meta.pkl"
+
+# Data attached by the current process - {store directory: (store id, attached data)}
+_attached: dict[Path, tuple[str, dict]] = {}
+
+
+def _is_mappable(dtype: Any) -> bool:
+    return isinstance(dtype, np.dtype) and dtype.kind in "biuf"
+
+
+class HyperoptDataStore:
+    """
+    Stores one dataframe per pair.
+    Consecutive columns of the same numeric dtype are stored as one 2D array, which is
+    memory-mapped on load - columns of the resulting dataframes are views into this array.
+    All other columns (dates, strings, ...) are pickled and loaded as regular copies.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = directory
+
+    def clear(self) -> None:
+        """
+        Remove the store from disk.
+        """
+        if self.directory.is_dir():
+            logger.info(f"Removing `{self.directory}`.")
+            shutil.rmtree(self.directory)
+
+    def dump(self, data: dict[str, DataFrame]) -> None:
+        """
+        Write data to the store, replacing previous content.
+        """
+        self.clear()
+        self.directory.mkdir(parents=True)
+        pairs = []
+        for pair_idx, (pair, df) in enumerate(data.items()):
+            segments = []
+            for seg_idx, (mappable, columns) in enumerate(self._split_columns(df)):
+                filename = f"{pair_idx}_{seg_idx}"
+                if mappable:
+                    # Store column-wise, so every column is contiguous
+                    values = np.ascontiguousarray(df[columns].to_numpy().T)
+                    np.save(self.directory / f"{filename}.npy", values)
+                else:
+                    dump(df[columns], self.directory / f"{filename}.pkl")
+                segments.append((filename, mappable, columns))
+            pairs.append((pair, df.index, segments))
+        # Written last - the store is only valid once this file exists
+        dump({"id": uuid4().hex, "pairs": pairs}, self.directory / META_FILE)
+
+    @staticmethod
+    def _split_columns(df: DataFrame) -> list[tuple[bool, list]]:
+        """
+        Split columns into runs of columns with identical dtype, keeping the column order.
+        :return: List of (mappable, columns)
+        """
+        runs: list[tuple[bool, list]] = []
+        last_dtype = None
+        for col, dtype in df.dtypes.items():
+            mappable = _is_mappable(dtype) and len(df) > 0
+            if runs and mappable and runs[-1][0] and dtype == last_dtype:
+                runs[-1][1].append(col)
+            elif runs and not mappable and not runs[-1][0]:
+                runs[-1][1].append(col)
+            else:
+                runs.append((mappable, [col]))
+            last_dtype = dtype
+        return runs
+
+    def load(self) -> dict[str, DataFrame]:
+        """
+        Load data from the store.
+        Memory maps are only created once per process (and store content) - subsequent calls
+        only assemble the dataframes. Columns can be added to the returned dataframes without
+        affecting later calls. Memory-mapped columns are read-only (as with the memory-mapped
+        pickle file used by default).
+        """
+        meta = load(self.directory / META_FILE)
+        attached = _attached.get(self.directory)
+        if attached is None or attached[0] != meta["id"]:
+            attached = (meta["id"], self._attach(meta))
+            _attached[self.directory] = attached
+
+        result = {}
+        for pair, (index, columns) in attached[1].items():
+            result[pair] = DataFrame(
+                {
+                    col: values if isinstance(values, np.ndarray) else values.copy()
+                    for col, values in columns.items()
+                },
+                index=index,
+                copy=False,
+            )
+        return result
+
+    def _attach(self, meta: dict) -> dict[str, tuple[Index, dict[Any, np.ndarray | Series]]]:
+        """
+        Map all arrays of the store.
+        :return: {pair: (index, {column: values})}
+        """
+        data = {}
+        for pair, index, segments in meta["pairs"]:
+            columns: dict[Any, np.ndarray | Series] = {}
+            for filename, mappable, segment_columns in segments:
+                if mappable:
+                    values = np.load(self.directory / f"{filename}.npy", mmap_mode="r")
+                    # Plain ndarray views - pandas shouldn't need to know about memmap
+                    columns.update(zip(segment_columns, np.asarray(values), strict=True))
+                else:
+                    df = load(self.directory / f"{filename}.pkl")
+                    columns.update((col, df[col].set_axis(index)) for col in segment_columns)
+            data[pair] = (index, columns)
+        return data
@@ -10,10 +10,9 @@ logger = logging.getLogger(__name__)
 def logging_mp_setup(log_queue: Queue, verbosity: int):
     """
     Setup logging in a child process.
-    Must be called in the child process before logging.
-    log_queue MUST be passed to the child process via inheritance
-        Which essentially means that the log_queue must be a global, created in the same
-        file as Parallel is initialized.
+    Must be called once in the child process before logging.
+    log_queue must be a queue which can be shared with child processes (e.g. a Manager queue),
+        passed to the worker processes when they start.
     """
     current_proc = current_process().name
     if current_proc != "MainProcess":
@@ -24,6 +24,7 @@ from freqtrade.optimize.backtesting import Backtesting
 
 # Import IHyperOptLoss to allow unpickling classes from these modules
 from freqtrade.optimize.hyperopt.hyperopt_auto import HyperOptAuto
+from freqtrade.optimize.hyperopt.hyperopt_data_store import HyperoptDataStore
 from freqtrade.optimize.hyperopt_loss.hyperopt_loss_interface import IHyperOptLoss
 from freqtrade.optimize.hyperopt_tools import HyperoptStateContainer, HyperoptTools
 from freqtrade.optimize.optimize_reports import generate_strategy_stats
@@ -88,6 +89,11 @@ class HyperOptimizer:
         self.data_pickle_file = (
             self.config["user_data_dir"] / "hyperopt_results" / "hyperopt_tickerdata.pkl"
         )
+        self.data_store: HyperoptDataStore | None = None
+        if self.config.get("hyperopt_data_store", "pickle") == "memmap":
+            self.data_store = HyperoptDataStore(
+                self.config["user_data_dir"] / "hyperopt_results" / "hyperopt_tickerdata"
+            )
 
         self.market_change = 0.0
 
@@ -234,6 +240,9 @@ class HyperOptimizer:
             + self.trailing_space
             + self.max_open_trades_space
         )
+        # Signals only depend on buy / sell parameters - if none of them are optimized,
+        # all epochs can use the signals calculated by the first epoch.
+        self.backtesting.reuse_signals = not (self.buy_space or self.sell_space)
 
     def assign_params(self, params_dict: dict[str, Any], category: str) -> None:
         """
@@ -300,8 +309,9 @@ class HyperOptimizer:
 
             self.backtesting.strategy.max_open_trades = updated_max_open_trades
 
-        with self.data_pickle_file.open("rb") as f:
-            processed = load(f, mmap_mode="r")
+        processed: dict[str, DataFrame] = {}
+        if not self.backtesting.has_signal_data:
+            processed = self._load_data()
             if self.analyze_per_epoch:
                 # Data is not yet analyzed, rerun populate_indicators.
                 processed = self.advise_and_trim(processed)
@@ -418,6 +428,24 @@ class HyperOptimizer:
         # Real trimming will happen as part of backtesting.
         return preprocessed
 
+    def _dump_data(self, data: dict[str, DataFrame]) -> None:
+        """
+        Store data for the worker processes.
+        """
+        if self.data_store:
+            self.data_store.dump(data)
+        else:
+            dump(data, self.data_pickle_file)
+
+    def _load_data(self) -> dict[str, DataFrame]:
+        """
+        Load the data stored by `_dump_data()`.
+        """
+        if self.data_store:
+            return self.data_store.load()
+        with self.data_pickle_file.open("rb") as f:
+            return load(f, mmap_mode="r")
+
     def prepare_hyperopt_data(self) -> None:
         HyperoptStateContainer.set_state(HyperoptState.DATALOAD)
         data, self.timerange = self.backtesting.load_bt_data()
@@ -436,6 +464,6 @@ class HyperOptimizer:
                 f"({(self.max_date - self.min_date).days} days).."
             )
             # Store non-trimmed data - will be trimmed after signal generation.
-            dump(preprocessed, self.data_pickle_file)
+            self._dump_data(preprocessed)
         else:
-            dump(data, self.data_pickle_file)
+            self._dump_data(data)
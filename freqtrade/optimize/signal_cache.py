@@ -0,0 +1,105 @@
+"""
+Per-pair on-disk cache of analyzed dataframes (indicators and signals) used by backtesting.
+"""
+
+import logging
+from pathlib import Path
+
+from joblib import dump, load
+from pandas import DataFrame, concat
+
+from freqtrade.constants import DEFAULT_DATAFRAME_COLUMNS
+from freqtrade.misc import pair_to_filename
+from freqtrade.optimize.backtest_caching import get_strategy_signal_id
+from freqtrade.strategy.interface import IStrategy
+
+
+logger = logging.getLogger(__name__)
+
+
+class SignalCache:
+    """
+    Stores the analyzed dataframe of every pair, keyed by a hash of strategy, parameters and
+    (signal relevant) configuration.
+    Cached dataframes are reused as long as their candles match the candles to analyze:
+    * Identical or shorter data (same start): The cached dataframe is reused (and cut).
+    * Longer data (same start): Only new candles (plus `startup_candle_count` candles
+      before them) are analyzed, and appended to the cached dataframe.
+    In all other cases, the pair is analyzed again.
+    """
+
+    def __init__(self, directory: Path, strategy: IStrategy) -> None:
+        self.strategy = strategy
+        self.directory = directory / get_strategy_signal_id(strategy)
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def supports_strategy(strategy: IStrategy) -> bool:
+        """
+        Informative pairs are not part of the cache key - so strategies using them can't
+        be cached.
+        """
+        return not strategy.informative_pairs() and not strategy._ft_informative
+
+    def analyze(self, data: dict[str, DataFrame]) -> dict[str, DataFrame]:
+        """
+        Analyze all pairs - advising indicators and signals - using the cache where possible.
+        :param data: Candle data per pair
+        :return: Analyzed dataframes per pair
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        result = {pair: self._analyze_pair(pair, df) for pair, df in data.items()}
+        logger.info(
+            f"Signal cache: reused {self.hits} pair(s), analyzed {self.misses} pair(s) "
+            "(fully or partially)."
+        )
+        return result
+
+    def _pair_file(self, pair: str) -> Path:
+        return self.directory / f"{pair_to_filename(pair)}-{self.strategy.timeframe}.pkl"
+
+    def _advise(self, pair: str, df: DataFrame) -> DataFrame:
+        metadata = {"pair": pair}
+        analyzed = self.strategy.advise_indicators(df.copy(), metadata).copy()
+        return self.strategy.ft_advise_signals(analyzed, metadata)
+
+    def _analyze_pair(self, pair: str, df: DataFrame) -> DataFrame:
+        file = self._pair_file(pair)
+        cached = load(file) if file.is_file() else None
+        analyzed = self._from_cache(pair, df, cached) if cached is not None else None
+        if analyzed is None:
+            self.misses += 1
+            analyzed = self._advise(pair, df)
+            dump(analyzed, file)
+        return analyzed
+
+    def _from_cache(self, pair: str, df: DataFrame, cached: DataFrame) -> DataFrame | None:
+        """
+        Build the analyzed dataframe from the cached dataframe.
+        :return: Analyzed dataframe, or None if the cached dataframe can't be used.
+        """
+        overlap = min(len(df), len(cached))
+        if overlap == 0 or not (
+            df[DEFAULT_DATAFRAME_COLUMNS]
+            .iloc[:overlap]
+            .reset_index(drop=True)
+            .equals(cached[DEFAULT_DATAFRAME_COLUMNS].iloc[:overlap].reset_index(drop=True))
+        ):
+            return None
+
+        if len(df) <= len(cached):
+            self.hits += 1
+            return cached.iloc[: len(df)].set_axis(df.index).copy()
+
+        # Analyze new candles only - using the startup period before them as history.
+        tail_start = max(len(cached) - self.strategy.startup_candle_count, 0)
+        tail = self._advise(pair, df.iloc[tail_start:])
+        if list(tail.columns) != list(cached.columns):
+            return None
+        self.misses += 1
+        analyzed = concat(
+            [cached, tail.iloc[len(cached) - tail_start :]], ignore_index=True
+        ).set_axis(df.index)
+        dump(analyzed, self._pair_file(pair))
+        return analyzed
@@ -287,6 +287,16 @@ def migrate_pairlocks_table(decl_base, inspector, engine, pairlock_back_name: st
         )
 
 
+def create_missing_indexes(engine):
+    """
+    Create indexes added to existing tables
+    (create_all() only creates indexes together with their table).
+    """
+    for table in (Trade.__table__, Order.__table__):
+        for index in table.indexes:
+            index.create(engine, checkfirst=True)
+
+
 def set_sqlite_to_wal(engine):
     if engine.name == "sqlite" and str(engine.url) != "sqlite://":
         # Set Mode to
@@ -381,6 +391,7 @@ def check_migrate(engine, decl_base, previous_tables) -> None:
             "start with a fresh database."
         )
 
+    create_missing_indexes(engine)
     set_sqlite_to_wal(engine)
     fix_old_dry_orders(engine)
 
@@ -7,7 +7,7 @@ import threading
 from contextvars import ContextVar
 from typing import Any, Final
 
-from sqlalchemy import create_engine, inspect
+from sqlalchemy import create_engine, inspect, select
 from sqlalchemy.exc import NoSuchModuleError
 from sqlalchemy.orm import scoped_session, sessionmaker
 from sqlalchemy.pool import StaticPool
@@ -18,7 +18,14 @@ from freqtrade.persistence.custom_data import _CustomData
 from freqtrade.persistence.key_value_store import _KeyValueStoreModel
 from freqtrade.persistence.migrations import check_migrate
 from freqtrade.persistence.pairlock import PairLock
+from freqtrade.persistence.session_registry import (
+    ACTIVE_LOCKS,
+    OPEN_TRADES,
+    TrackedModel,
+    init_session_registries,
+)
 from freqtrade.persistence.trade_model import Order, Trade
+from freqtrade.util import dt_now
 
 
 logger = logging.getLogger(__name__)
@@ -82,9 +89,27 @@ def init_db(db_url: str) -> None:
     # https://docs.sqlalchemy.org/en/13/orm/contextual.html#thread-local-scope
     # Scoped sessions proxy requests to the appropriate thread-local session.
     # Since we also use fastAPI, we need to make it aware of the request id, too
-    Trade.session = scoped_session(
-        sessionmaker(bind=engine, autoflush=False), scopefunc=get_request_or_thread_id
+    # Objects are not expired on commit, so open trades and active locks can be kept
+    # in memory. Changes committed by other sessions expire all objects of a session instead.
+    session_factory = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+    init_session_registries(
+        session_factory,
+        {
+            OPEN_TRADES: TrackedModel(
+                Trade,
+                lambda trade: trade.is_open,
+                lambda: select(Trade).filter(Trade.is_open.is_(True)),
+            ),
+            ACTIVE_LOCKS: TrackedModel(
+                PairLock,
+                lambda lock: lock.active,
+                lambda: select(PairLock).filter(
+                    PairLock.active.is_(True), PairLock.lock_end_time > dt_now()
+                ),
+            ),
+        },
     )
+    Trade.session = scoped_session(session_factory, scopefunc=get_request_or_thread_id)
     Order.session = Trade.session
     PairLock.session = Trade.session
     _KeyValueStoreModel.session = Trade.session
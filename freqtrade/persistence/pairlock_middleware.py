@@ -6,6 +6,7 @@ from sqlalchemy import select
 
 from freqtrade.exchange import timeframe_to_next_date
 from freqtrade.persistence.models import PairLock
+from freqtrade.persistence.session_registry import ACTIVE_LOCKS, get_registry
 
 
 logger = logging.getLogger(__name__)
@@ -76,12 +77,30 @@ class PairLocks:
                     defaults to datetime.now(timezone.utc)
         :param side: Side get locks for, can be 'long', 'short', '*' or None
         """
-        if not now:
-            now = datetime.now(timezone.utc)
-
         if PairLocks.use_db:
-            return PairLock.query_pair_locks(pair, now, side).all()
+            # Active locks are kept in memory - except locks which had already ended when
+            # the registry was loaded or last pruned. Older points in time use the database.
+            registry = get_registry(PairLock.session(), ACTIVE_LOCKS)
+            current_time = datetime.now(timezone.utc)
+            now = now or current_time
+            if now < registry.info.setdefault("pruned_at", current_time):
+                return PairLock.query_pair_locks(pair, now, side).all()
+
+            locks = []
+            for lock in registry.get(pair or None):
+                lock_end_time = lock.lock_end_time.replace(tzinfo=timezone.utc)
+                if lock_end_time <= current_time:
+                    # Expired - remains active in the database
+                    registry.discard(lock)
+                elif lock_end_time > now and (
+                    side is None or lock.side == "*" or (side != "*" and lock.side == side)
+                ):
+                    locks.append(lock)
+            registry.info["pruned_at"] = current_time
+            return locks
         else:
+            if not now:
+                now = datetime.now(timezone.utc)
             locks = [
                 lock
                 for lock in PairLocks.locks
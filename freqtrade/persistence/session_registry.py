@@ -0,0 +1,170 @@
+"""
+In-memory registries of database objects (open trades, active pair locks),
+kept in sync with the changes flushed by each session.
+"""
+
+from collections import defaultdict
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any
+
+from sqlalchemy import Select, event
+from sqlalchemy.orm import ORMExecuteState, Session, sessionmaker
+
+
+OPEN_TRADES = "open_trades"
+ACTIVE_LOCKS = "active_locks"
+
+_TRACKED_KEY = "ft_tracked_models"
+_REGISTRIES_KEY = "ft_registries"
+_GENERATION_KEY = "ft_generation"
+_CHANGED_KEY = "ft_tracked_changed"
+
+# Incremented whenever a session commits changes.
+# Sessions which didn't do the commit themselves need to reload their objects.
+_generation = 0
+_generation_lock = Lock()
+
+
+@dataclass(frozen=True)
+class TrackedModel:
+    """
+    Model whose objects matching `is_tracked` are kept in a registry
+    """
+
+    model: type
+    is_tracked: Callable[[Any], bool]
+    query: Callable[[], Select]
+
+
+class ObjectRegistry:
+    """
+    Objects of one session, by id and by pair.
+    """
+
+    def __init__(self, objects: Sequence[Any]) -> None:
+        self._objects: dict[int, Any] = {}
+        self._objects_pp: dict[str, dict[int, Any]] = defaultdict(dict)
+        # State of the users of the registry - discarded together with the registry
+        self.info: dict[str, Any] = {}
+        for obj in objects:
+            self.add(obj)
+
+    def add(self, obj: Any) -> None:
+        self._objects[obj.id] = obj
+        self._objects_pp[obj.pair][obj.id] = obj
+
+    def discard(self, obj: Any) -> None:
+        if self._objects.pop(obj.id, None) is not None:
+            pair_objects = self._objects_pp[obj.pair]
+            pair_objects.pop(obj.id, None)
+            if not pair_objects:
+                del self._objects_pp[obj.pair]
+
+    def get(self, pair: str | None = None) -> list[Any]:
+        """
+        Registered objects
+        :param pair: Only return objects of this pair
+        :return: unsorted list of objects
+        """
+        if pair is None:
+            return list(self._objects.values())
+        return list(self._objects_pp.get(pair, {}).values())
+
+    def get_by_id(self, obj_id: int) -> Any | None:
+        return self._objects.get(obj_id)
+
+    def __len__(self) -> int:
+        return len(self._objects)
+
+
+def _sync_generation(session: Session) -> None:
+    """
+    Reload the objects of this session if another session committed changes to
+    tracked models.
+    Pending changes of this session are kept - only the registries are rebuilt then,
+    and the objects are expired on the next sync without pending changes.
+    """
+    generation = _generation
+    if session.info.get(_GENERATION_KEY) == generation:
+        return
+    session.info[_REGISTRIES_KEY] = {}
+    if session.new or session.dirty or session.deleted:
+        return
+    session.expire_all()
+    session.info[_GENERATION_KEY] = generation
+
+
+def get_registry(session: Session, name: str) -> ObjectRegistry:
+    """
+    Registry of the current session, loaded from the database on first use.
+    :param session: Session to use
+    :param name: Name of the tracked model (e.g. OPEN_TRADES)
+    """
+    _sync_generation(session)
+    registries: dict[str, ObjectRegistry] = session.info[_REGISTRIES_KEY]
+    if name not in registries:
+        tracked: TrackedModel = session.info[_TRACKED_KEY][name]
+        registries[name] = ObjectRegistry(session.scalars(tracked.query()).all())
+    return registries[name]
+
+
+def _after_flush(session: Session, flush_context: Any) -> None:
+    session.info[_CHANGED_KEY] = True
+    registries: dict[str, ObjectRegistry] = session.info.get(_REGISTRIES_KEY, {})
+    for name, registry in registries.items():
+        tracked: TrackedModel = session.info[_TRACKED_KEY][name]
+        changed: list[Any] = [
+            obj for obj in session.new | session.dirty if isinstance(obj, tracked.model)
+        ]
+        # Keep objects in order of their id
+        for obj in sorted(changed, key=lambda obj: obj.id):
+            if tracked.is_tracked(obj):
+                registry.add(obj)
+            else:
+                registry.discard(obj)
+        for obj in session.deleted:
+            if isinstance(obj, tracked.model):
+                registry.discard(obj)
+
+
+def _after_commit(session: Session) -> None:
+    global _generation
+    if not session.info.pop(_CHANGED_KEY, False):
+        return
+    with _generation_lock:
+        if session.info.get(_GENERATION_KEY) == _generation:
+            # No other session committed in the meantime - this session is up to date.
+            session.info[_GENERATION_KEY] = _generation + 1
+        _generation += 1
+
+
+def _after_soft_rollback(session: Session, previous_transaction: Any) -> None:
+    session.info.pop(_CHANGED_KEY, None)
+    session.info[_REGISTRIES_KEY] = {}
+
+
+def _do_orm_execute(orm_execute_state: ORMExecuteState) -> None:
+    if (
+        orm_execute_state.is_select
+        and not orm_execute_state.is_relationship_load
+        and not orm_execute_state.is_column_load
+    ):
+        _sync_generation(orm_execute_state.session)
+
+
+def init_session_registries(
+    session_factory: sessionmaker, tracked_models: dict[str, TrackedModel]
+) -> None:
+    """
+    Keep registries of tracked models for all sessions created by this session factory.
+    The session factory must not expire objects on commit.
+    :param session_factory: Session factory
+    :param tracked_models: Tracked models, by registry name
+    """
+    session_factory.kw.setdefault("info", {})[_TRACKED_KEY] = tracked_models
+    event.listen(session_factory, "after_flush", _after_flush)
+    event.listen(session_factory, "after_commit", _after_commit)
+    event.listen(session_factory, "after_soft_rollback", _after_soft_rollback)
+    event.listen(session_factory, "do_orm_execute", _do_orm_execute)
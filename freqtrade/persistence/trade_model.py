@@ -6,14 +6,16 @@ import logging
 from collections import defaultdict
 from collections.abc import Sequence
 from dataclasses import dataclass
-from datetime import datetime, timedelta, timezone
+from datetime import date, datetime, timedelta, timezone
 from math import isclose
 from typing import Any, ClassVar, Optional, cast
 
 from sqlalchemy import (
+    Date,
     Enum,
     Float,
     ForeignKey,
+    Index,
     Integer,
     ScalarResult,
     Select,
@@ -48,6 +50,7 @@ from freqtrade.leverage import interest
 from freqtrade.misc import safe_value_fallback
 from freqtrade.persistence.base import ModelBase, SessionType
 from freqtrade.persistence.custom_data import CustomDataWrapper, _CustomData
+from freqtrade.persistence.session_registry import OPEN_TRADES, get_registry
 from freqtrade.util import FtPrecise, dt_from_ts, dt_now, dt_ts, dt_ts_none
 
 
@@ -1498,9 +1501,7 @@ class LocalTrade:
         get open trade count
         """
         if Trade.use_db:
-            return Trade.session.execute(
-                select(func.count(Trade.id)).filter(Trade.is_open.is_(True))
-            ).scalar_one()
+            return len(get_registry(Trade.session(), OPEN_TRADES))
         else:
             return LocalTrade.bt_open_open_trade_count
 
@@ -1629,6 +1630,10 @@ class Trade(ModelBase, LocalTrade):
     """
 
     __tablename__ = "trades"
+    __table_args__ = (
+        # Closed trade aggregates (performance, tag performance)
+        Index("ix_trades_performance", "is_open", "pair", "close_date", "enter_tag", "exit_reason"),
+    )
     session: ClassVar[SessionType]
 
     use_db: bool = True
@@ -1795,6 +1800,9 @@ class Trade(ModelBase, LocalTrade):
         :return: unsorted List[Trade]
         """
         if Trade.use_db:
+            if is_open and not open_date and not close_date:
+                # Open trades are kept in memory
+                return get_registry(Trade.session(), OPEN_TRADES).get(pair)
             trade_filter = []
             if pair:
                 trade_filter.append(Trade.pair == pair)
@@ -1901,15 +1909,28 @@ class Trade(ModelBase, LocalTrade):
         Calculates total invested amount in open trades
         in stake currency
         """
-        if Trade.use_db:
-            total_open_stake_amount = Trade.session.scalar(
-                select(func.sum(Trade.stake_amount)).filter(Trade.is_open.is_(True))
-            )
-        else:
-            total_open_stake_amount = sum(
-                t.stake_amount for t in LocalTrade.get_trades_proxy(is_open=True)
+        return sum(t.stake_amount for t in Trade.get_trades_proxy(is_open=True))
+
+    @staticmethod
+    def get_daily_closed_profit(start_date: datetime) -> dict[date, tuple[float, int]]:
+        """
+        Realized profit and number of closed trades per day (by close date, UTC),
+        grouped in one query.
+        NOTE: Not supported in Backtesting.
+        :param start_date: Only include trades closed on or after this date
+        :return: Dict of (profit_abs, trade_count) per day - only containing days with trades
+        """
+        close_day = func.date(Trade.close_date, type_=Date)
+        daily_profit = Trade.session.execute(
+            select(
+                close_day.label("close_day"),
+                func.sum(Trade.close_profit_abs).label("profit_sum_abs"),
+                func.count(Trade.id).label("count"),
             )
-        return total_open_stake_amount or 0
+            .filter(Trade.is_open.is_(False), Trade.close_date >= start_date)
+            .group_by(close_day)
+        ).all()
+        return {day: (profit_abs or 0.0, count) for day, profit_abs, count in daily_profit}
 
     @staticmethod
     def get_overall_performance(minutes=None) -> list[dict[str, Any]]:
@@ -2028,7 +2049,6 @@ class Trade(ModelBase, LocalTrade):
             filters.append(Trade.pair == pair)
         mix_tag_perf = Trade.session.execute(
             select(
-                Trade.id,
                 Trade.enter_tag,
                 Trade.exit_reason,
                 func.sum(Trade.close_profit).label("profit_sum"),
@@ -2036,41 +2056,29 @@ class Trade(ModelBase, LocalTrade):
                 func.count(Trade.pair).label("count"),
             )
             .filter(*filters)
-            .group_by(Trade.id)
+            .group_by(Trade.enter_tag, Trade.exit_reason)
             .order_by(desc("profit_sum_abs"))
         ).all()
 
-        resp: list[dict] = []
-        for _, enter_tag, exit_reason, profit, profit_abs, count in mix_tag_perf:
+        # Missing tags are combined with tags named "Other"
+        resp: dict[str, dict] = {}
+        for enter_tag, exit_reason, profit, profit_abs, count in mix_tag_perf:
             enter_tag = enter_tag if enter_tag is not None else "Other"
             exit_reason = exit_reason if exit_reason is not None else "Other"
+            mix_tag = enter_tag + " " + exit_reason
+            if mix_tag in resp:
+                profit += resp[mix_tag]["profit_ratio"]
+                profit_abs += resp[mix_tag]["profit_abs"]
+                count += resp[mix_tag]["count"]
+            resp[mix_tag] = {
+                "mix_tag": mix_tag,
+                "profit_ratio": profit,
+                "profit_pct": round(profit * 100, 2),
+                "profit_abs": profit_abs,
+                "count": count,
+            }
 
-            if exit_reason is not None and enter_tag is not None:
-                mix_tag = enter_tag + " " + exit_reason
-                i = 0
-                if not any(item["mix_tag"] == mix_tag for item in resp):
-                    resp.append(
-                        {
-                            "mix_tag": mix_tag,
-                            "profit_ratio": profit,
-                            "profit_pct": round(profit * 100, 2),
-                            "profit_abs": profit_abs,
-                            "count": count,
-                        }
-                    )
-                else:
-                    while i < len(resp):
-                        if resp[i]["mix_tag"] == mix_tag:
-                            resp[i] = {
-                                "mix_tag": mix_tag,
-                                "profit_ratio": profit + resp[i]["profit_ratio"],
-                                "profit_pct": round(profit + resp[i]["profit_ratio"] * 100, 2),
-                                "profit_abs": profit_abs + resp[i]["profit_abs"],
-                                "count": 1 + resp[i]["count"],
-                            }
-                        i += 1
-
-        return resp
+        return sorted(resp.values(), key=lambda x: x["profit_abs"], reverse=True)
 
     @staticmethod
     def get_best_pair(start_date: datetime | None = None):
@@ -0,0 +1,241 @@
+"""
+Aggregated statistics of closed trades
+"""
+
+import logging
+from collections.abc import Sequence
+from copy import deepcopy
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from threading import Lock
+from typing import Any
+
+from sqlalchemy import Row, func, select
+
+from freqtrade.persistence.trade_model import Trade
+
+
+logger = logging.getLogger(__name__)
+
+
+def _utc(date: datetime) -> datetime:
+    return date.replace(tzinfo=timezone.utc) if date.tzinfo is None else date
+
+
+@dataclass
+class ClosedTradeStatistics:
+    """
+    Aggregates of closed trades.
+    Trades must be added in order of their close date (as they close).
+    """
+
+    trade_count: int = 0
+    profit_abs: float = 0.0
+    profit_ratio: float = 0.0
+    # (id, open_date) of the trades with the lowest and highest id
+    first_trade: tuple[int, datetime] | None = None
+    last_trade: tuple[int, datetime] | None = None
+    duration_sum: float = 0.0
+    duration_count: int = 0
+    # Win / loss by profit ratio
+    winning_trades: int = 0
+    losing_trades: int = 0
+    winning_profit: float = 0.0
+    losing_profit: float = 0.0
+    # Win / loss by absolute profit (as used for expectancy)
+    win_abs_count: int = 0
+    win_abs_sum: float = 0.0
+    loss_abs_count: int = 0
+    loss_abs_sum: float = 0.0
+    # Sum of close_profit per pair
+    pair_profit: dict[str, float] = field(default_factory=dict)
+    # wins / losses / draws per exit reason, and sum and count of durations per outcome
+    exit_reasons: dict[str | None, dict[str, int]] = field(default_factory=dict)
+    outcome_durations: dict[str, list[float]] = field(
+        default_factory=lambda: {"wins": [0.0, 0], "draws": [0.0, 0], "losses": [0.0, 0]}
+    )
+    # Drawdown of the cumulative absolute profit
+    last_close_date: datetime | None = None
+    cumulative: float = 0.0
+    peak_value: float | None = None
+    peak_date: datetime | None = None
+    drawdown_abs: float = 0.0
+    drawdown_high_date: datetime | None = None
+    drawdown_high_value: float = 0.0
+    drawdown_low_date: datetime | None = None
+    drawdown_low_value: float = 0.0
+
+    def add_trade(self, trade: Any) -> bool:
+        """
+        Add a closed trade.
+        :param trade: Trade object, or row with the columns loaded by `load()`
+        :return: False if the trade can't be added, as it closed before the last added trade.
+        """
+        close_date = _utc(trade.close_date) if trade.close_date else None
+        if close_date and self.last_close_date and close_date < self.last_close_date:
+            return False
+        self.trade_count += 1
+
+        profit_ratio = trade.close_profit or 0.0
+        profit_abs = trade.close_profit_abs or 0.0
+        self.profit_abs += profit_abs
+        self.profit_ratio += profit_ratio
+
+        open_date = _utc(trade.open_date)
+        if self.first_trade is None or trade.id < self.first_trade[0]:
+            self.first_trade = (trade.id, open_date)
+        if self.last_trade is None or trade.id > self.last_trade[0]:
+            self.last_trade = (trade.id, open_date)
+
+        if profit_ratio >= 0:
+            self.winning_trades += 1
+            self.winning_profit += profit_abs
+        else:
+            self.losing_trades += 1
+            self.losing_profit += profit_abs
+
+        if trade.close_profit is not None:
+            self.pair_profit[trade.pair] = self.pair_profit.get(trade.pair, 0.0) + profit_ratio
+
+        outcome = "wins" if profit_ratio > 0 else "losses" if profit_ratio < 0 else "draws"
+        reasons = self.exit_reasons.setdefault(
+            trade.exit_reason, {"wins": 0, "losses": 0, "draws": 0}
+        )
+        reasons[outcome] += 1
+
+        if close_date is None:
+            return True
+        duration = (close_date - open_date).total_seconds()
+        self.duration_sum += duration
+        self.duration_count += 1
+        self.outcome_durations[outcome][0] += duration
+        self.outcome_durations[outcome][1] += 1
+
+        if profit_abs > 0:
+            self.win_abs_count += 1
+            self.win_abs_sum += profit_abs
+        elif profit_abs < 0:
+            self.loss_abs_count += 1
+            self.loss_abs_sum += profit_abs
+
+        self.last_close_date = close_date
+        self.cumulative += profit_abs
+        if self.peak_value is None or self.cumulative > self.peak_value:
+            self.peak_value = self.cumulative
+            self.peak_date = close_date
+        elif self.peak_value - self.cumulative > self.drawdown_abs:
+            self.drawdown_abs = self.peak_value - self.cumulative
+            self.drawdown_high_date = self.peak_date
+            self.drawdown_high_value = self.peak_value
+            self.drawdown_low_date = close_date
+            self.drawdown_low_value = self.cumulative
+        return True
+
+    def relative_drawdown(self, starting_balance: float) -> float:
+        """
+        Relative account drawdown of the max drawdown
+        :param starting_balance: Portfolio starting balance
+        """
+        if not self.drawdown_abs:
+            return 0.0
+        if starting_balance:
+            return self.drawdown_abs / (starting_balance + self.drawdown_high_value)
+        # NOTE: Not accurate without starting balance (as in calculate_max_drawdown)
+        return self.drawdown_abs / self.drawdown_high_value if self.drawdown_high_value else 0.0
+
+    def best_pair(self) -> tuple[str, float] | None:
+        """
+        Pair with the highest sum of profit ratios
+        :return: Tuple containing (pair, profit_sum)
+        """
+        if not self.pair_profit:
+            return None
+        return max(self.pair_profit.items(), key=lambda item: item[1])
+
+    @staticmethod
+    def load_trades(start_date: datetime | None = None) -> Sequence[Row]:
+        """
+        Load the columns required for statistics of closed trades, ordered by close date.
+        :param start_date: Only include trades closed on or after this date
+        """
+        filters: list = [Trade.is_open.is_(False)]
+        if start_date:
+            filters.append(Trade.close_date >= start_date)
+        return Trade.session.execute(
+            select(
+                Trade.id,
+                Trade.pair,
+                Trade.open_date,
+                Trade.close_date,
+                Trade.close_profit,
+                Trade.close_profit_abs,
+                Trade.exit_reason,
+            )
+            .filter(*filters)
+            .order_by(Trade.close_date, Trade.id)
+        ).all()
+
+    @classmethod
+    def load(cls, start_date: datetime | None = None) -> "ClosedTradeStatistics":
+        """
+        Build statistics from closed trades in the database
+        :param start_date: Only include trades closed on or after this date
+        """
+        stats = cls()
+        for trade in cls.load_trades(start_date):
+            stats.add_trade(trade)
+        return stats
+
+
+class TradeStatistics:
+    """
+    Statistics of all closed trades - updated incrementally as trades close,
+    so reading them doesn't require loading all trades.
+    Built from the database on first use, and rebuilt if the number of closed trades
+    in the database doesn't match (trades closed or deleted outside of the bot).
+    """
+
+    def __init__(self) -> None:
+        self._stats: ClosedTradeStatistics | None = None
+        self._trade_ids: set[int] = set()
+        self._lock = Lock()
+
+    def reset(self) -> None:
+        """
+        Discard statistics - rebuilding them on next use.
+        Required whenever closed trades are modified or deleted.
+        """
+        with self._lock:
+            self._stats = None
+
+    def trade_closed(self, trade: Trade) -> None:
+        """
+        Add a trade which just closed.
+        Trades which were closed before (e.g. after an update of the exit fee)
+        cause a rebuild.
+        """
+        with self._lock:
+            if self._stats is None:
+                return
+            if trade.id in self._trade_ids or not self._stats.add_trade(trade):
+                self._stats = None
+                return
+            self._trade_ids.add(trade.id)
+
+    def get(self) -> ClosedTradeStatistics:
+        """
+        Statistics of all closed trades.
+        :return: Copy of the statistics
+        """
+        with self._lock:
+            closed_count = Trade.session.scalar(
+                select(func.count(Trade.id)).filter(Trade.is_open.is_(False))
+            )
+            if self._stats is None or self._stats.trade_count != closed_count:
+                logger.debug("Building closed trade statistics.")
+                trades = ClosedTradeStatistics.load_trades()
+                self._trade_ids = {trade.id for trade in trades}
+                self._stats = ClosedTradeStatistics()
+                for trade in trades:
+                    self._stats.add_trade(trade)
+            return deepcopy(self._stats)
@@ -610,6 +610,21 @@ class SysInfo(BaseModel):
     ram_pct: float
 
 
+class ProcessTiming(BaseModel):
+    phase: str
+    pair: str | None = None
+    count: int
+    sum: float
+    last: float
+    max: float
+    bucket_counts: list[int]
+
+
+class ProcessTimings(BaseModel):
+    buckets: list[float]
+    timings: list[ProcessTiming]
+
+
 class Health(BaseModel):
     last_process: datetime | None = None
     last_process_ts: int | None = None
@@ -3,6 +3,7 @@ from copy import deepcopy
 
 from fastapi import APIRouter, Depends, Query
 from fastapi.exceptions import HTTPException
+from fastapi.responses import PlainTextResponse
 
 from freqtrade import __version__
 from freqtrade.data.history import get_datahandler
@@ -38,6 +39,7 @@ from freqtrade.rpc.api_server.api_schemas import (
     PerformanceEntry,
     Ping,
     PlotConfig,
+    ProcessTimings,
     Profit,
     ResultMsg,
     ShowConfig,
@@ -84,7 +86,8 @@ logger = logging.getLogger(__name__)
 # 2.35: pair_candles and pair_history endpoints as Post variant
 # 2.40: Add hyperopt-loss endpoint
 # 2.41: Add download-data endpoint
-API_VERSION = 2.41
+# 2.42: Add process_timings endpoints
+API_VERSION = 2.42
 
 # Public API, requires no auth.
 router_public = APIRouter()
@@ -533,3 +536,13 @@ def sysinfo():
 @router.get("/health", response_model=Health, tags=["info"])
 def health(rpc: RPC = Depends(get_rpc)):
     return rpc.health()
+
+
+@router.get("/process_timings", response_model=ProcessTimings, tags=["info"])
+def process_timings(rpc: RPC = Depends(get_rpc)):
+    return rpc._rpc_process_timings()
+
+
+@router.get("/process_timings/prometheus", response_class=PlainTextResponse, tags=["info"])
+def process_timings_prometheus(rpc: RPC = Depends(get_rpc)):
+    return rpc._rpc_process_timings_prometheus()
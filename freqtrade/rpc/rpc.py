@@ -12,7 +12,7 @@ from typing import TYPE_CHECKING, Any
 import psutil
 from dateutil.relativedelta import relativedelta
 from dateutil.tz import tzlocal
-from numpy import inf, int64, mean, nan
+from numpy import inf, int64, nan
 from pandas import DataFrame, NaT
 from sqlalchemy import func, select
 
@@ -20,7 +20,7 @@ from freqtrade import __version__
 from freqtrade.configuration.timerange import TimeRange
 from freqtrade.constants import CANCEL_REASON, DEFAULT_DATAFRAME_COLUMNS, Config
 from freqtrade.data.history import load_data
-from freqtrade.data.metrics import DrawDownResult, calculate_expectancy, calculate_max_drawdown
+from freqtrade.data.metrics import DrawDownResult, calculate_expectancy_from_sums
 from freqtrade.enums import (
     CandleType,
     ExitCheckTuple,
@@ -34,7 +34,14 @@ from freqtrade.exceptions import ExchangeError, PricingError
 from freqtrade.exchange import timeframe_to_minutes, timeframe_to_msecs
 from freqtrade.exchange.exchange_utils import price_to_precision
 from freqtrade.loggers import bufferHandler
-from freqtrade.persistence import KeyStoreKeys, KeyValueStore, PairLocks, Trade
+from freqtrade.misc import structured_arrays_to_records
+from freqtrade.persistence import (
+    ClosedTradeStatistics,
+    KeyStoreKeys,
+    KeyValueStore,
+    PairLocks,
+    Trade,
+)
 from freqtrade.persistence.models import PairLock
 from freqtrade.plugins.pairlist.pairlist_helpers import expand_pairlist
 from freqtrade.rpc.fiat_convert import CryptoToFiatConverter
@@ -382,32 +389,36 @@ class RPC:
         if not (isinstance(timescale, int) and timescale > 0):
             raise RPCException("timescale must be an integer greater than 0")
 
+        def period_start(day: date) -> date:
+            if timeunit == "weeks":
+                return day - timedelta(days=day.weekday())
+            if timeunit == "months":
+                return day.replace(day=1)
+            return day
+
+        # Profit of all periods, retrieved in one query grouped by day
+        first_period = start_date - time_offset(timescale - 1)
+        period_profit: dict[date, tuple[float, int]] = {}
+        for close_day, (profit_abs, count) in Trade.get_daily_closed_profit(
+            datetime.combine(first_period, datetime.min.time(), tzinfo=timezone.utc)
+        ).items():
+            period = period_start(close_day)
+            period_amount, period_count = period_profit.get(period, (0.0, 0))
+            period_profit[period] = (period_amount + profit_abs, period_count + count)
+
         profit_units: dict[date, dict] = {}
         daily_stake = self._freqtrade.wallets.get_total_stake_amount()
 
         for day in range(0, timescale):
             profitday = start_date - time_offset(day)
-            # Only query for necessary columns for performance reasons.
-            trades = Trade.session.execute(
-                select(Trade.close_profit_abs)
-                .filter(
-                    Trade.is_open.is_(False),
-                    Trade.close_date >= profitday,
-                    Trade.close_date < (profitday + time_offset(1)),
-                )
-                .order_by(Trade.close_date)
-            ).all()
-
-            curdayprofit = sum(
-                trade.close_profit_abs for trade in trades if trade.close_profit_abs is not None
-            )
+            curdayprofit, trade_count = period_profit.get(profitday, (0.0, 0))
             # Calculate this periods starting balance
             daily_stake = daily_stake - curdayprofit
             profit_units[profitday] = {
                 "amount": curdayprofit,
                 "daily_stake": daily_stake,
                 "rel_profit": round(curdayprofit / daily_stake, 8) if daily_stake > 0 else 0,
-                "trades": len(trades),
+                "trades": trade_count,
             }
 
         data = [
@@ -464,108 +475,73 @@ class RPC:
         """
         Generate generic stats for trades in database
         """
-
-        def trade_win_loss(trade):
-            if trade.close_profit > 0:
-                return "wins"
-            elif trade.close_profit < 0:
-                return "losses"
-            else:
-                return "draws"
-
-        trades = Trade.get_trades([Trade.is_open.is_(False)], include_orders=False)
-        # Duration
-        dur: dict[str, list[float]] = {"wins": [], "draws": [], "losses": []}
-        # Exit reason
-        exit_reasons = {}
-        for trade in trades:
-            if trade.exit_reason not in exit_reasons:
-                exit_reasons[trade.exit_reason] = {"wins": 0, "losses": 0, "draws": 0}
-            exit_reasons[trade.exit_reason][trade_win_loss(trade)] += 1
-
-            if trade.close_date is not None and trade.open_date is not None:
-                trade_dur = (trade.close_date - trade.open_date).total_seconds()
-                dur[trade_win_loss(trade)].append(trade_dur)
-
-        wins_dur = sum(dur["wins"]) / len(dur["wins"]) if len(dur["wins"]) > 0 else None
-        draws_dur = sum(dur["draws"]) / len(dur["draws"]) if len(dur["draws"]) > 0 else None
-        losses_dur = sum(dur["losses"]) / len(dur["losses"]) if len(dur["losses"]) > 0 else None
-
-        durations = {"wins": wins_dur, "draws": draws_dur, "losses": losses_dur}
-        return {"exit_reasons": exit_reasons, "durations": durations}
+        stats = self._freqtrade.trade_statistics.get()
+        durations = {
+            outcome: duration_sum / count if count > 0 else None
+            for outcome, (duration_sum, count) in stats.outcome_durations.items()
+        }
+        return {"exit_reasons": stats.exit_reasons, "durations": durations}
 
     def _rpc_trade_statistics(
         self, stake_currency: str, fiat_display_currency: str, start_date: datetime | None = None
     ) -> dict[str, Any]:
         """Returns cumulative profit statistics"""
 
-        start_date = datetime.fromtimestamp(0) if start_date is None else start_date
-
-        trade_filter = (
-            Trade.is_open.is_(False) & (Trade.close_date >= start_date)
-        ) | Trade.is_open.is_(True)
+        # Closed trades are aggregated - only open trades are evaluated individually
+        if start_date is None:
+            closed = self._freqtrade.trade_statistics.get()
+        else:
+            closed = ClosedTradeStatistics.load(start_date)
         trades: Sequence[Trade] = Trade.session.scalars(
-            Trade.get_trades_query(trade_filter, include_orders=False).order_by(Trade.id)
+            Trade.get_trades_query(Trade.is_open.is_(True), include_orders=False).order_by(Trade.id)
         ).all()
 
-        profit_all_coin = []
-        profit_all_ratio = []
-        profit_closed_coin = []
-        profit_closed_ratio = []
-        durations = []
-        winning_trades = 0
-        losing_trades = 0
-        winning_profit = 0.0
-        losing_profit = 0.0
+        profit_all_coin = [closed.profit_abs]
+        profit_all_ratio = [closed.profit_ratio]
+        durations = [closed.duration_sum]
+        duration_count = closed.duration_count
 
         for trade in trades:
             current_rate: float = 0.0
 
             if trade.close_date:
                 durations.append((trade.close_date - trade.open_date).total_seconds())
+                duration_count += 1
 
-            if not trade.is_open:
-                profit_ratio = trade.close_profit or 0.0
-                profit_abs = trade.close_profit_abs or 0.0
-                profit_closed_coin.append(profit_abs)
-                profit_closed_ratio.append(profit_ratio)
-                if profit_ratio >= 0:
-                    winning_trades += 1
-                    winning_profit += profit_abs
-                else:
-                    losing_trades += 1
-                    losing_profit += profit_abs
+            # Get current rate
+            if len(trade.select_filled_orders(trade.entry_side)) == 0:
+                # Skip trades with no filled orders
+                continue
+            try:
+                current_rate = self._freqtrade.exchange.get_rate(
+                    trade.pair, side="exit", is_short=trade.is_short, refresh=False
+                )
+            except (PricingError, ExchangeError):
+                current_rate = nan
+                profit_ratio = nan
+                profit_abs = nan
             else:
-                # Get current rate
-                if len(trade.select_filled_orders(trade.entry_side)) == 0:
-                    # Skip trades with no filled orders
-                    continue
-                try:
-                    current_rate = self._freqtrade.exchange.get_rate(
-                        trade.pair, side="exit", is_short=trade.is_short, refresh=False
-                    )
-                except (PricingError, ExchangeError):
-                    current_rate = nan
-                    profit_ratio = nan
-                    profit_abs = nan
-                else:
-                    _profit = trade.calculate_profit(trade.close_rate or current_rate)
+                _profit = trade.calculate_profit(trade.close_rate or current_rate)
 
-                    profit_ratio = _profit.profit_ratio
-                    profit_abs = _profit.total_profit
+                profit_ratio = _profit.profit_ratio
+                profit_abs = _profit.total_profit
 
             profit_all_coin.append(profit_abs)
             profit_all_ratio.append(profit_ratio)
 
-        closed_trade_count = len([t for t in trades if not t.is_open])
+        closed_trade_count = closed.trade_count
+        # Open trades without filled orders don't count towards profit
+        profit_trade_count = closed_trade_count + len(profit_all_ratio) - 1
 
-        best_pair = Trade.get_best_pair(start_date)
+        best_pair = closed.best_pair()
         trading_volume = Trade.get_trading_volume(start_date)
 
         # Prepare data to display
-        profit_closed_coin_sum = round(sum(profit_closed_coin), 8)
-        profit_closed_ratio_mean = float(mean(profit_closed_ratio) if profit_closed_ratio else 0.0)
-        profit_closed_ratio_sum = sum(profit_closed_ratio) if profit_closed_ratio else 0.0
+        profit_closed_coin_sum = round(closed.profit_abs, 8)
+        profit_closed_ratio_mean = (
+            closed.profit_ratio / closed_trade_count if closed_trade_count else 0.0
+        )
+        profit_closed_ratio_sum = closed.profit_ratio
 
         profit_closed_fiat = (
             self._fiat_converter.convert_amount(
@@ -576,9 +552,11 @@ class RPC:
         )
 
         profit_all_coin_sum = round(sum(profit_all_coin), 8)
-        profit_all_ratio_mean = float(mean(profit_all_ratio) if profit_all_ratio else 0.0)
+        profit_all_ratio_mean = (
+            sum(profit_all_ratio) / profit_trade_count if profit_trade_count else 0.0
+        )
         # Doing the sum is not right - overall profit needs to be based on initial capital
-        profit_all_ratio_sum = sum(profit_all_ratio) if profit_all_ratio else 0.0
+        profit_all_ratio_sum = sum(profit_all_ratio)
         starting_balance = self._freqtrade.wallets.get_starting_balance()
         profit_closed_ratio_fromstart = 0.0
         profit_all_ratio_fromstart = 0.0
@@ -586,36 +564,32 @@ class RPC:
             profit_closed_ratio_fromstart = profit_closed_coin_sum / starting_balance
             profit_all_ratio_fromstart = profit_all_coin_sum / starting_balance
 
-        profit_factor = winning_profit / abs(losing_profit) if losing_profit else float("inf")
+        profit_factor = (
+            closed.winning_profit / abs(closed.losing_profit)
+            if closed.losing_profit
+            else float("inf")
+        )
 
-        winrate = (winning_trades / closed_trade_count) if closed_trade_count > 0 else 0
+        winrate = (closed.winning_trades / closed_trade_count) if closed_trade_count > 0 else 0
 
-        trades_df = DataFrame(
-            [
-                {
-                    "close_date": format_date(trade.close_date),
-                    "close_date_dt": trade.close_date,
-                    "profit_abs": trade.close_profit_abs,
-                }
-                for trade in trades
-                if not trade.is_open and trade.close_date
-            ]
+        expectancy, expectancy_ratio = calculate_expectancy_from_sums(
+            closed.win_abs_sum,
+            abs(closed.loss_abs_sum),
+            closed.win_abs_count,
+            closed.loss_abs_count,
+            closed.duration_count,
         )
 
-        expectancy, expectancy_ratio = calculate_expectancy(trades_df)
-
         drawdown = DrawDownResult()
-        if len(trades_df) > 0:
-            try:
-                drawdown = calculate_max_drawdown(
-                    trades_df,
-                    value_col="profit_abs",
-                    date_col="close_date_dt",
-                    starting_balance=starting_balance,
-                )
-            except ValueError:
-                # ValueError if no losing trade.
-                pass
+        if closed.drawdown_abs:
+            drawdown = DrawDownResult(
+                drawdown_abs=closed.drawdown_abs,
+                high_date=closed.drawdown_high_date,
+                low_date=closed.drawdown_low_date,
+                high_value=closed.drawdown_high_value,
+                low_value=closed.drawdown_low_value,
+                relative_account_drawdown=closed.relative_drawdown(starting_balance),
+            )
 
         profit_all_fiat = (
             self._fiat_converter.convert_amount(
@@ -625,9 +599,13 @@ class RPC:
             else 0
         )
 
-        first_date = trades[0].open_date_utc if trades else None
-        last_date = trades[-1].open_date_utc if trades else None
-        num = float(len(durations) or 1)
+        # First and latest trade by id - of closed and open trades
+        trade_dates = [(trade.id, trade.open_date_utc) for trade in trades]
+        if closed.first_trade and closed.last_trade:
+            trade_dates.extend([closed.first_trade, closed.last_trade])
+        first_date = min(trade_dates)[1] if trade_dates else None
+        last_date = max(trade_dates)[1] if trade_dates else None
+        num = float(duration_count or 1)
         bot_start = KeyValueStore.get_datetime_value(KeyStoreKeys.BOT_START_TIME)
         return {
             "profit_closed_coin": profit_closed_coin_sum,
@@ -646,7 +624,7 @@ class RPC:
             "profit_all_ratio": profit_all_ratio_fromstart,
             "profit_all_percent": round(profit_all_ratio_fromstart * 100, 2),
             "profit_all_fiat": profit_all_fiat,
-            "trade_count": len(trades),
+            "trade_count": closed_trade_count + len(trades),
             "closed_trade_count": closed_trade_count,
             "first_trade_date": format_date(first_date),
             "first_trade_humanized": dt_humanize_delta(first_date) if first_date else "",
@@ -658,8 +636,8 @@ class RPC:
             "best_pair": best_pair[0] if best_pair else "",
             "best_rate": round(best_pair[1] * 100, 2) if best_pair else 0,  # Deprecated
             "best_pair_profit_ratio": best_pair[1] if best_pair else 0,
-            "winning_trades": winning_trades,
-            "losing_trades": losing_trades,
+            "winning_trades": closed.winning_trades,
+            "losing_trades": closed.losing_trades,
             "profit_factor": profit_factor,
             "winrate": winrate,
             "expectancy": expectancy,
@@ -1092,6 +1070,8 @@ class RPC:
                     except ExchangeError:
                         pass
 
+            if not trade.is_open:
+                self._freqtrade.trade_statistics.reset()
             trade.delete()
             self._freqtrade.wallets.update()
             return {
@@ -1325,6 +1305,8 @@ class RPC:
                 # replace NaT with `None`
                 dataframe[date_column] = dataframe[date_column].astype(object).replace({NaT: None})
 
+            # Compact orderflow columns contain numpy arrays, which replace() can't compare
+            dataframe = structured_arrays_to_records(dataframe)
             dataframe = dataframe.replace({inf: None, -inf: None, nan: None})
 
         res = {
@@ -1530,6 +1512,18 @@ class RPC:
 
         return res
 
+    def _rpc_process_timings(self) -> dict[str, Any]:
+        """
+        Durations of the phases of the bot loop, as histograms
+        """
+        return self._freqtrade.phase_timings.to_json()
+
+    def _rpc_process_timings_prometheus(self) -> str:
+        """
+        Durations of the phases of the bot loop, in the Prometheus text format
+        """
+        return self._freqtrade.phase_timings.to_prometheus()
+
     def _update_market_direction(self, direction: MarketDirection) -> None:
         self._freqtrade.strategy.market_direction = direction
 
@@ -4,17 +4,24 @@ This module defines a base class for auto-hyperoptable strategies.
 """
 
 import logging
-from collections.abc import Iterator
+from collections.abc import Callable, Iterator
 from pathlib import Path
-from typing import Any
+from typing import Any, TypeVar
+
+from pandas import DataFrame
 
 from freqtrade.constants import Config
+from freqtrade.enums import RunMode
 from freqtrade.exceptions import OperationalException
 from freqtrade.misc import deep_merge_dicts
 from freqtrade.optimize.hyperopt_tools import HyperoptTools
+from freqtrade.strategy.indicator_cache import IndicatorCache, copy_value
 from freqtrade.strategy.parameters import BaseParameter
 
 
+T = TypeVar("T")
+
+
 logger = logging.getLogger(__name__)
 
 
@@ -38,6 +45,58 @@ class HyperStrategyMixin:
         self._ft_params_from_file = params
         # Init/loading of parameters is done as part of ft_bot_start().
 
+        self._ft_indicator_cache: IndicatorCache | None = None
+        cache_mb = config.get("hyperopt_indicator_cache_mb", 256)
+        if config.get("runmode") == RunMode.HYPEROPT and cache_mb > 0:
+            self._ft_indicator_cache = IndicatorCache(cache_mb * 1024 * 1024)
+
+    def cached_indicator(
+        self,
+        dataframe: DataFrame,
+        metadata: dict,
+        name: str,
+        func: Callable[[], T],
+        *parameters: Any,
+    ) -> T:
+        """
+        Calculate an indicator which depends on hyperoptable parameters.
+        During hyperopt, results are cached per pair, indicator name and parameter values - so
+        epochs testing a parameter value a second time reuse the result of the earlier epoch.
+        In all other modes, `func` is simply called.
+
+        Usage:
+            dataframe["ema_short"] = self.cached_indicator(
+                dataframe, metadata, "ema_short",
+                lambda: ta.EMA(dataframe, timeperiod=self.buy_ema_short.value),
+                self.buy_ema_short,
+            )
+
+        :param dataframe: Dataframe the indicator is calculated on
+        :param metadata: Metadata dictionary of the calling populate_* method
+        :param name: Name of the indicator - must be unique within the strategy
+        :param func: Function calculating the indicator, called without arguments
+        :param parameters: Parameters (or other values) the indicator depends on
+        :return: Result of `func`
+        """
+        cache = self._ft_indicator_cache
+        if cache is None:
+            return func()
+        data_key: tuple = (len(dataframe),)
+        if "date" in dataframe and len(dataframe) > 0:
+            data_key += (dataframe["date"].iloc[0], dataframe["date"].iloc[-1])
+        key = (
+            metadata.get("pair"),
+            name,
+            tuple((p.name, p.value) if isinstance(p, BaseParameter) else p for p in parameters),
+            data_key,
+        )
+        value = cache.get(key)
+        if value is None:
+            value = func()
+            cache.set(key, copy_value(value))
+            return value
+        return copy_value(value)
+
     def enumerate_parameters(
         self, category: str | None = None
     ) -> Iterator[tuple[str, BaseParameter]]:
@@ -0,0 +1,85 @@
+"""
+Size limited LRU cache for indicators calculated during hyperopt.
+"""
+
+import sys
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
+import numpy as np
+from pandas import DataFrame, Series
+
+
+def _size_of(value: Any) -> int:
+    """
+    Approximate memory used by a cached value, in bytes.
+    """
+    if isinstance(value, DataFrame):
+        return int(value.memory_usage(index=False).sum())
+    if isinstance(value, Series | np.ndarray):
+        return int(value.nbytes)
+    if isinstance(value, tuple | list):
+        return sum(_size_of(v) for v in value)
+    return sys.getsizeof(value)
+
+
+def copy_value(value: Any) -> Any:
+    """
+    Copy a cached value, so modifications by the caller don't change the cache.
+    """
+    if isinstance(value, DataFrame | Series | np.ndarray):
+        return value.copy()
+    if isinstance(value, tuple | list):
+        return type(value)(copy_value(v) for v in value)
+    return value
+
+
+class IndicatorCache:
+    """
+    Least recently used values are evicted once the total size exceeds `max_bytes`.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict[Hashable, tuple[Any, int]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+    def get(self, key: Hashable) -> Any:
+        """
+        Get a cached value (which must not be modified) - or None if key is not cached.
+        """
+        entry = self._data.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._data.move_to_end(key)
+        return entry[0]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Cache a value. Values bigger than the cache itself are not cached.
+        """
+        size = _size_of(value)
+        if key in self._data:
+            self.size -= self._data.pop(key)[1]
+        if size > self.max_bytes:
+            return
+        self._data[key] = (value, size)
+        self.size += size
+        while self.size > self.max_bytes:
+            _, (_, evicted_size) = self._data.popitem(last=False)
+            self.size -= evicted_size
+
+    def clear(self) -> None:
+        self._data.clear()
+        self.size = 0
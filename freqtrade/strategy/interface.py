@@ -5,11 +5,15 @@ This module defines the interface to apply for strategies
 
 import logging
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from datetime import datetime, timedelta, timezone
 from math import isinf, isnan
 
-from pandas import DataFrame
+import numpy as np
+from pandas import DataFrame, concat
 
+from freqtrade.configuration import TimeRange
 from freqtrade.constants import CUSTOM_TAG_MAX_LENGTH, Config, IntOrInf, ListPairsWithTimeframes
 from freqtrade.data.converter import populate_dataframe_with_trades
 from freqtrade.data.dataprovider import DataProvider
@@ -36,7 +40,7 @@ from freqtrade.strategy.informative_decorator import (
     _format_pair_name,
 )
 from freqtrade.strategy.strategy_wrapper import strategy_safe_wrapper
-from freqtrade.util import dt_now
+from freqtrade.util import PhaseTimings, dt_now
 from freqtrade.wallets import Wallets
 
 
@@ -120,6 +124,11 @@ class IStrategy(ABC, HyperStrategyMixin):
     # Count of candles the strategy requires before producing valid signals
     startup_candle_count: int = 0
 
+    # Count of candles the strategy requires to calculate indicators and signals of one candle.
+    # If set, only new candles (plus this many candles before them) are analyzed in live / dry
+    # modes, and appended to the previously analyzed dataframe.
+    incremental_lookback: int = 0
+
     # Protections
     protections: list = []
 
@@ -128,6 +137,8 @@ class IStrategy(ABC, HyperStrategyMixin):
     # and wallets - access to the current balance.
     dp: DataProvider
     wallets: Wallets | None = None
+    # Durations of the bot loop phases - only available in dry / live mode.
+    phase_timings: PhaseTimings | None = None
     # Filled from configuration
     stake_currency: str
     # container variable for strategy source code
@@ -1046,13 +1057,17 @@ class IStrategy(ABC, HyperStrategyMixin):
         logger.debug("TA Analysis Ended")
         return dataframe
 
-    def _analyze_ticker_internal(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
+    def _analyze_ticker_internal(
+        self, dataframe: DataFrame, metadata: dict, deferred: list | None = None
+    ) -> DataFrame:
         """
         Parses the given candle (OHLCV) data and returns a populated DataFrame
         add several TA indicators and buy signal to it
         WARNING: Used internally only, may skip analysis if `process_only_new_candles` is set.
         :param dataframe: Dataframe containing data from exchange
         :param metadata: Metadata dictionary with additional data (e.g. 'pair')
+        :param deferred: If given, the analyzed dataframe is appended to this list instead of
+                         being stored in the dataprovider (see `_publish_analyzed_df()`).
         :return: DataFrame of candle (OHLCV) data with indicator data and signals added
         """
         pair = str(metadata.get("pair"))
@@ -1062,13 +1077,17 @@ class IStrategy(ABC, HyperStrategyMixin):
         # always run if process_only_new_candles is set to false
         if not self.process_only_new_candles or new_candle:
             # Defs that only make change on new candle data.
-            dataframe = self.analyze_ticker(dataframe, metadata)
+            analyzed = self._analyze_ticker_incremental(dataframe, metadata)
+            dataframe = (
+                analyzed if analyzed is not None else self.analyze_ticker(dataframe, metadata)
+            )
 
             self._last_candle_seen_per_pair[pair] = dataframe.iloc[-1]["date"]
 
-            candle_type = self.config.get("candle_type_def", CandleType.SPOT)
-            self.dp._set_cached_df(pair, self.timeframe, dataframe, candle_type=candle_type)
-            self.dp._emit_df((pair, self.timeframe, candle_type), dataframe, new_candle)
+            if deferred is None:
+                self._publish_analyzed_df(pair, dataframe, new_candle)
+            else:
+                deferred.append((pair, dataframe, new_candle))
 
         else:
             logger.debug("Skipping TA Analysis for already analyzed candle")
@@ -1078,6 +1097,61 @@ class IStrategy(ABC, HyperStrategyMixin):
 
         return dataframe
 
+    def _analyze_ticker_incremental(self, dataframe: DataFrame, metadata: dict) -> DataFrame | None:
+        """
+        Analyze only the candles which are new since the last analysis (plus
+        `incremental_lookback` candles before them), and append them to the
+        previously analyzed dataframe.
+        :param dataframe: Dataframe containing data from exchange
+        :param metadata: Metadata dictionary with additional data (e.g. 'pair')
+        :return: Analyzed dataframe, or None if the dataframe must be analyzed fully.
+        """
+        if (
+            self.incremental_lookback <= 0
+            or not self.process_only_new_candles
+            or self.dp.runmode not in (RunMode.DRY_RUN, RunMode.LIVE)
+        ):
+            return None
+        previous, _ = self.dp.get_analyzed_dataframe(str(metadata.get("pair")), self.timeframe)
+        if previous.empty:
+            return None
+
+        dates = dataframe["date"]
+        new_candles = int((dates > previous["date"].iloc[-1]).sum())
+        previous = previous.loc[previous["date"] >= dates.iloc[0]]
+        if (
+            new_candles == 0
+            or len(previous) + new_candles != len(dataframe)
+            or not (previous["date"].to_numpy() == dates.iloc[: len(previous)].to_numpy()).all()
+        ):
+            # Gaps - the previous analysis can't be continued.
+            return None
+        ohlcv_columns = ["open", "high", "low", "close", "volume"]
+        if not np.array_equal(
+            previous[ohlcv_columns].to_numpy(dtype="float64"),
+            dataframe[ohlcv_columns].iloc[: len(previous)].to_numpy(dtype="float64"),
+            equal_nan=True,
+        ):
+            # Already analyzed candles were revised (or modified by the strategy).
+            return None
+
+        logger.debug(f"Incremental TA Analysis of {new_candles} candle(s)")
+        window = dataframe.iloc[-(new_candles + self.incremental_lookback) :]
+        tail = self.analyze_ticker(window.reset_index(drop=True), metadata)
+        if list(tail.columns) != list(previous.columns):
+            return None
+        return concat([previous, tail.iloc[-new_candles:]], ignore_index=True).set_axis(
+            dataframe.index
+        )
+
+    def _publish_analyzed_df(self, pair: str, dataframe: DataFrame, new_candle: bool) -> None:
+        """
+        Store the analyzed dataframe in the dataprovider and emit it to RPC.
+        """
+        candle_type = self.config.get("candle_type_def", CandleType.SPOT)
+        self.dp._set_cached_df(pair, self.timeframe, dataframe, candle_type=candle_type)
+        self.dp._emit_df((pair, self.timeframe, candle_type), dataframe, new_candle)
+
     def analyze_pair(self, pair: str) -> None:
         """
         Fetch data for this pair from dataprovider and analyze.
@@ -1085,36 +1159,76 @@ class IStrategy(ABC, HyperStrategyMixin):
         The analyzed dataframe is then accessible via `dp.get_analyzed_dataframe()`.
         :param pair: Pair to analyze.
         """
-        dataframe = self.dp.ohlcv(
-            pair, self.timeframe, candle_type=self.config.get("candle_type_def", CandleType.SPOT)
-        )
-        if not isinstance(dataframe, DataFrame) or dataframe.empty:
-            logger.warning("Empty candle (OHLCV) data for pair %s", pair)
-            return
+        self._analyze_pair(pair)
 
-        try:
-            df_len, df_close, df_date = self.preserve_df(dataframe)
-
-            dataframe = strategy_safe_wrapper(self._analyze_ticker_internal, message="")(
-                dataframe, {"pair": pair}
+    def _analyze_pair(self, pair: str, deferred: list | None = None) -> None:
+        """
+        Implementation of analyze_pair().
+        :param deferred: Passed on to `_analyze_ticker_internal()`.
+        """
+        with (
+            self.phase_timings.measure("analyze_pair", pair)
+            if self.phase_timings
+            else nullcontext()
+        ):
+            dataframe = self.dp.ohlcv(
+                pair,
+                self.timeframe,
+                candle_type=self.config.get("candle_type_def", CandleType.SPOT),
             )
+            if not isinstance(dataframe, DataFrame) or dataframe.empty:
+                logger.warning("Empty candle (OHLCV) data for pair %s", pair)
+                return
 
-            self.assert_df(dataframe, df_len, df_close, df_date)
-        except StrategyError as error:
-            logger.warning(f"Unable to analyze candle (OHLCV) data for pair {pair}: {error}")
-            return
+            try:
+                df_len, df_close, df_date = self.preserve_df(dataframe)
 
-        if dataframe.empty:
-            logger.warning("Empty dataframe for pair %s", pair)
-            return
+                dataframe = strategy_safe_wrapper(self._analyze_ticker_internal, message="")(
+                    dataframe, {"pair": pair}, deferred=deferred
+                )
+
+                self.assert_df(dataframe, df_len, df_close, df_date)
+            except StrategyError as error:
+                logger.warning(f"Unable to analyze candle (OHLCV) data for pair {pair}: {error}")
+                return
+
+            if dataframe.empty:
+                logger.warning("Empty dataframe for pair %s", pair)
+                return
 
     def analyze(self, pairs: list[str]) -> None:
         """
         Analyze all pairs using analyze_pair().
+        With `internals.analyze_workers` > 1, pairs are analyzed in a pool of threads.
+        Analyzed dataframes are then stored in the dataprovider (and emitted to RPC) in the
+        order of `pairs` - the same way as if pairs were analyzed one after the other.
         :param pairs: List of pairs to analyze
         """
-        for pair in pairs:
-            self.analyze_pair(pair)
+        workers = self.config.get("internals", {}).get("analyze_workers", 1)
+        if workers <= 1 or len(pairs) <= 1:
+            for pair in pairs:
+                self.analyze_pair(pair)
+            return
+
+        def analyze_deferred(pair: str) -> list:
+            deferred: list = []
+            self._analyze_pair(pair, deferred)
+            return deferred
+
+        with ThreadPoolExecutor(
+            max_workers=min(workers, len(pairs)), thread_name_prefix="ft_analyze"
+        ) as executor:
+            futures = [executor.submit(analyze_deferred, pair) for pair in pairs]
+            error: BaseException | None = None
+            for future in futures:
+                if (exc := future.exception()) is not None:
+                    # Publish all other pairs - their last analyzed candle is already recorded.
+                    error = error or exc
+                    continue
+                for pair, dataframe, new_candle in future.result():
+                    self._publish_analyzed_df(pair, dataframe, new_candle)
+        if error:
+            raise error
 
     @staticmethod
     def preserve_df(dataframe: DataFrame) -> tuple[int, float, datetime]:
@@ -1599,10 +1713,17 @@ class IStrategy(ABC, HyperStrategyMixin):
     def _if_enabled_populate_trades(self, dataframe: DataFrame, metadata: dict):
         use_public_trades = self.config.get("exchange", {}).get("use_public_trades", False)
         if use_public_trades:
-            trades = self.dp.trades(pair=metadata["pair"], copy=False)
-
             pair = metadata["pair"]
-            # TODO: slice trades to size of dataframe for faster backtesting
+            timerange = None
+            if self.dp.runmode not in (RunMode.DRY_RUN, RunMode.LIVE) and not dataframe.empty:
+                # Only load trades of the candles which get orderflow data
+                start = dataframe.tail(self.config["orderflow"]["max_candles"])["date"].iat[0]
+                stop = dataframe["date"].iat[-1] + timedelta(
+                    seconds=timeframe_to_seconds(self.timeframe)
+                )
+                timerange = TimeRange("date", "date", int(start.timestamp()), int(stop.timestamp()))
+            trades = self.dp.trades(pair=pair, copy=False, timerange=timerange)
+
             cached_grouped_trades: DataFrame | None = self._cached_grouped_trades_per_pair.get(pair)
             dataframe, cached_grouped_trades = populate_dataframe_with_trades(
                 cached_grouped_trades, self.config, dataframe, trades
@@ -16,6 +16,7 @@ from freqtrade.util.formatters import decimals_per_coin, fmt_coin, fmt_coin2, ro
 from freqtrade.util.ft_precise import FtPrecise
 from freqtrade.util.measure_time import MeasureTime
 from freqtrade.util.periodic_cache import PeriodicCache
+from freqtrade.util.phase_timings import PhaseTimings
 from freqtrade.util.progress_tracker import (  # noqa F401
     get_progress_tracker,
     retrieve_progress_tracker,
@@ -45,6 +46,7 @@ __all__ = [
     "fmt_coin",
     "fmt_coin2",
     "MeasureTime",
+    "PhaseTimings",
     "print_rich_table",
     "print_df_rich_table",
     "CustomProgress",
@@ -0,0 +1,132 @@
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from threading import Lock
+from typing import Any
+
+
+# Upper bounds (in seconds) of the histogram buckets
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+class TimingHistogram:
+    """
+    Histogram of the durations of one phase.
+    """
+
+    def __init__(self, buckets: tuple[float, ...]):
+        self.buckets = buckets
+        # Last entry counts durations above the last bucket
+        self.bucket_counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.last = 0.0
+        self.max = 0.0
+
+    def observe(self, duration: float) -> None:
+        idx = 0
+        while idx < len(self.buckets) and duration > self.buckets[idx]:
+            idx += 1
+        self.bucket_counts[idx] += 1
+        self.count += 1
+        self.sum += duration
+        self.last = duration
+        self.max = max(self.max, duration)
+
+    def cumulative_counts(self) -> list[int]:
+        """
+        Number of durations less or equal to each bucket, followed by the total count.
+        """
+        result = []
+        total = 0
+        for bucket_count in self.bucket_counts:
+            total += bucket_count
+            result.append(total)
+        return result
+
+
+class PhaseTimings:
+    """
+    Collect durations of the phases of the bot loop as histograms.
+    Phases can optionally be split by pair.
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        self._buckets = buckets
+        self._histograms: dict[tuple[str, str | None], TimingHistogram] = {}
+        self._lock = Lock()
+
+    def observe(self, phase: str, duration: float, pair: str | None = None) -> None:
+        """
+        Record a duration
+        :param phase: Name of the phase
+        :param duration: Duration in seconds
+        :param pair: Optional pair the duration belongs to
+        """
+        with self._lock:
+            if (hist := self._histograms.get((phase, pair))) is None:
+                hist = self._histograms[(phase, pair)] = TimingHistogram(self._buckets)
+            hist.observe(duration)
+
+    @contextmanager
+    def measure(self, phase: str, pair: str | None = None) -> Iterator[None]:
+        """
+        Record the duration of a block of code
+        :param phase: Name of the phase
+        :param pair: Optional pair the duration belongs to
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(phase, time.perf_counter() - start, pair)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms = {}
+
+    def to_json(self) -> dict[str, Any]:
+        """
+        Histograms of all phases, in order of their first occurrence
+        """
+        with self._lock:
+            return {
+                "buckets": list(self._buckets),
+                "timings": [
+                    {
+                        "phase": phase,
+                        "pair": pair,
+                        "count": hist.count,
+                        "sum": hist.sum,
+                        "last": hist.last,
+                        "max": hist.max,
+                        "bucket_counts": hist.cumulative_counts(),
+                    }
+                    for (phase, pair), hist in self._histograms.items()
+                ],
+            }
+
+    def to_prometheus(self, name: str = "freqtrade_process_phase_seconds") -> str:
+        """
+        Histograms of all phases in the Prometheus text exposition format
+        :param name: Name of the metric
+        """
+        lines = [
+            f"# HELP {name} Duration of the phases of the bot loop.",
+            f"# TYPE {name} histogram",
+        ]
+        with self._lock:
+            for (phase, pair), hist in self._histograms.items():
+                labels = f'phase="{phase}"'
+                if pair is not None:
+                    labels += f',pair="{_escape_label(pair)}"'
+                bounds = [f"{bucket:g}" for bucket in self._buckets] + ["+Inf"]
+                for bound, cumulative in zip(bounds, hist.cumulative_counts(), strict=True):
+                    lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {cumulative}')
+                lines.append(f"{name}_sum{{{labels}}} {hist.sum}")
+                lines.append(f"{name}_count{{{labels}}} {hist.count}")
+        return "\n".join(lines) + "\n"
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
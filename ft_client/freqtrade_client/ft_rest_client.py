@@ -474,3 +474,10 @@ class FtRestClient:
         :return: json object
         """
         return self._get("health")
+
+    def process_timings(self):
+        """Return the durations of the phases of the bot loop, as histograms.
+
+        :return: json object
+        """
+        return self._get("process_timings")
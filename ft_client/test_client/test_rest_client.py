@@ -129,6 +129,7 @@ def test_FtRestClient_call_invalid(caplog):
         ("pair_history", ["XRP/USDT", "5m"], {"strategy": "SampleStrategy"}),
         ("sysinfo", [], {}),
         ("health", [], {}),
+        ("process_timings", [], {}),
     ],
 )
 def test_FtRestClient_call_explicit_methods(method, args, kwargs):
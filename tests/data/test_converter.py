@@ -15,9 +15,11 @@ from freqtrade.data.converter import (
     ohlcv_fill_up_missing_data,
     ohlcv_to_dataframe,
     reduce_dataframe_footprint,
+    trades_chunks_to_ohlcv_timeframes,
     trades_df_remove_duplicates,
     trades_dict_to_list,
     trades_to_ohlcv,
+    trades_to_ohlcv_timeframes,
     trim_dataframe,
 )
 from freqtrade.data.history import (
@@ -109,6 +111,40 @@ def test_trades_to_ohlcv_multi(timeframe, rows, days, candles, start, end, weekd
         assert df.iloc[-1, :]["date"].day_name() == weekday
 
 
+@pytest.mark.parametrize("base", ["1m", "3m", "1h", "1d"])
+def test_trades_to_ohlcv_timeframes(base):
+    trades_history = generate_trades_history(n_rows=20_000, days=400)
+    timeframes = [base] + [
+        tf
+        for tf in ["5m", "15m", "1h", "8h", "1d", "3d", "1w", "1M", "3M", "1y"]
+        if timeframe_to_seconds(tf) > timeframe_to_seconds(base)
+    ]
+
+    with pytest.raises(ValueError, match="Trade-list empty."):
+        trades_to_ohlcv_timeframes(pd.DataFrame(columns=trades_history.columns), timeframes)
+
+    result = trades_to_ohlcv_timeframes(trades_history, timeframes)
+    assert list(result.keys()) == timeframes
+    for timeframe in timeframes:
+        assert_frame_equal(result[timeframe], trades_to_ohlcv(trades_history, timeframe))
+
+
+def test_trades_chunks_to_ohlcv_timeframes():
+    trades_history = generate_trades_history(n_rows=20_000, days=400)
+    timeframes = ["1h", "4h", "1d", "3d", "1w", "1M"]
+
+    with pytest.raises(ValueError, match="Trade-list empty."):
+        trades_chunks_to_ohlcv_timeframes([], timeframes)
+
+    # Chunk boundaries within candles of all timeframes
+    chunks = [trades_history.iloc[i : i + 3_000] for i in range(0, len(trades_history), 3_000)]
+    result = trades_chunks_to_ohlcv_timeframes(chunks, timeframes)
+    expected = trades_to_ohlcv_timeframes(trades_history, timeframes)
+    assert list(result.keys()) == timeframes
+    for timeframe in timeframes:
+        assert_frame_equal(result[timeframe], expected[timeframe].reset_index(drop=True))
+
+
 def test_ohlcv_fill_up_missing_data(testdatadir, caplog):
     data = load_pair_history(
         datadir=testdatadir, timeframe="1m", pair="UNITTEST/BTC", fill_up_missing=False
@@ -589,3 +625,29 @@ def test_convert_trades_to_ohlcv(testdatadir, tmp_path, caplog):
         candle_type=CandleType.SPOT,
     )
     assert log_has(msg, caplog)
+
+
+def test_convert_trades_to_ohlcv_parallel(testdatadir, tmp_path, caplog, mocker):
+    pair = "XRP/ETH"
+    filetrades = tmp_path / "XRP_ETH-trades.json.gz"
+    copyfile(testdatadir / filetrades.name, filetrades)
+    mocker.patch("joblib.cpu_count", return_value=2)
+
+    convert_trades_to_ohlcv(
+        [pair, "NoDatapair"],
+        timeframes=["1m", "5m"],
+        data_format_trades="jsongz",
+        datadir=tmp_path,
+        timerange=TimeRange(),
+        erase=False,
+        data_format_ohlcv="feather",
+        candle_type=CandleType.SPOT,
+    )
+    assert log_has("Could not convert NoDatapair to OHLCV.", caplog)
+    assert not log_has(f"Could not convert {pair} to OHLCV.", caplog)
+    for timeframe in ("1m", "5m"):
+        assert_frame_equal(
+            load_pair_history(datadir=tmp_path, timeframe=timeframe, pair=pair),
+            load_pair_history(datadir=testdatadir, timeframe=timeframe, pair=pair),
+            check_exact=True,
+        )
@@ -6,11 +6,18 @@ from freqtrade.constants import DEFAULT_TRADES_COLUMNS
 from freqtrade.data.converter import populate_dataframe_with_trades
 from freqtrade.data.converter.orderflow import (
     ORDERFLOW_ADDED_COLUMNS,
+    ORDERFLOW_DTYPE,
+    candle_trades_to_dataframe,
+    orderflow_to_dataframe,
+    stacked_imbalance_ask,
+    stacked_imbalance_bid,
     timeframe_to_DateOffset,
+    trades_orderflow_to_imbalances,
     trades_to_volumeprofile_with_total_delta_bid_ask,
 )
 from freqtrade.data.converter.trade_converter import trades_list_to_df
 from freqtrade.data.dataprovider import DataProvider
+from freqtrade.misc import dataframe_to_json, json_to_dataframe
 from tests.strategy.strats.strategy_test_v3 import StrategyTestV3
 
 
@@ -388,6 +395,143 @@ def test_public_trades_binned_big_sample_list(public_trades_list):
     assert 52.7199999 == pytest.approx(df["delta"].iat[0])  # delta
 
 
+def test_public_trades_populate_dataframe_with_trades_per_candle(public_trades_list):
+    """
+    All candles are calculated at once - results have to match calculating every
+    candle separately.
+    """
+    trades = trades_list_to_df(public_trades_list[DEFAULT_TRADES_COLUMNS].values.tolist())
+    dates = pd.date_range(
+        trades["date"].min().floor("1min"), trades["date"].max().floor("1min"), freq="1min"
+    )
+    dataframe = pd.DataFrame({"date": dates, "open": 1.0, "high": 1.0, "low": 1.0, "close": 1.0})
+    dataframe["volume"] = 1.0
+    assert len(dataframe) > 2
+    config = {
+        "timeframe": "1m",
+        "orderflow": {
+            "cache_size": 1000,
+            "max_candles": 1500,
+            "scale": 0.05,
+            "imbalance_volume": 0,
+            "imbalance_ratio": 3,
+            "stacked_imbalance_range": 2,
+        },
+    }
+
+    df, cache = populate_dataframe_with_trades(None, config, dataframe.copy(), trades.copy())
+    assert df["total_trades"].sum() == len(trades)
+    for row in df.itertuples():
+        candle_trades = trades.loc[trades["date"].dt.floor("1min") == row.date]
+        assert row.total_trades == len(candle_trades)
+        assert [t["id"] for t in row.trades] == candle_trades["id"].tolist()
+        assert list(row.trades[0].keys()) == [*DEFAULT_TRADES_COLUMNS, "date"]
+
+        orderflow = trades_to_volumeprofile_with_total_delta_bid_ask(candle_trades, scale=0.05)
+        assert row.orderflow == orderflow.to_dict(orient="index")
+        imbalances = trades_orderflow_to_imbalances(
+            orderflow, imbalance_ratio=3, imbalance_volume=0
+        )
+        assert row.imbalances == imbalances.to_dict(orient="index")
+        assert row.stacked_imbalances_bid == stacked_imbalance_bid(imbalances, 2) or (
+            np.isnan(row.stacked_imbalances_bid) and np.isnan(stacked_imbalance_bid(imbalances, 2))
+        )
+        assert row.stacked_imbalances_ask == stacked_imbalance_ask(imbalances, 2) or (
+            np.isnan(row.stacked_imbalances_ask) and np.isnan(stacked_imbalance_ask(imbalances, 2))
+        )
+
+        bid = candle_trades.loc[candle_trades["side"] == "sell", "amount"].sum()
+        ask = candle_trades.loc[candle_trades["side"] == "buy", "amount"].sum()
+        assert row.bid == pytest.approx(bid)
+        assert row.ask == pytest.approx(ask)
+        assert row.delta == pytest.approx(ask - bid)
+        deltas = np.where(candle_trades["side"] == "buy", 1, -1) * candle_trades["amount"]
+        assert row.max_delta == pytest.approx(deltas.cumsum().max())
+        assert row.min_delta == pytest.approx(deltas.cumsum().min())
+
+    # Cached candles are taken from the cache
+    trades_changed = trades.copy()
+    trades_changed["amount"] = 1.0
+    df1, _ = populate_dataframe_with_trades(cache, config, dataframe.copy(), trades_changed)
+    for col in ORDERFLOW_ADDED_COLUMNS:
+        pd.testing.assert_series_equal(df1[col], df[col])
+
+
+def test_public_trades_populate_dataframe_with_trades_compact(public_trades_list):
+    trades = trades_list_to_df(public_trades_list[DEFAULT_TRADES_COLUMNS].values.tolist())
+    dates = pd.date_range(
+        trades["date"].min().floor("1min"),
+        trades["date"].max().floor("1min") + pd.Timedelta("1min"),
+        freq="1min",
+    )
+    dataframe = pd.DataFrame({"date": dates, "open": 1.0, "high": 1.0, "low": 1.0, "close": 1.0})
+    dataframe["volume"] = 1.0
+    config = {
+        "timeframe": "1m",
+        "orderflow": {
+            "cache_size": 1000,
+            "max_candles": 1500,
+            "scale": 0.05,
+            "imbalance_volume": 0,
+            "imbalance_ratio": 3,
+            "stacked_imbalance_range": 2,
+        },
+    }
+    df, _ = populate_dataframe_with_trades(None, config, dataframe.copy(), trades.copy())
+    config["orderflow"]["compact"] = True
+    df_compact, _ = populate_dataframe_with_trades(None, config, dataframe.copy(), trades.copy())
+
+    # Scalar columns are identical
+    for col in ORDERFLOW_ADDED_COLUMNS[3:]:
+        pd.testing.assert_series_equal(df_compact[col], df[col])
+
+    assert np.isnan(df_compact["orderflow"].iat[-1])
+    assert orderflow_to_dataframe(df_compact["orderflow"].iat[-1]).empty
+    assert candle_trades_to_dataframe(df_compact["trades"].iat[-1]).empty
+
+    row = df_compact.iloc[0]
+    assert isinstance(row["orderflow"], np.ndarray)
+    assert row["orderflow"].dtype == ORDERFLOW_DTYPE
+    assert row["orderflow"]["total_trades"].sum() == row["total_trades"]
+    assert row["trades"]["side"][0] in ("buy", "sell")
+
+    for idx in range(len(df) - 1):
+        pd.testing.assert_frame_equal(
+            orderflow_to_dataframe(df_compact["orderflow"].iat[idx]),
+            orderflow_to_dataframe(df["orderflow"].iat[idx]),
+        )
+        pd.testing.assert_frame_equal(
+            orderflow_to_dataframe(df_compact["imbalances"].iat[idx]),
+            orderflow_to_dataframe(df["imbalances"].iat[idx]),
+        )
+        trades_compact = candle_trades_to_dataframe(df_compact["trades"].iat[idx])
+        trades_default = candle_trades_to_dataframe(df["trades"].iat[idx])
+        pd.testing.assert_frame_equal(trades_compact, trades_default[trades_compact.columns])
+
+    # Field names survive serialization (e.g. for websocket consumers)
+    df_json = json_to_dataframe(dataframe_to_json(df_compact))
+    # Input dataframe is not modified
+    assert df_compact["orderflow"].iat[0].dtype == ORDERFLOW_DTYPE
+    assert isinstance(df_json["orderflow"].iat[0], list)
+    assert orderflow_to_dataframe(df_json["orderflow"].iat[-1]).empty
+    for idx in range(len(df) - 1):
+        pd.testing.assert_frame_equal(
+            orderflow_to_dataframe(df_json["orderflow"].iat[idx]),
+            orderflow_to_dataframe(df_compact["orderflow"].iat[idx]),
+            check_dtype=False,
+        )
+        pd.testing.assert_frame_equal(
+            orderflow_to_dataframe(df_json["imbalances"].iat[idx]),
+            orderflow_to_dataframe(df_compact["imbalances"].iat[idx]),
+            check_dtype=False,
+        )
+        pd.testing.assert_frame_equal(
+            candle_trades_to_dataframe(df_json["trades"].iat[idx]),
+            candle_trades_to_dataframe(df_compact["trades"].iat[idx]),
+            check_dtype=False,
+        )
+
+
 def test_public_trades_config_max_trades(
     default_conf, populate_dataframe_with_trades_dataframe, populate_dataframe_with_trades_trades
 ):
@@ -6,7 +6,7 @@ from pathlib import Path
 from unittest.mock import MagicMock
 
 import pytest
-from pandas import DataFrame, Timestamp
+from pandas import DataFrame, Timestamp, concat
 from pandas.testing import assert_frame_equal
 
 from freqtrade.configuration import TimeRange
@@ -19,6 +19,7 @@ from freqtrade.data.history.datahandlers.idatahandler import (
     get_datahandlerclass,
 )
 from freqtrade.data.history.datahandlers.jsondatahandler import JsonDataHandler, JsonGzDataHandler
+from freqtrade.data.history.datahandlers.memmapdatahandler import MemmapDataHandler
 from freqtrade.data.history.datahandlers.parquetdatahandler import ParquetDataHandler
 from freqtrade.enums import CandleType, TradingMode
 from tests.conftest import log_has, log_has_re
@@ -298,18 +299,57 @@ def test_jsondatahandler_trades_load(testdatadir, caplog):
     assert log_has(logmsg, caplog)
 
 
-@pytest.mark.parametrize("datahandler", AVAILABLE_DATAHANDLERS)
+@pytest.mark.parametrize("datahandler", ["json", "jsongz", "parquet", "memmap"])
 def test_datahandler_ohlcv_append(
     datahandler,
     testdatadir,
 ):
     dh = get_datahandler(testdatadir, datahandler)
+    assert not dh.ohlcv_append_supported()
     with pytest.raises(NotImplementedError):
         dh.ohlcv_append("UNITTEST/ETH", "5m", DataFrame(), CandleType.SPOT)
     with pytest.raises(NotImplementedError):
         dh.ohlcv_append("UNITTEST/ETH", "5m", DataFrame(), CandleType.MARK)
 
 
+@pytest.mark.parametrize("datahandler", ["feather", "hdf5"])
+def test_datahandler_ohlcv_append_supported(mocker, datahandler, testdatadir, tmp_path):
+    dh = get_datahandler(testdatadir, datahandler)
+    data = dh.ohlcv_load("UNITTEST/BTC", "5m", CandleType.SPOT)
+    dh1 = get_datahandler(tmp_path, datahandler)
+    assert dh1.ohlcv_append_supported()
+    if datahandler == "feather":
+        mocker.patch.object(dh1, "_OHLCV_MAX_PARTS", 2)
+
+    # Appending to missing data stores it
+    dh1.ohlcv_append("UNITTEST/BTC", "5m", data.iloc[:1000], CandleType.SPOT)
+    for start, end in ((1000, 1500), (1500, 1600), (1600, 1600), (1600, 2000), (2000, 2500)):
+        dh1.ohlcv_append("UNITTEST/BTC", "5m", data.iloc[start:end], CandleType.SPOT)
+        assert_frame_equal(dh1.ohlcv_load("UNITTEST/BTC", "5m", CandleType.SPOT), data.iloc[:end])
+        assert dh1.ohlcv_data_min_max("UNITTEST/BTC", "5m", CandleType.SPOT) == (
+            data.iloc[0]["date"].to_pydatetime(),
+            data.iloc[end - 1]["date"].to_pydatetime(),
+            end,
+        )
+
+    timerange = TimeRange.parse_timerange("20180110-20180112")
+    assert_frame_equal(
+        dh1.ohlcv_load("UNITTEST/BTC", "5m", CandleType.SPOT, timerange=timerange),
+        dh.ohlcv_load("UNITTEST/BTC", "5m", CandleType.SPOT, timerange=timerange),
+    )
+    if datahandler == "feather":
+        file = tmp_path / "UNITTEST_BTC-5m.feather"
+        # Compacted after 2 parts
+        assert [p.name for p in FeatherDataHandler._part_files(file)] == ["000000.feather"]
+        dh1.ohlcv_store("UNITTEST/BTC", "5m", data, CandleType.SPOT)
+        assert not FeatherDataHandler._parts_dir(file).exists()
+        dh1.ohlcv_append("UNITTEST/BTC", "5m", data.iloc[:0], CandleType.SPOT)
+        dh1.ohlcv_append("UNITTEST/BTC", "5m", data.iloc[-1:], CandleType.SPOT)
+        assert dh1.ohlcv_purge("UNITTEST/BTC", "5m", CandleType.SPOT)
+        assert not FeatherDataHandler._parts_dir(file).exists()
+        assert not file.exists()
+
+
 @pytest.mark.parametrize("datahandler", AVAILABLE_DATAHANDLERS)
 def test_datahandler_trades_append(datahandler, testdatadir):
     dh = get_datahandler(testdatadir, datahandler)
@@ -324,6 +364,7 @@ def test_datahandler_trades_append(datahandler, testdatadir):
         ("hdf5", {"XRP/ETH"}),
         ("feather", {"XRP/ETH"}),
         ("parquet", {"XRP/ETH"}),
+        ("memmap", {"XRP/ETH"}),
     ],
 )
 def test_datahandler_trades_get_pairs(testdatadir, datahandler, expected):
@@ -419,7 +460,7 @@ def test_hdf5datahandler_ohlcv_load_and_resave(
         ("UNITTEST/USDT:USDT", "1h", "mark", "-mark", "2021-11-16", "2021-11-18"),
     ],
 )
-@pytest.mark.parametrize("datahandler", ["hdf5", "feather", "parquet"])
+@pytest.mark.parametrize("datahandler", ["hdf5", "feather", "parquet", "memmap"])
 def test_generic_datahandler_ohlcv_load_and_resave(
     datahandler,
     mocker,
@@ -489,11 +530,120 @@ def test_generic_datahandler_ohlcv_load_and_resave(
         "freqtrade.data.history.datahandlers.hdf5datahandler.pd.read_hdf",
         side_effect=Exception("Test"),
     )
+    mocker.patch(
+        "freqtrade.data.history.datahandlers.memmapdatahandler.np.memmap",
+        side_effect=Exception("Test"),
+    )
     ohlcv_e = dh1.ohlcv_load("UNITTEST/NEW", timeframe, candle_type=candle_type)
     assert ohlcv_e.empty
     assert log_has_re("Error loading data from", caplog)
 
 
+@pytest.mark.parametrize("datahandler", ["feather", "parquet"])
+def test_datahandler_ohlcv_load_timerange_blocks(mocker, testdatadir, tmp_path, datahandler):
+    dhbase = get_datahandler(testdatadir, "feather")
+    ohlcv = dhbase._ohlcv_load("UNITTEST/BTC", "5m", None, candle_type=CandleType.SPOT)
+    dh = get_datahandler(tmp_path, datahandler)
+    mocker.patch.object(dh, "_OHLCV_BLOCK_SIZE", 500)
+    dh.ohlcv_store("UNITTEST/BTC", "5m", ohlcv, CandleType.SPOT)
+
+    assert_frame_equal(dh._ohlcv_load("UNITTEST/BTC", "5m", None, CandleType.SPOT), ohlcv)
+
+    timerange = TimeRange.parse_timerange("20180115-20180119")
+    trimmed = ohlcv[(ohlcv["date"] >= timerange.startdt) & (ohlcv["date"] <= timerange.stopdt)]
+    # Only blocks covering the timerange (and the candles before / after it) are loaded
+    ohlcv1 = dh._ohlcv_load("UNITTEST/BTC", "5m", timerange, CandleType.SPOT)
+    assert len(ohlcv1) == 2500
+    assert ohlcv1.iloc[0]["date"] < trimmed.iloc[0]["date"]
+    assert ohlcv1.iloc[-1]["date"] > trimmed.iloc[-1]["date"]
+    assert_frame_equal(
+        dh.ohlcv_load("UNITTEST/BTC", "5m", CandleType.SPOT, timerange=timerange),
+        dhbase.ohlcv_load("UNITTEST/BTC", "5m", CandleType.SPOT, timerange=timerange),
+    )
+
+    # Timerange outside of the data
+    timerange = TimeRange.parse_timerange("20200101-20200201")
+    assert len(dh._ohlcv_load("UNITTEST/BTC", "5m", timerange, CandleType.SPOT)) == len(ohlcv) % 500
+
+    dh.ohlcv_store("UNITTEST/EMPTY", "5m", ohlcv.iloc[:0], CandleType.SPOT)
+    assert dh._ohlcv_load("UNITTEST/EMPTY", "5m", timerange, CandleType.SPOT).empty
+
+
+def test_feather_datahandler_ohlcv_load_timerange_legacy(testdatadir):
+    # Files without block information are loaded completely
+    dh = get_datahandler(testdatadir, "feather")
+    ohlcv = dh._ohlcv_load("UNITTEST/BTC", "5m", None, candle_type=CandleType.SPOT)
+    timerange = TimeRange.parse_timerange("20180115-20180119")
+    assert_frame_equal(dh._ohlcv_load("UNITTEST/BTC", "5m", timerange, CandleType.SPOT), ohlcv)
+
+
+def test_timerange_blocks():
+    block_starts = [1000, 2000, 3000, 4000]
+    assert IDataHandler._timerange_blocks(block_starts, None) == range(0, 4)
+    assert IDataHandler._timerange_blocks([], None) == range(0)
+    assert IDataHandler._timerange_blocks(block_starts, TimeRange("date", "date", 2, 3)) == range(
+        0, 4
+    )
+    assert IDataHandler._timerange_blocks(block_starts, TimeRange("date", "date", 3, 3)) == range(
+        1, 4
+    )
+    assert IDataHandler._timerange_blocks(block_starts, TimeRange("date", None, 4, 0)) == range(
+        2, 4
+    )
+    assert IDataHandler._timerange_blocks(block_starts, TimeRange(None, "date", 0, 1)) == range(
+        0, 2
+    )
+    assert IDataHandler._timerange_blocks(block_starts, TimeRange("date", "date", 5, 6)) == range(
+        3, 4
+    )
+
+
+def test_memmapdatahandler_ohlcv_timerange(testdatadir, tmp_path, caplog):
+    dhbase = get_datahandler(testdatadir, "feather")
+    ohlcv = dhbase._ohlcv_load("UNITTEST/BTC", "5m", None, candle_type=CandleType.SPOT)
+    dh = get_datahandler(tmp_path, "memmap")
+    dh.ohlcv_store("UNITTEST/BTC", "5m", ohlcv, CandleType.SPOT)
+
+    assert_frame_equal(dh._ohlcv_load("UNITTEST/BTC", "5m", None, CandleType.SPOT), ohlcv)
+    min_max = dh.ohlcv_data_min_max("UNITTEST/BTC", "5m", CandleType.SPOT)
+    assert min_max == dhbase.ohlcv_data_min_max("UNITTEST/BTC", "5m", CandleType.SPOT)
+
+    timerange = TimeRange.parse_timerange("20180115-20180119")
+    trimmed = ohlcv[(ohlcv["date"] >= timerange.startdt) & (ohlcv["date"] <= timerange.stopdt)]
+    # Only the timerange is loaded - plus one candle before and after it
+    ohlcv1 = dh._ohlcv_load("UNITTEST/BTC", "5m", timerange, CandleType.SPOT)
+    assert len(ohlcv1) == len(trimmed) + 2
+    assert ohlcv1.iloc[1]["date"] == trimmed.iloc[0]["date"]
+    assert ohlcv1.iloc[-2]["date"] == trimmed.iloc[-1]["date"]
+
+    ohlcv2 = dh.ohlcv_load("UNITTEST/BTC", "5m", CandleType.SPOT, timerange=timerange)
+    assert_frame_equal(
+        ohlcv2, dhbase.ohlcv_load("UNITTEST/BTC", "5m", CandleType.SPOT, timerange=timerange)
+    )
+
+    # Timerange outside of the data
+    timerange = TimeRange.parse_timerange("20200101-20200201")
+    assert len(dh._ohlcv_load("UNITTEST/BTC", "5m", timerange, CandleType.SPOT)) == 1
+
+    # Empty data
+    dh.ohlcv_store("UNITTEST/EMPTY", "5m", ohlcv.iloc[:0], CandleType.SPOT)
+    assert dh._ohlcv_load("UNITTEST/EMPTY", "5m", None, CandleType.SPOT).empty
+    assert dh.ohlcv_data_min_max("UNITTEST/EMPTY", "5m", CandleType.SPOT)[2] == 0
+
+    # Truncated file
+    file = tmp_path / "UNITTEST_BTC-5m.memmap"
+    file.write_bytes(file.read_bytes()[:-8])
+    assert dh._ohlcv_load("UNITTEST/BTC", "5m", None, CandleType.SPOT).empty
+    assert log_has_re(r"Error loading data from .*File size doesn't match", caplog)
+    assert dh.ohlcv_data_min_max("UNITTEST/BTC", "5m", CandleType.SPOT)[2] == 0
+
+    # Trades use the feather format
+    trades = dhbase.trades_load("XRP/ETH", TradingMode.SPOT)
+    dh.trades_store("XRP/NEW", trades, TradingMode.SPOT)
+    assert (tmp_path / "XRP_NEW-trades.feather").is_file()
+    assert_frame_equal(dh.trades_load("XRP/NEW", TradingMode.SPOT), trades)
+
+
 def test_hdf5datahandler_ohlcv_purge(mocker, testdatadir):
     mocker.patch.object(Path, "exists", MagicMock(return_value=False))
     unlinkmock = mocker.patch.object(Path, "unlink", MagicMock())
@@ -508,7 +658,7 @@ def test_hdf5datahandler_ohlcv_purge(mocker, testdatadir):
     assert unlinkmock.call_count == 2
 
 
-@pytest.mark.parametrize("datahandler", ["jsongz", "hdf5", "feather", "parquet"])
+@pytest.mark.parametrize("datahandler", ["jsongz", "hdf5", "feather", "parquet", "memmap"])
 def test_datahandler_trades_load(testdatadir, datahandler):
     dh = get_datahandler(testdatadir, datahandler)
     trades = dh.trades_load("XRP/ETH", TradingMode.SPOT)
@@ -538,7 +688,7 @@ def test_datahandler_trades_store(testdatadir, tmp_path, datahandler):
     assert len(trades_new) == len(trades)
 
 
-@pytest.mark.parametrize("datahandler", ["jsongz", "hdf5", "feather", "parquet"])
+@pytest.mark.parametrize("datahandler", ["jsongz", "hdf5", "feather", "parquet", "memmap"])
 def test_datahandler_trades_purge(mocker, testdatadir, datahandler):
     mocker.patch.object(Path, "exists", MagicMock(return_value=False))
     unlinkmock = mocker.patch.object(Path, "unlink", MagicMock())
@@ -566,6 +716,35 @@ def test_datahandler_trades_get_available_data(testdatadir):
     assert set(paircombs) == {"XRP/ETH"}
 
 
+@pytest.mark.parametrize("datahandler", ["jsongz", "hdf5", "feather", "parquet"])
+def test_datahandler_trades_load_chunks(testdatadir, tmp_path, datahandler):
+    dh = get_datahandler(testdatadir, datahandler)
+    trades = dh.trades_load("XRP/ETH", TradingMode.SPOT)
+
+    dh1 = get_datahandler(tmp_path, datahandler)
+    dh1._TRADES_BLOCK_SIZE = 100
+    dh1.trades_store("XRP/NEW", trades, TradingMode.SPOT)
+
+    chunks = list(dh1.trades_load_chunks("XRP/NEW", TradingMode.SPOT))
+    if datahandler in ("feather", "parquet"):
+        assert len(chunks) == -(-len(trades) // 100)
+    assert_frame_equal(concat(chunks, ignore_index=True), trades, check_exact=True)
+
+    # data goes from 2019-10-11 - 2019-10-13
+    timerange = TimeRange.parse_timerange("20191012-20191013")
+    trades_tr = dh1.trades_load("XRP/NEW", TradingMode.SPOT, timerange=timerange)
+    assert 0 < len(trades_tr) < len(trades)
+    assert trades_tr.iloc[0]["timestamp"] >= timerange.startts * 1000
+    assert trades_tr.iloc[-1]["timestamp"] < timerange.stopts * 1000
+    expected = trades.loc[
+        (trades["timestamp"] >= timerange.startts * 1000)
+        & (trades["timestamp"] < timerange.stopts * 1000)
+    ].reset_index(drop=True)
+    assert_frame_equal(trades_tr, expected, check_exact=True)
+
+    assert list(dh1.trades_load_chunks("UNITTEST/NONEXIST", TradingMode.SPOT)) == []
+
+
 def test_datahandler_trades_data_min_max(testdatadir):
     dh = FeatherDataHandler(testdatadir)
     min_max = dh.trades_data_min_max("XRP/ETH", TradingMode.SPOT)
@@ -606,6 +785,10 @@ def test_gethandlerclass():
     assert cl == ParquetDataHandler
     assert issubclass(cl, IDataHandler)
 
+    cl = get_datahandlerclass("memmap")
+    assert cl == MemmapDataHandler
+    assert issubclass(cl, IDataHandler)
+
     with pytest.raises(ValueError, match=r"No datahandler for .*"):
         get_datahandlerclass("DeadBeef")
 
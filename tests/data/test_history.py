@@ -1,7 +1,9 @@
 # pragma pylint: disable=missing-docstring, protected-access, C0103
 
+import asyncio
 import json
 import logging
+import threading
 import uuid
 from datetime import timedelta
 from pathlib import Path
@@ -37,6 +39,7 @@ from freqtrade.util import dt_ts, dt_utc
 from tests.conftest import (
     CURRENT_TEST_STRATEGY,
     EXMS,
+    generate_test_data_raw,
     get_patched_exchange,
     log_has,
     log_has_re,
@@ -357,6 +360,10 @@ def test_download_pair_history2(mocker, default_conf, testdatadir, ohlcv_history
         "freqtrade.data.history.datahandlers.featherdatahandler.FeatherDataHandler.ohlcv_store",
         return_value=None,
     )
+    append_mock = mocker.patch(
+        "freqtrade.data.history.datahandlers.featherdatahandler.FeatherDataHandler.ohlcv_append",
+        return_value=None,
+    )
     exchange = get_patched_exchange(mocker, default_conf)
     mocker.patch.object(exchange, "get_historic_ohlcv", return_value=ohlcv_history)
     _download_pair_history(
@@ -380,7 +387,10 @@ def test_download_pair_history2(mocker, default_conf, testdatadir, ohlcv_history
         timeframe="1h",
         candle_type="mark",
     )
-    assert json_dump_mock.call_count == 3
+    # Existing 1m data is appended to
+    assert json_dump_mock.call_count == 2
+    assert append_mock.call_count == 1
+    assert append_mock.call_args_list[0][0][:2] == ("UNITTEST/BTC", "1m")
 
 
 def test_download_backtesting_data_exception(mocker, caplog, default_conf, tmp_path) -> None:
@@ -571,6 +581,43 @@ def test_refresh_backtest_ohlcv_data(
         assert log_has_re(r"Downloading pair ETH/BTC, mark, interval 4h\.", caplog)
 
 
+def test_refresh_backtest_ohlcv_data_concurrent(mocker, default_conf, markets, tmp_path):
+    running = 0
+    max_running = 0
+    threads = set()
+
+    async def get_historic_ohlcv(pair, timeframe, since_ms, candle_type, **kwargs):
+        nonlocal running, max_running
+        threads.add(threading.current_thread().name)
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.05)
+        running -= 1
+        data = generate_test_data_raw(timeframe, 10, "2024-01-01")
+        return pair, timeframe, candle_type, data, True
+
+    mocker.patch(f"{EXMS}.markets", PropertyMock(return_value=markets))
+    mocker.patch(f"{EXMS}._async_get_historic_ohlcv", side_effect=get_historic_ohlcv)
+    ex = get_patched_exchange(mocker, default_conf, exchange="bybit")
+    ex._api_async.rateLimit = 250
+    assert ex.parallel_downloads == 4
+
+    refresh_backtest_ohlcv_data(
+        exchange=ex,
+        pairs=["ETH/BTC", "XRP/BTC", "LTC/BTC"],
+        timeframes=["5m", "1h"],
+        datadir=tmp_path,
+        trading_mode="spot",
+    )
+    # All requests are run on the exchange's loop - but for multiple pairs at once
+    assert threads == {"ft_exchange_loop"}
+    assert max_running == 4
+    assert not ex.loop.is_running()
+    assert len(list(tmp_path.glob("*.feather"))) == 6
+    data = load_pair_history("LTC/BTC", "1h", tmp_path)
+    assert len(data) == 9
+
+
 def test_download_data_no_markets(mocker, default_conf, caplog, testdatadir):
     dl_mock = mocker.patch(
         "freqtrade.data.history.history_utils._download_pair_history", MagicMock()
@@ -9,8 +9,10 @@ import ccxt
 import pytest
 from numpy import nan
 from pandas import DataFrame, to_datetime
+from pandas.testing import assert_frame_equal
 
 from freqtrade.constants import DEFAULT_DATAFRAME_COLUMNS
+from freqtrade.data.converter import clean_ohlcv_dataframe, trades_df_remove_duplicates
 from freqtrade.enums import CandleType, MarginMode, RunMode, TradingMode
 from freqtrade.exceptions import (
     ConfigurationError,
@@ -2578,6 +2580,113 @@ def test_refresh_latest_ohlcv_cache(mocker, default_conf, candle_type, time_mach
     assert res[pair2].at[0, "open"]
 
 
+def test__process_ohlcv_df_buffer(mocker, default_conf) -> None:
+    ohlcv = generate_test_data_raw("1h", 400, "2021-08-01")
+    mocker.patch(f"{EXMS}.ohlcv_candle_limit", return_value=100)
+    exchange = get_patched_exchange(mocker, default_conf)
+    exchange_ref = get_patched_exchange(mocker, default_conf)
+    pair_key = ("ETH/BTC", "1h", CandleType.SPOT)
+    clean_mock = mocker.patch(
+        "freqtrade.exchange.exchange.clean_ohlcv_dataframe", wraps=clean_ohlcv_dataframe
+    )
+
+    def process(exch, ticks):
+        return exch._process_ohlcv_df(*pair_key, ticks, True, False)
+
+    process(exchange, ohlcv[:150])
+    process(exchange_ref, ohlcv[:150])
+    assert len(exchange._klines[pair_key]) == 150
+    assert pair_key in exchange._klines_buffers
+
+    # Overlapping refreshes (incl. changes to the last candle) are merged into the buffer
+    previous = None
+    for end in range(151, 400, 7):
+        ticks = [list(t) for t in ohlcv[end - 20 : end]]
+        ticks[-1][2] += 1.0
+        ticks[-1][4] += 0.5
+        res = process(exchange, ticks)
+        # Reference without buffer
+        exchange_ref._klines_buffers.clear()
+        expected = process(exchange_ref, ticks)
+        assert len(res) == 100
+        assert_frame_equal(res, expected)
+        assert exchange._klines[pair_key] is res
+        # Dataframes handed out previously are not modified by the update
+        if previous is not None:
+            assert_frame_equal(previous[0], previous[1])
+        previous = (res, res.copy())
+    # Only the reference used the full cleanup
+    assert clean_mock.call_count == 36
+
+    # Gap - falls back to cleaning the combined dataframe
+    res = process(exchange, ohlcv[398:399])
+    assert clean_mock.call_count == 37
+    assert len(res) == 100
+    assert res.iloc[-1]["date"] == to_datetime(ohlcv[398][0], unit="ms", utc=True)
+    assert res.iloc[-2]["volume"] == 0
+
+    # Cache replaced outside of the buffer
+    exchange._klines[pair_key] = exchange._klines[pair_key].iloc[:-3]
+    res = process(exchange, ohlcv[395:])
+    assert clean_mock.call_count == 38
+    assert res.iloc[-1]["date"] == to_datetime(ohlcv[-1][0], unit="ms", utc=True)
+
+    # Evicting the cache drops the buffer as well
+    exchange._evict_cached_ohlcv(pair_key)
+    assert pair_key not in exchange._klines
+    assert pair_key not in exchange._klines_buffers
+
+
+def test__process_trades_df_buffer(mocker, default_conf) -> None:
+    start = 1_627_776_000_000
+    ticks = [
+        [start + i * 500, str(1000 + i), None, "buy" if i % 3 else "sell", 10 + i % 7, 0.5, 5.0]
+        for i in range(3000)
+    ]
+    exchange = get_patched_exchange(mocker, default_conf)
+    exchange_ref = get_patched_exchange(mocker, default_conf)
+    pair_key = ("ETH/BTC", "5m", CandleType.SPOT)
+    dedup_mock = mocker.patch(
+        "freqtrade.exchange.exchange.trades_df_remove_duplicates",
+        wraps=trades_df_remove_duplicates,
+    )
+
+    def process(exch, ticks, first_ms):
+        return exch._process_trades_df(*pair_key, ticks, True, first_ms)
+
+    process(exchange, ticks[:1000], start)
+    process(exchange_ref, ticks[:1000], start)
+    assert pair_key in exchange._trades_buffers
+
+    # Refreshes start at the last known trade - and age out old trades
+    previous = None
+    for end in range(1100, 3000, 100):
+        first_ms = start + (end - 1200) * 500
+        # First trade of the refresh is the last stored trade
+        res = process(exchange, ticks[end - 101 : end], first_ms)
+        # Reference without buffer
+        exchange_ref._trades_buffers.clear()
+        expected = process(exchange_ref, ticks[end - 101 : end], first_ms)
+        assert_frame_equal(res, expected)
+        assert exchange._trades[pair_key] is res
+        assert res["id"].is_unique
+        assert res.iloc[0]["timestamp"] > first_ms
+        assert res.iloc[-1]["id"] == ticks[end - 1][1]
+        # Dataframes handed out previously are not modified by the update
+        if previous is not None:
+            assert_frame_equal(previous[0], previous[1])
+        previous = (res, res.copy())
+    # Only the reference deduplicated all trades
+    assert dedup_mock.call_count == 19
+
+    # Trades older than the last trade - falls back to deduplicating the combined trades
+    res = process(exchange, [ticks[10], *ticks[2990:]], start)
+    assert dedup_mock.call_count == 20
+    assert ticks[10][1] in res["id"].tolist()
+    assert res.iloc[-1]["id"] == ticks[-1][1]
+    assert exchange._trades_buffers[pair_key].dataframe is res
+
+
 def test_refresh_ohlcv_with_cache(mocker, default_conf, time_machine) -> None:
     start = datetime(2021, 8, 1, 0, 0, 0, 0, tzinfo=timezone.utc)
     ohlcv = generate_test_data_raw("1h", 100, start.strftime("%Y-%m-%d"))
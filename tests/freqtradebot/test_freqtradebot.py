@@ -688,6 +688,22 @@ def test_process_trade_creation(
 
     freqtrade.process()
 
+    phases = {t["phase"] for t in freqtrade.phase_timings.to_json()["timings"]}
+    assert phases >= {
+        "reload_markets",
+        "update_fees",
+        "refresh_pairlist",
+        "refresh_data",
+        "bot_loop_start",
+        "analyze",
+        "manage_open_orders",
+        "exit_positions",
+        "enter_positions",
+        "commit",
+        "process",
+    }
+    assert "adjust_positions" not in phases
+
     trades = Trade.get_open_trades()
     assert len(trades) == 1
     trade = trades[0]
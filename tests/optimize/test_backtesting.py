@@ -1,6 +1,7 @@
 # pragma pylint: disable=missing-docstring, W0212, line-too-long, C0103, unused-argument
 
 import random
+import sys
 from collections import defaultdict
 from copy import deepcopy
 from datetime import datetime, timedelta, timezone
@@ -19,11 +20,17 @@ from freqtrade.data.btanalysis import BT_DATA_COLUMNS, evaluate_result_multi
 from freqtrade.data.converter import clean_ohlcv_dataframe, ohlcv_fill_up_missing_data
 from freqtrade.data.dataprovider import DataProvider
 from freqtrade.data.history import get_timerange
-from freqtrade.enums import CandleType, ExitType, RunMode
+from freqtrade.enums import CandleType, ExitType, RunMode, TradingMode
 from freqtrade.exceptions import DependencyException, OperationalException
 from freqtrade.exchange import timeframe_to_next_date, timeframe_to_prev_date
-from freqtrade.optimize.backtest_caching import get_backtest_metadata_filename, get_strategy_run_id
+from freqtrade.optimize.backtest_caching import (
+    get_backtest_metadata_filename,
+    get_strategy_run_id,
+    get_strategy_signal_id,
+)
 from freqtrade.optimize.backtesting import Backtesting
+from freqtrade.optimize.bt_arrays import PairArrays
+from freqtrade.optimize.signal_cache import SignalCache
 from freqtrade.persistence import LocalTrade, Trade
 from freqtrade.resolvers import StrategyResolver
 from freqtrade.util.datetime_helpers import dt_utc
@@ -1909,6 +1916,281 @@ def test_backtest_multi_pair_long_short_switch(
     assert len(results["results"]) == 53
 
 
+@pytest.mark.parametrize("use_detail", [True, False])
+@pytest.mark.parametrize("tres", [0, 20])
+@pytest.mark.parametrize("use_bot_loop_start", [True, False])
+def test_backtest_engine_numpy_parity(
+    default_conf_usdt, fee, mocker, tres, use_detail, use_bot_loop_start
+):
+    def _trend_alternate_hold(dataframe=None, metadata=None):
+        multi = 20 if metadata["pair"] in ("ETH/USDT", "LTC/USDT") else 18
+        dataframe["enter_long"] = np.where(dataframe.index % multi == 0, 1, 0)
+        dataframe["enter_tag"] = np.where(dataframe.index % multi == 0, "tag_a", None)
+        dataframe["exit_long"] = np.where((dataframe.index + multi - 2) % multi == 0, 1, 0)
+        dataframe["enter_short"] = 0
+        dataframe["exit_short"] = 0
+        return dataframe
+
+    default_conf_usdt.update(
+        {
+            "runmode": "backtest",
+            "timeframe": "5m",
+            "max_open_trades": 3,
+            "stoploss": -0.25,
+            "minimal_roi": {"0": 0.3, "20": 0.1},
+        }
+    )
+    if use_detail:
+        default_conf_usdt["timeframe_detail"] = "1m"
+    mocker.patch(f"{EXMS}.get_min_pair_stake_amount", return_value=0.00001)
+    mocker.patch(f"{EXMS}.get_max_pair_stake_amount", return_value=float("inf"))
+    mocker.patch(f"{EXMS}.get_fee", fee)
+    patch_exchange(mocker)
+
+    raw_candles_1m = generate_test_data("1m", 1000, "2022-01-03 12:00:00+00:00")
+    raw_candles = ohlcv_fill_up_missing_data(raw_candles_1m, "5m", "dummy")
+    pairs = ["ADA/USDT", "DASH/USDT", "ETH/USDT", "LTC/USDT", "NXT/USDT"]
+    data = trim_dictlist({pair: raw_candles for pair in pairs}, -200)
+    if tres > 0:
+        # Remove data for one pair from the beginning of the data
+        data["LTC/USDT"] = data["LTC/USDT"][tres:].reset_index()
+
+    all_results = {}
+    for engine in ("list", "numpy"):
+        default_conf_usdt["backtest_engine"] = engine
+        backtesting = Backtesting(deepcopy(default_conf_usdt))
+        backtesting.detail_data = {pair: raw_candles_1m for pair in pairs}
+        backtesting._set_strategy(backtesting.strategylist[0])
+        if use_bot_loop_start:
+            backtesting.strategy.bot_loop_start = MagicMock()
+        backtesting.strategy.advise_entry = _trend_alternate_hold  # Override
+        backtesting.strategy.advise_exit = _trend_alternate_hold  # Override
+        bl_spy = mocker.spy(backtesting, "backtest_loop")
+        sc_spy = mocker.spy(backtesting, "_start_candle")
+
+        processed = backtesting.strategy.advise_all_indicators(data)
+        min_date, max_date = get_timerange(processed)
+        result = backtesting.backtest(
+            processed=deepcopy(processed), start_date=min_date, end_date=max_date
+        )
+        if use_bot_loop_start:
+            # bot_loop_start is called once per candle.
+            assert backtesting.strategy.bot_loop_start.call_count == 199
+        if engine == "list" or use_bot_loop_start:
+            assert sc_spy.call_count == 199
+        else:
+            # Candles without entry candidate or open trade are skipped
+            assert 0 < sc_spy.call_count < 199
+        assert backtesting.progress.progress == 1
+        all_results[engine] = (result, bl_spy.call_count)
+
+    res_list, calls_list = all_results["list"]
+    res_numpy, calls_numpy = all_results["numpy"]
+    assert len(res_list["results"]) > 10
+    assert set(res_list["results"]["exit_reason"]) >= {"roi", "stop_loss"}
+    pd.testing.assert_frame_equal(res_list["results"], res_numpy["results"])
+    assert res_list["final_balance"] == res_numpy["final_balance"]
+    assert res_list["rejected_signals"] == res_numpy["rejected_signals"]
+    # The numpy engine skips pairs without signal and open trade.
+    assert calls_numpy < calls_list
+
+
+@pytest.mark.parametrize(
+    "exit_conf",
+    [
+        {},
+        {"stoploss": -0.9, "minimal_roi": {"0": 10}},
+        {"use_exit_signal": False, "minimal_roi": {"0": 0.5, "100": 0.1}},
+        {"trailing_stop": True},
+        {
+            "trailing_stop": True,
+            "trailing_stop_positive": 0.03,
+            "trailing_stop_positive_offset": 0.05,
+        },
+        {
+            "trailing_stop": True,
+            "trailing_stop_positive": 0.03,
+            "trailing_stop_positive_offset": 0.05,
+            "trailing_only_offset_is_reached": True,
+            "minimal_roi": {"0": 10},
+        },
+    ],
+)
+def test_backtest_engine_numpy_fast_forward(default_conf_usdt, fee, mocker, exit_conf):
+    def _sparse_signals(dataframe=None, metadata=None):
+        dataframe["enter_long"] = np.where(dataframe.index % 40 == 0, 1, 0)
+        dataframe["enter_tag"] = None
+        dataframe["exit_long"] = np.where(dataframe.index % 40 == 30, 1, 0)
+        dataframe["enter_short"] = 0
+        dataframe["exit_short"] = 0
+        return dataframe
+
+    default_conf_usdt.update(
+        {
+            "runmode": "backtest",
+            "timeframe": "5m",
+            "max_open_trades": 3,
+            "stoploss": -0.25,
+            "minimal_roi": {"0": 0.5, "60": 0.2},
+        }
+    )
+    default_conf_usdt.update(exit_conf)
+    mocker.patch(f"{EXMS}.get_min_pair_stake_amount", return_value=0.00001)
+    mocker.patch(f"{EXMS}.get_max_pair_stake_amount", return_value=float("inf"))
+    mocker.patch(f"{EXMS}.get_fee", fee)
+    patch_exchange(mocker)
+
+    raw_candles = generate_test_data("5m", 1000, "2022-01-03 12:00:00+00:00")
+    pairs = ["ADA/USDT", "DASH/USDT", "ETH/USDT"]
+    data = {pair: raw_candles.copy() for pair in pairs}
+
+    all_results = {}
+    for engine in ("list", "numpy"):
+        default_conf_usdt["backtest_engine"] = engine
+        backtesting = Backtesting(deepcopy(default_conf_usdt))
+        backtesting._set_strategy(backtesting.strategylist[0])
+        backtesting.strategy.advise_entry = _sparse_signals  # Override
+        backtesting.strategy.advise_exit = _sparse_signals  # Override
+        bl_spy = mocker.spy(backtesting, "backtest_loop")
+
+        processed = backtesting.strategy.advise_all_indicators(data)
+        min_date, max_date = get_timerange(processed)
+        result = backtesting.backtest(
+            processed=deepcopy(processed), start_date=min_date, end_date=max_date
+        )
+        assert backtesting._can_fast_forward_trades()
+        all_results[engine] = (result, bl_spy.call_count)
+
+    res_list, calls_list = all_results["list"]
+    res_numpy, calls_numpy = all_results["numpy"]
+    assert len(res_list["results"]) > 10
+    pd.testing.assert_frame_equal(res_list["results"], res_numpy["results"])
+    assert res_list["final_balance"] == res_numpy["final_balance"]
+    # Open trades are only processed on candles they may exit on
+    assert calls_numpy < calls_list / 2
+
+
+def test_backtest_engine_numpy_fast_forward_disabled(default_conf_usdt, mocker):
+    patch_exchange(mocker)
+    default_conf_usdt["backtest_engine"] = "numpy"
+    backtesting = Backtesting(default_conf_usdt)
+    backtesting._set_strategy(backtesting.strategylist[0])
+    assert backtesting._can_fast_forward_trades()
+
+    backtesting.strategy.use_custom_stoploss = True
+    assert not backtesting._can_fast_forward_trades()
+    backtesting.strategy.use_custom_stoploss = False
+
+    backtesting.strategy.custom_exit = MagicMock(return_value=None)
+    assert not backtesting._can_fast_forward_trades()
+    del backtesting.strategy.custom_exit
+    assert backtesting._can_fast_forward_trades()
+
+    backtesting.strategy.trailing_stop_positive = abs(backtesting.strategy.stoploss) * 2
+    assert not backtesting._can_fast_forward_trades()
+    backtesting.strategy.trailing_stop_positive = None
+
+    backtesting.trading_mode = TradingMode.FUTURES
+    assert not backtesting._can_fast_forward_trades()
+
+
+@pytest.mark.parametrize("engine", ["list", "numpy"])
+def test_backtest_reuse_signals(default_conf_usdt, fee, mocker, engine):
+    default_conf_usdt.update(
+        {
+            "runmode": "backtest",
+            "timeframe": "5m",
+            "max_open_trades": 3,
+            "backtest_engine": engine,
+        }
+    )
+    mocker.patch(f"{EXMS}.get_min_pair_stake_amount", return_value=0.00001)
+    mocker.patch(f"{EXMS}.get_max_pair_stake_amount", return_value=float("inf"))
+    mocker.patch(f"{EXMS}.get_fee", fee)
+    patch_exchange(mocker)
+
+    raw_candles = generate_test_data("5m", 1000, "2022-01-03 12:00:00+00:00")
+    data = {pair: raw_candles.copy() for pair in ["ADA/USDT", "ETH/USDT"]}
+    backtesting = Backtesting(default_conf_usdt)
+    backtesting._set_strategy(backtesting.strategylist[0])
+    backtesting.strategy.advise_entry = _trend_alternate  # Override
+    backtesting.strategy.advise_exit = _trend_alternate  # Override
+    processed = backtesting.strategy.advise_all_indicators(data)
+    min_date, max_date = get_timerange(processed)
+
+    def run_backtests():
+        results = []
+        for stoploss in (-0.01, -0.05, -0.01):
+            backtesting.strategy.stoploss = stoploss
+            result = backtesting.backtest(
+                processed=deepcopy(processed), start_date=min_date, end_date=max_date
+            )
+            results.append(result["results"])
+        return results
+
+    signals_spy = mocker.spy(backtesting.strategy, "ft_advise_signals")
+    expected = run_backtests()
+    assert signals_spy.call_count == 6
+    assert not backtesting.has_signal_data
+
+    backtesting.reuse_signals = True
+    signals_spy.reset_mock()
+    results = run_backtests()
+    assert signals_spy.call_count == 2
+    assert backtesting.has_signal_data
+    for res, exp in zip(results, expected, strict=True):
+        pd.testing.assert_frame_equal(res, exp)
+    assert len(expected[0]) != len(expected[1])
+
+    # Analyzed dataframes are available to the strategy when reusing signals
+    backtesting.dataprovider.clear_cache()
+    reused = {}
+    backtesting._get_reusable_signal_data(reused, backtesting._get_ohlcv_as_lists)
+    assert signals_spy.call_count == 2
+    assert set(reused.keys()) == {"ADA/USDT", "ETH/USDT"}
+    df, _ = backtesting.dataprovider.get_analyzed_dataframe("ADA/USDT", "5m")
+    assert "enter_long" in df.columns
+
+    # Changing the strategy drops signals
+    backtesting._set_strategy(backtesting.strategylist[0])
+    assert not backtesting.has_signal_data
+
+
+def test_pair_arrays_assign_ticks():
+    df = pd.DataFrame(
+        {
+            "date": pd.to_datetime(
+                ["2022-01-01 00:05", "2022-01-01 00:10", "2022-01-01 00:25", "2022-01-01 00:30"],
+                utc=True,
+            ),
+            "open": [1.0, 2.0, 3.0, 4.0],
+            "high": [1.0, 2.0, 3.0, 4.0],
+            "low": [1.0, 2.0, 3.0, 4.0],
+            "close": [1.0, 2.0, 3.0, 4.0],
+            "enter_long": [1, 0, 1, 1],
+            "exit_long": [0, 0, 0, 1],
+            "enter_short": [0, 0, 0, 0],
+            "exit_short": [0, 0, 0, 0],
+            "enter_tag": ["a", None, None, None],
+            "exit_tag": [None, None, None, None],
+        }
+    )
+    arrays = PairArrays(df)
+    start = pd.Timestamp("2022-01-01 00:00", tz="UTC")
+    arrays.assign_ticks(start.value, 300 * 10**9)
+    # Gap between 00:10 and 00:25 - rows are processed once the time axis reaches them
+    assert arrays.ticks.tolist() == [1, 2, 5, 6]
+    assert arrays.row_at_tick(2) == 1
+    assert arrays.row_at_tick(3) == -1
+    assert arrays.next_tick(2) == 5
+    assert arrays.next_tick(6) == sys.maxsize
+    assert arrays.entry_candidates(False).tolist() == [True, False, True, False]
+
+    row = arrays.row(0)
+    assert row[0] == pd.Timestamp("2022-01-01 00:05", tz="UTC")
+    assert row[1:] == (1.0, 1.0, 1.0, 1.0, 1, 0, 0, 0, "a", None)
+
+
 def test_backtest_start_timerange(default_conf, mocker, caplog, testdatadir):
     patch_exchange(mocker)
     mocker.patch("freqtrade.optimize.backtesting.Backtesting.backtest")
@@ -2637,6 +2919,106 @@ def test_get_strategy_run_id(default_conf_usdt):
     assert isinstance(x, str)
 
 
+def test_get_strategy_signal_id(default_conf_usdt):
+    default_conf_usdt.update({"strategy": "StrategyTestV3", "max_open_trades": float("inf")})
+    strategy = StrategyResolver.load_strategy(default_conf_usdt)
+    signal_id = get_strategy_signal_id(strategy)
+    assert isinstance(signal_id, str)
+
+    strategy.config["timerange"] = "20220101-"
+    strategy.config["exchange"]["pair_whitelist"] = ["XRP/USDT"]
+    strategy.config["stake_amount"] = 20
+    assert get_strategy_signal_id(strategy) == signal_id
+    # Pairs are part of the run id
+    assert get_strategy_run_id(strategy) != signal_id
+
+    strategy.config["timeframe"] = "1h"
+    assert get_strategy_signal_id(strategy) != signal_id
+
+
+def test_signal_cache(default_conf_usdt, tmp_path):
+    default_conf_usdt["strategy"] = "StrategyTestV3"
+    strategy = StrategyResolver.load_strategy(default_conf_usdt)
+    assert SignalCache.supports_strategy(strategy)
+    strategy.advise_indicators = MagicMock(
+        side_effect=lambda df, metadata: df.assign(sma=df["close"].rolling(10).mean())
+    )
+    strategy.ft_advise_signals = MagicMock(
+        side_effect=lambda df, metadata: df.assign(enter_long=(df["close"] > df["sma"]).astype(int))
+    )
+
+    candles = generate_test_data("5m", 500, "2022-01-03 12:00:00+00:00")
+    candles2 = generate_test_data("5m", 300, "2022-01-03 12:00:00+00:00", random_seed=5)
+    expected = SignalCache(tmp_path / "reference", strategy)._advise("ETH/USDT", candles)
+
+    def analyze(data):
+        strategy.advise_indicators.reset_mock()
+        cache = SignalCache(tmp_path, strategy)
+        return cache, cache.analyze(data)
+
+    cache, res = analyze({"ETH/USDT": candles.iloc[:300]})
+    assert (cache.hits, cache.misses) == (0, 1)
+    pd.testing.assert_frame_equal(res["ETH/USDT"], expected.iloc[:300])
+
+    # New pair
+    cache, res = analyze({"ETH/USDT": candles.iloc[:300], "XRP/USDT": candles2})
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert strategy.advise_indicators.call_count == 1
+    pd.testing.assert_frame_equal(res["ETH/USDT"], expected.iloc[:300])
+
+    # New candles - only analyzed with the startup period before them
+    cache, res = analyze({"ETH/USDT": candles})
+    assert (cache.hits, cache.misses) == (0, 1)
+    assert strategy.advise_indicators.call_count == 1
+    assert len(strategy.advise_indicators.call_args[0][0]) == 200 + strategy.startup_candle_count
+    pd.testing.assert_frame_equal(res["ETH/USDT"], expected)
+
+    # Shorter timerange
+    cache, res = analyze({"ETH/USDT": candles.iloc[:250]})
+    assert (cache.hits, cache.misses) == (1, 0)
+    assert strategy.advise_indicators.call_count == 0
+    pd.testing.assert_frame_equal(res["ETH/USDT"], expected.iloc[:250])
+
+    # Different start, modified candles
+    modified = candles.copy()
+    modified.loc[100, "close"] += 1
+    for data in (candles.iloc[10:], modified):
+        cache, res = analyze({"ETH/USDT": data})
+        assert (cache.hits, cache.misses) == (0, 1)
+        assert len(strategy.advise_indicators.call_args[0][0]) == len(data)
+
+    strategy._ft_informative = [MagicMock()]
+    assert not SignalCache.supports_strategy(strategy)
+
+
+def test_backtest_one_strategy_signal_cache(default_conf, mocker, testdatadir, tmp_path) -> None:
+    default_conf.update({"user_data_dir": tmp_path, "backtest_signal_cache": True})
+    patch_exchange(mocker)
+    mocker.patch(f"{EXMS}.get_min_pair_stake_amount", return_value=0.00001)
+    mocker.patch(f"{EXMS}.get_max_pair_stake_amount", return_value=float("inf"))
+    backtesting = Backtesting(default_conf)
+    timerange = TimeRange("date", None, 1517227800, 0)
+    data = history.load_data(
+        datadir=testdatadir, timeframe="5m", pairs=["UNITTEST/BTC"], timerange=timerange
+    )
+    strategy = backtesting.strategylist[0]
+    indicators_spy = mocker.spy(strategy, "advise_indicators")
+
+    results = []
+    for _ in range(2):
+        backtesting.backtest_one_strategy(strategy, deepcopy(data), timerange)
+        results.append(backtesting.all_results["StrategyTestV3"]["results"])
+    assert indicators_spy.call_count == 1
+    assert len(list((tmp_path / "backtest_results" / "signal_cache").glob("*/*.pkl"))) == 1
+
+    backtesting.config["backtest_signal_cache"] = False
+    backtesting.backtest_one_strategy(strategy, deepcopy(data), timerange)
+    assert indicators_spy.call_count == 2
+    assert len(results[0]) > 0
+    pd.testing.assert_frame_equal(results[0], results[1])
+    pd.testing.assert_frame_equal(results[0], backtesting.all_results["StrategyTestV3"]["results"])
+
+
 def test_get_backtest_metadata_filename():
     # Test with a file path
     filename = Path("backtest_results.json")
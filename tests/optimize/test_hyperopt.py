@@ -1,9 +1,11 @@
 # pragma pylint: disable=missing-docstring,W0212,C0103
+import logging
 from datetime import datetime, timedelta
 from functools import wraps
 from pathlib import Path
 from unittest.mock import ANY, MagicMock, PropertyMock
 
+import numpy as np
 import pandas as pd
 import pytest
 from filelock import Timeout
@@ -14,7 +16,9 @@ from freqtrade.data.history import load_data
 from freqtrade.enums import ExitType, RunMode
 from freqtrade.exceptions import OperationalException
 from freqtrade.optimize.hyperopt import Hyperopt
+from freqtrade.optimize.hyperopt.hyperopt import _init_worker, _run_worker_epoch
 from freqtrade.optimize.hyperopt.hyperopt_auto import HyperOptAuto
+from freqtrade.optimize.hyperopt.hyperopt_data_store import HyperoptDataStore
 from freqtrade.optimize.hyperopt_tools import HyperoptTools
 from freqtrade.optimize.optimize_reports import generate_strategy_stats
 from freqtrade.optimize.space import SKDecimal
@@ -858,6 +862,8 @@ def test_simplified_interface_roi_stoploss(mocker, hyperopt_conf, capsys) -> Non
         hyperopt.hyperopter.backtesting.strategy.max_open_trades == hyperopt_conf["max_open_trades"]
     )
     assert hasattr(hyperopt.hyperopter.backtesting, "_position_stacking")
+    # Signals don't depend on roi / stoploss
+    assert hyperopt.hyperopter.backtesting.reuse_signals is True
 
 
 def test_simplified_interface_all_failed(mocker, hyperopt_conf, caplog) -> None:
@@ -951,6 +957,7 @@ def test_simplified_interface_buy(mocker, hyperopt_conf, capsys) -> None:
         hyperopt.hyperopter.backtesting.strategy.max_open_trades == hyperopt_conf["max_open_trades"]
     )
     assert hasattr(hyperopt.hyperopter.backtesting, "_position_stacking")
+    assert hyperopt.hyperopter.backtesting.reuse_signals is False
 
 
 def test_simplified_interface_sell(mocker, hyperopt_conf, capsys) -> None:
@@ -1093,7 +1100,10 @@ def test_in_strategy_auto_hyperopt(mocker, hyperopt_conf, tmp_path, fee) -> None
 
 
 @pytest.mark.filterwarnings("ignore::DeprecationWarning")
-def test_in_strategy_auto_hyperopt_with_parallel(mocker, hyperopt_conf, tmp_path, fee) -> None:
+@pytest.mark.parametrize("data_store", ["pickle", "memmap"])
+def test_in_strategy_auto_hyperopt_with_parallel(
+    mocker, hyperopt_conf, tmp_path, fee, data_store
+) -> None:
     mocker.patch(f"{EXMS}.validate_config", MagicMock())
     mocker.patch(f"{EXMS}.get_fee", fee)
     mocker.patch(f"{EXMS}.reload_markets")
@@ -1112,6 +1122,7 @@ def test_in_strategy_auto_hyperopt_with_parallel(mocker, hyperopt_conf, tmp_path
             "epochs": 2,
             "hyperopt_jobs": 2,
             "fee": fee.return_value,
+            "hyperopt_data_store": data_store,
         }
     )
     hyperopt = Hyperopt(hyperopt_conf)
@@ -1136,6 +1147,72 @@ def test_in_strategy_auto_hyperopt_with_parallel(mocker, hyperopt_conf, tmp_path
     assert len(list(buy_rsi_range)) == 51
 
     hyperopt.start()
+    assert (tmp_path / "hyperopt_results" / "hyperopt_tickerdata").is_dir() == (
+        data_store == "memmap"
+    )
+    assert hyperopt.num_epochs_saved == 2
+
+
+def test_hyperopt_worker(mocker, hyperopt_conf) -> None:
+    patch_exchange(mocker)
+    hyperopt = Hyperopt(hyperopt_conf)
+    go = mocker.patch.object(
+        hyperopt.hyperopter, "generate_optimizer", side_effect=lambda p: {"loss": p[0]}
+    )
+    # Single job - evaluated in this process
+    assert hyperopt._start_worker_pool(1) is None
+    assert hyperopt.run_optimizer_parallel(None, [[1], [2]]) == [{"loss": 1}, {"loss": 2}]
+    assert go.call_count == 2
+
+    mocker.patch("freqtrade.optimize.hyperopt.hyperopt._worker_hyperopter", None)
+    with pytest.raises(OperationalException, match=r"worker has not been initialized"):
+        _run_worker_epoch([1])
+
+    logging_setup = mocker.patch("freqtrade.optimize.hyperopt.hyperopt.logging_mp_setup")
+    _init_worker(hyperopt.hyperopter, None, logging.INFO)
+    assert logging_setup.call_count == 1
+    assert _run_worker_epoch([3]) == {"loss": 3}
+    assert go.call_count == 3
+
+
+def test_hyperopt_data_store(tmp_path) -> None:
+    df = pd.DataFrame(
+        {
+            "date": pd.date_range("2022-01-01", periods=10, freq="5min", tz="UTC"),
+            "open": np.arange(10, dtype="float64"),
+            "close": np.arange(10, dtype="float64") + 0.5,
+            "volume": np.arange(10, dtype="int64"),
+            "tag": ["a"] * 10,
+            "rsi": np.linspace(0, 100, 10),
+            "signal": np.arange(10) % 2 == 0,
+        }
+    )
+    store = HyperoptDataStore(tmp_path / "store")
+    store.dump({"ETH/BTC": df, "XRP/BTC": df.iloc[:0]})
+
+    data = store.load()
+    assert list(data.keys()) == ["ETH/BTC", "XRP/BTC"]
+    pd.testing.assert_frame_equal(data["ETH/BTC"], df)
+    pd.testing.assert_frame_equal(data["XRP/BTC"], df.iloc[:0])
+    # Numeric columns are read-only views of the memory-mapped store
+    assert not data["ETH/BTC"]["rsi"].to_numpy().flags.writeable
+
+    data["ETH/BTC"]["new_col"] = 1
+    data["ETH/BTC"].loc[2, "tag"] = "b"
+    data2 = store.load()
+    assert "new_col" not in data2["ETH/BTC"]
+    assert data2["ETH/BTC"].loc[2, "tag"] == "a"
+    # Arrays are mapped once per process
+    assert np.shares_memory(data["ETH/BTC"]["rsi"].to_numpy(), data2["ETH/BTC"]["rsi"].to_numpy())
+
+    # Dumping again replaces the mapped data
+    store.dump({"ETH/BTC": df.assign(rsi=1.0)})
+    data3 = store.load()
+    assert list(data3.keys()) == ["ETH/BTC"]
+    assert (data3["ETH/BTC"]["rsi"] == 1.0).all()
+
+    store.clear()
+    assert not (tmp_path / "store").exists()
 
 
 def test_in_strategy_auto_hyperopt_per_epoch(mocker, hyperopt_conf, tmp_path, fee) -> None:
@@ -5,7 +5,7 @@ from pathlib import Path
 from unittest.mock import MagicMock
 
 import pytest
-from sqlalchemy import create_engine, select, text
+from sqlalchemy import create_engine, inspect, select, text
 from sqlalchemy.schema import CreateTable
 
 from freqtrade.constants import DEFAULT_DB_PROD_URL
@@ -437,6 +437,21 @@ def test_migrate_pairlocks(mocker, default_conf, fee, caplog):
     assert pairlocks[0].side == "*"
 
 
+def test_migrate_missing_indexes(tmp_path):
+    db_url = f"sqlite:///{tmp_path / 'tradesv3.sqlite'}"
+    init_db(db_url)
+    engine = create_engine(db_url)
+    with engine.begin() as connection:
+        connection.execute(text("drop index ix_trades_performance"))
+    indexes = [index["name"] for index in inspect(engine).get_indexes("trades")]
+    assert "ix_trades_performance" not in indexes
+
+    init_db(db_url)
+    indexes = inspect(engine).get_indexes("trades")
+    index = next(index for index in indexes if index["name"] == "ix_trades_performance")
+    assert index["column_names"] == ["is_open", "pair", "close_date", "enter_tag", "exit_reason"]
+
+
 @pytest.mark.parametrize(
     "dialect",
     [
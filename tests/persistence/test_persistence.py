@@ -1946,6 +1946,26 @@ def test_get_best_pair(fee, is_short, pair, profit):
     assert res[1] == profit
 
 
+@pytest.mark.usefixtures("init_persistence")
+def test_get_daily_closed_profit(fee, time_machine):
+    time_machine.move_to("2023-09-05 10:00:00 +00:00", tick=False)
+    start_date = datetime(2023, 8, 1, tzinfo=timezone.utc)
+    assert Trade.get_daily_closed_profit(start_date) == {}
+
+    create_mock_trades_usdt(fee)
+    res = Trade.get_daily_closed_profit(start_date)
+    closed_trades = Trade.get_trades_proxy(is_open=False)
+    assert sum(count for _, count in res.values()) == len(closed_trades)
+    for trade in closed_trades:
+        day = trade.close_date.date()
+        assert day in res
+        day_trades = [t for t in closed_trades if t.close_date.date() == day]
+        assert res[day][0] == pytest.approx(sum(t.close_profit_abs for t in day_trades))
+        assert res[day][1] == len(day_trades)
+
+    assert Trade.get_daily_closed_profit(datetime(2023, 9, 6, tzinfo=timezone.utc)) == {}
+
+
 @pytest.mark.usefixtures("init_persistence")
 def test_get_best_pair_lev(fee):
     res = Trade.get_best_pair()
@@ -2125,6 +2145,7 @@ def test_Trade_object_idem():
         "query",
         "open_date",
         "get_best_pair",
+        "get_daily_closed_profit",
         "get_overall_performance",
         "get_total_closed_profit",
         "total_open_trades_stakes",
@@ -0,0 +1,143 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import select
+
+from freqtrade.persistence import PairLocks, Trade
+from freqtrade.persistence.pairlock import PairLock
+from freqtrade.persistence.session_registry import ACTIVE_LOCKS, ObjectRegistry, get_registry
+from tests.conftest import create_mock_trades_usdt
+
+
+def _db_open_trades() -> set[int]:
+    return set(Trade.session.scalars(select(Trade.id).filter(Trade.is_open.is_(True))).all())
+
+
+@pytest.mark.usefixtures("init_persistence")
+def test_open_trades_registry(fee, mocker):
+    create_mock_trades_usdt(fee)
+    load_mock = mocker.spy(ObjectRegistry, "__init__")
+
+    open_trades = Trade.get_open_trades()
+    assert {t.id for t in open_trades} == _db_open_trades()
+    assert Trade.get_open_trade_count() == len(open_trades)
+    assert load_mock.call_count == 1
+
+    trade = open_trades[0]
+    assert Trade.get_trades_proxy(pair=trade.pair, is_open=True) == [
+        t for t in open_trades if t.pair == trade.pair
+    ]
+    assert Trade.get_trades_proxy(pair="NONEXISTENT/USDT", is_open=True) == []
+
+    # Closing a trade removes it from the open trades
+    trade.is_open = False
+    trade.close_date = datetime.now(timezone.utc)
+    # Not committed yet - still open in the database
+    assert trade in Trade.get_open_trades()
+    Trade.commit()
+    assert trade not in Trade.get_open_trades()
+    assert {t.id for t in Trade.get_open_trades()} == _db_open_trades()
+
+    # Reopened trade is added again
+    trade.is_open = True
+    trade.close_date = None
+    Trade.commit()
+    assert trade in Trade.get_open_trades()
+    assert Trade.get_open_trade_count() == len(open_trades)
+    # Still served from memory
+    assert load_mock.call_count == 1
+    assert Trade.total_open_trades_stakes() == pytest.approx(
+        sum(t.stake_amount for t in open_trades)
+    )
+
+    trade.delete()
+    assert trade not in Trade.get_open_trades()
+    assert {t.id for t in Trade.get_open_trades()} == _db_open_trades()
+
+    # Rollback discards the registry
+    Trade.rollback()
+    Trade.get_open_trades()
+    assert load_mock.call_count == 2
+
+
+@pytest.mark.usefixtures("init_persistence")
+def test_open_trades_registry_other_session(fee, mocker):
+    create_mock_trades_usdt(fee)
+    open_trades = Trade.get_open_trades()
+    trade = open_trades[0]
+    load_mock = mocker.spy(ObjectRegistry, "__init__")
+
+    # Commits of another session (e.g. an API request) reload the open trades
+    other_session = Trade.session.session_factory()
+    other_trade = other_session.get(Trade, trade.id)
+    other_trade.is_open = False
+    other_trade.close_date = datetime.now(timezone.utc)
+    other_session.commit()
+    other_session.close()
+
+    assert trade not in Trade.get_open_trades()
+    assert load_mock.call_count == 1
+    assert trade.is_open is False
+    assert Trade.get_open_trade_count() == len(open_trades) - 1
+
+    # Own commits don't require a reload
+    trade.is_open = True
+    Trade.commit()
+    assert trade in Trade.get_open_trades()
+    assert load_mock.call_count == 1
+
+    # Objects with pending changes are not reloaded - until the changes are committed
+    other_trade = open_trades[1]
+    trade.exit_reason = "pending"
+    other_session = Trade.session.session_factory()
+    other_session.get(Trade, other_trade.id).stake_amount = 123
+    other_session.commit()
+    other_session.close()
+
+    assert Trade.get_open_trade_count() == len(open_trades)
+    assert other_trade.stake_amount != 123
+    Trade.commit()
+    assert Trade.get_open_trade_count() == len(open_trades)
+    assert other_trade.stake_amount == 123
+    assert trade.exit_reason == "pending"
+
+
+@pytest.mark.usefixtures("init_persistence")
+def test_pair_locks_registry(mocker, time_machine):
+    PairLocks.timeframe = "5m"
+    load_mock = mocker.spy(ObjectRegistry, "__init__")
+    now = datetime.now(timezone.utc)
+    assert not PairLocks.is_pair_locked("ETH/USDT", now)
+    assert load_mock.call_count == 1
+
+    PairLocks.lock_pair("ETH/USDT", now + timedelta(minutes=10), side="long")
+    assert PairLocks.is_pair_locked("ETH/USDT", now, side="long")
+    assert not PairLocks.is_pair_locked("ETH/USDT", now, side="short")
+    assert not PairLocks.is_pair_locked("XRP/USDT", now, side="long")
+    assert not PairLocks.is_pair_locked("ETH/USDT", now + timedelta(minutes=20), side="long")
+
+    PairLocks.unlock_pair("ETH/USDT", now, side="long")
+    assert not PairLocks.is_pair_locked("ETH/USDT", now, side="long")
+    assert load_mock.call_count == 1
+
+    # Expired locks remain active in the database, but are dropped from the registry
+    time_machine.move_to(now, tick=False)
+    PairLocks.lock_pair("XRP/USDT", now + timedelta(minutes=10))
+    PairLocks.lock_pair("LTC/USDT", now + timedelta(minutes=30))
+    assert len(PairLocks.get_pair_locks(None)) == 2
+    time_machine.move_to(now + timedelta(minutes=20), tick=False)
+    registry = get_registry(PairLock.session(), ACTIVE_LOCKS)
+    assert len(registry) == 2
+    assert [lock.pair for lock in PairLocks.get_pair_locks(None)] == ["LTC/USDT"]
+    assert len(registry) == 1
+    assert len(PairLock.session.scalars(select(PairLock).filter(PairLock.active)).all()) == 2
+    # Earlier points in time still see the expired lock - from the database
+    assert PairLocks.is_pair_locked("XRP/USDT", now + timedelta(minutes=5))
+    assert len(registry) == 1
+
+    # Expired locks are not loaded into the registry
+    PairLock.session.rollback()
+    assert [lock.pair for lock in PairLocks.get_pair_locks(None)] == ["LTC/USDT"]
+    assert load_mock.call_count == 2
+    assert len(get_registry(PairLock.session(), ACTIVE_LOCKS)) == 1
+    PairLocks.timeframe = ""
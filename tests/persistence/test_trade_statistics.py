@@ -0,0 +1,125 @@
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+
+from freqtrade.data.metrics import (
+    calculate_expectancy,
+    calculate_expectancy_from_sums,
+    calculate_max_drawdown,
+)
+from freqtrade.persistence import ClosedTradeStatistics, Trade, TradeStatistics
+from tests.conftest import create_mock_trades_usdt
+
+
+def _closed_trade(trade_id, pair, profit_abs, close_date, exit_reason="roi"):
+    return SimpleNamespace(
+        id=trade_id,
+        pair=pair,
+        open_date=close_date - timedelta(minutes=30),
+        close_date=close_date,
+        close_profit=profit_abs / 100,
+        close_profit_abs=profit_abs,
+        exit_reason=exit_reason,
+    )
+
+
+def test_closed_trade_statistics():
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    profits = [5.0, -2.0, 3.0, -4.0, -3.0, 6.0, 1.0, 0.0, -1.0]
+    trades = [
+        _closed_trade(i, "ETH/USDT" if i % 2 else "XRP/USDT", p, start + timedelta(hours=i))
+        for i, p in enumerate(profits, start=1)
+    ]
+    stats = ClosedTradeStatistics()
+    for trade in trades:
+        assert stats.add_trade(trade)
+
+    df = pd.DataFrame(
+        {
+            "profit_abs": [t.close_profit_abs for t in trades],
+            "close_date": [t.close_date for t in trades],
+        }
+    )
+    drawdown = calculate_max_drawdown(df, starting_balance=100)
+    assert stats.drawdown_abs == pytest.approx(drawdown.drawdown_abs)
+    assert stats.drawdown_high_date == drawdown.high_date
+    assert stats.drawdown_low_date == drawdown.low_date
+    assert stats.drawdown_high_value == pytest.approx(drawdown.high_value)
+    assert stats.drawdown_low_value == pytest.approx(drawdown.low_value)
+    assert stats.relative_drawdown(100) == pytest.approx(drawdown.relative_account_drawdown)
+
+    assert stats.win_abs_count == 4
+    assert stats.loss_abs_count == 4
+    assert stats.duration_count == len(trades)
+    expectancy = calculate_expectancy_from_sums(
+        stats.win_abs_sum,
+        abs(stats.loss_abs_sum),
+        stats.win_abs_count,
+        stats.loss_abs_count,
+        stats.duration_count,
+    )
+    assert expectancy == pytest.approx(calculate_expectancy(df))
+
+    assert stats.trade_count == 9
+    assert stats.profit_abs == pytest.approx(sum(profits))
+    assert stats.winning_trades == 5
+    assert stats.losing_trades == 4
+    assert stats.best_pair() == ("ETH/USDT", pytest.approx(0.05))
+    assert stats.exit_reasons == {"roi": {"wins": 4, "losses": 4, "draws": 1}}
+    assert stats.outcome_durations["draws"] == [1800.0, 1]
+    assert stats.first_trade == (1, trades[0].open_date)
+    assert stats.last_trade == (9, trades[-1].open_date)
+
+    # Trades closing before the last trade can't be added
+    assert not stats.add_trade(_closed_trade(10, "ETH/USDT", 1.0, start))
+    assert stats.trade_count == 9
+
+    # No losing trade, no drawdown
+    stats = ClosedTradeStatistics()
+    stats.add_trade(_closed_trade(1, "ETH/USDT", 1.0, start))
+    stats.add_trade(_closed_trade(2, "ETH/USDT", 2.0, start + timedelta(hours=1)))
+    assert stats.drawdown_abs == 0
+    assert stats.relative_drawdown(100) == 0
+
+
+@pytest.mark.usefixtures("init_persistence")
+def test_trade_statistics(fee, mocker):
+    trade_statistics = TradeStatistics()
+    stats = trade_statistics.get()
+    assert stats.trade_count == 0
+
+    create_mock_trades_usdt(fee)
+    closed_trades = Trade.get_trades_proxy(is_open=False)
+    # Trades closed outside of the bot are found
+    stats = trade_statistics.get()
+    assert stats.trade_count == len(closed_trades)
+    assert stats.profit_abs == pytest.approx(sum(t.close_profit_abs for t in closed_trades))
+    assert stats == ClosedTradeStatistics.load()
+
+    load_mock = mocker.spy(ClosedTradeStatistics, "load_trades")
+    trade = Trade.get_trades_proxy(is_open=True)[0]
+    trade.close_date = datetime.now(timezone.utc) + timedelta(minutes=1)
+    trade.close_profit = 0.05
+    trade.close_profit_abs = 2.0
+    trade.is_open = False
+    Trade.commit()
+    trade_statistics.trade_closed(trade)
+    stats = trade_statistics.get()
+    assert load_mock.call_count == 0
+    assert stats.trade_count == len(closed_trades) + 1
+    assert stats == ClosedTradeStatistics.load()
+    load_mock.reset_mock()
+
+    # Trade closed again (e.g. fee update) - statistics are rebuilt
+    trade.close_profit_abs = 1.5
+    Trade.commit()
+    trade_statistics.trade_closed(trade)
+    stats = trade_statistics.get()
+    assert load_mock.call_count == 1
+    assert stats.profit_abs == pytest.approx(sum(t.close_profit_abs for t in closed_trades) + 1.5)
+
+    trade_statistics.reset()
+    trade_statistics.get()
+    assert load_mock.call_count == 2
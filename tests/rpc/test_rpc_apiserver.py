@@ -9,6 +9,7 @@ from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from unittest.mock import ANY, MagicMock, PropertyMock
 
+import numpy as np
 import pandas as pd
 import pytest
 import rapidjson
@@ -1925,6 +1926,23 @@ def test_api_pair_candles(botclient, ohlcv_history):
     ]
 
 
+def test_api_pair_candles_compact_orderflow(botclient, ohlcv_history):
+    ftbot, client = botclient
+    levels = np.array(
+        [(0.1, 1, 0), (0.2, 0, 2)], dtype=[("price", "f8"), ("bid", "i8"), ("ask", "i8")]
+    )
+    ohlcv_history["orderflow"] = pd.Series([levels, np.nan, levels[:1]], dtype=object)
+    ftbot.dataprovider._set_cached_df("XRP/BTC", "5m", ohlcv_history, CandleType.SPOT)
+
+    rc = client_get(client, f"{BASE_URI}/pair_candles?limit=3&pair=XRP%2FBTC&timeframe=5m")
+    assert_response(rc)
+    resp = rc.json()
+    col = resp["columns"].index("orderflow")
+    record1 = {"price": 0.1, "bid": 1, "ask": 0}
+    record2 = {"price": 0.2, "bid": 0, "ask": 2}
+    assert [row[col] for row in resp["data"]] == [[record1, record2], None, [record1]]
+
+
 def test_api_pair_history(botclient, tmp_path, mocker):
     _ftbot, client = botclient
     _ftbot.config["user_data_dir"] = tmp_path
@@ -2774,6 +2792,34 @@ def test_health(botclient):
     assert ret["last_process"] is None
 
 
+def test_process_timings(botclient):
+    ftbot, client = botclient
+    ftbot.phase_timings.observe("refresh_data", 0.2)
+    ftbot.phase_timings.observe("analyze_pair", 0.05, pair="ETH/BTC")
+
+    rc = client_get(client, f"{BASE_URI}/process_timings")
+    assert_response(rc)
+    ret = rc.json()
+    assert ret["buckets"][0] == 0.005
+    assert len(ret["timings"]) == 2
+    assert ret["timings"][0]["phase"] == "refresh_data"
+    assert ret["timings"][0]["pair"] is None
+    assert ret["timings"][0]["count"] == 1
+    assert ret["timings"][0]["sum"] == 0.2
+    assert ret["timings"][0]["bucket_counts"][-1] == 1
+    assert ret["timings"][1]["pair"] == "ETH/BTC"
+
+    rc = client_get(client, f"{BASE_URI}/process_timings/prometheus")
+    assert rc.status_code == 200
+    assert rc.headers.get("content-type") == "text/plain; charset=utf-8"
+    assert "# TYPE freqtrade_process_phase_seconds histogram" in rc.text
+    assert 'freqtrade_process_phase_seconds_count{phase="refresh_data"} 1' in rc.text
+    assert (
+        'freqtrade_process_phase_seconds_bucket{phase="analyze_pair",pair="ETH/BTC",le="+Inf"} 1'
+        in rc.text
+    )
+
+
 def test_api_ws_subscribe(botclient, mocker):
     _ftbot, client = botclient
     ws_url = f"/api/v1/message/ws?token={_TEST_WS_TOKEN}"
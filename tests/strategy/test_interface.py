@@ -1,10 +1,13 @@
 # pragma pylint: disable=missing-docstring, C0103
 import logging
 import math
+import time
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from unittest.mock import MagicMock
 
+import numpy as np
+import pandas as pd
 import pytest
 from pandas import DataFrame
 
@@ -12,13 +15,14 @@ from freqtrade.configuration import TimeRange
 from freqtrade.constants import CUSTOM_TAG_MAX_LENGTH
 from freqtrade.data.dataprovider import DataProvider
 from freqtrade.data.history import load_data
-from freqtrade.enums import ExitCheckTuple, ExitType, HyperoptState, SignalDirection
+from freqtrade.enums import ExitCheckTuple, ExitType, HyperoptState, RunMode, SignalDirection
 from freqtrade.exceptions import OperationalException, StrategyError
 from freqtrade.optimize.hyperopt_tools import HyperoptStateContainer
 from freqtrade.optimize.space import SKDecimal
 from freqtrade.persistence import PairLocks, Trade
 from freqtrade.resolvers import StrategyResolver
 from freqtrade.strategy.hyper import detect_parameters
+from freqtrade.strategy.indicator_cache import IndicatorCache
 from freqtrade.strategy.parameters import (
     BaseParameter,
     BooleanParameter,
@@ -28,7 +32,13 @@ from freqtrade.strategy.parameters import (
     RealParameter,
 )
 from freqtrade.util import dt_now
-from tests.conftest import CURRENT_TEST_STRATEGY, TRADE_SIDES, log_has, log_has_re
+from tests.conftest import (
+    CURRENT_TEST_STRATEGY,
+    TRADE_SIDES,
+    generate_test_data,
+    log_has,
+    log_has_re,
+)
 
 from .strats.strategy_test_v3 import StrategyTestV3
 
@@ -825,6 +835,99 @@ def test__analyze_ticker_internal_skip_analyze(ohlcv_history, mocker, caplog) ->
     assert log_has("Skipping TA Analysis for already analyzed candle", caplog)
 
 
+def test__analyze_ticker_internal_incremental(mocker, caplog) -> None:
+    caplog.set_level(logging.DEBUG)
+
+    def populate(dataframe, metadata):
+        dataframe["sma"] = dataframe["close"].rolling(5).mean()
+        dataframe["enter_long"] = (dataframe["close"] > dataframe["sma"].shift(1)).astype(int)
+        return dataframe
+
+    ind_mock = MagicMock(side_effect=populate)
+    mocker.patch.multiple(
+        "freqtrade.strategy.interface.IStrategy",
+        advise_indicators=ind_mock,
+        advise_entry=MagicMock(side_effect=lambda x, meta: x),
+        advise_exit=MagicMock(side_effect=lambda x, meta: x),
+    )
+    data = generate_test_data("5m", 101)
+    strategy = StrategyTestV3({})
+    strategy.dp = DataProvider({"runmode": RunMode.DRY_RUN}, None, None)
+    strategy.incremental_lookback = 6
+    expected = populate(data.copy(), {})
+
+    strategy._analyze_ticker_internal(data.iloc[:97].copy(), {"pair": "ETH/BTC"})
+    assert len(ind_mock.call_args[0][0]) == 97
+    assert not log_has_re(r"Incremental TA Analysis", caplog)
+
+    # Window moves by 2 candles - only new candles and the lookback are analyzed
+    ret = strategy._analyze_ticker_internal(
+        data.iloc[2:99].reset_index(drop=True), {"pair": "ETH/BTC"}
+    )
+    assert len(ind_mock.call_args[0][0]) == 8
+    assert log_has("Incremental TA Analysis of 2 candle(s)", caplog)
+    pd.testing.assert_frame_equal(ret, expected.iloc[2:99].reset_index(drop=True))
+    pd.testing.assert_frame_equal(strategy.dp.get_analyzed_dataframe("ETH/BTC", "5m")[0], ret)
+
+    # Revised candle (e.g. updated from the trades buffer) - analyze fully
+    revised = data.iloc[3:100].reset_index(drop=True)
+    revised.loc[95, "high"] += 1
+    ret = strategy._analyze_ticker_internal(revised.copy(), {"pair": "ETH/BTC"})
+    assert len(ind_mock.call_args[0][0]) == 97
+    pd.testing.assert_frame_equal(ret, populate(revised, {}))
+
+    # Missing candle (with a new last candle) - analyze fully
+    ret = strategy._analyze_ticker_internal(
+        data.drop(index=98).reset_index(drop=True), {"pair": "ETH/BTC"}
+    )
+    assert len(ind_mock.call_args[0][0]) == 100
+
+    # Not used outside of dry / live modes
+    strategy.dp = DataProvider({"runmode": RunMode.BACKTEST}, None, None)
+    strategy._analyze_ticker_internal(data.iloc[:99].copy(), {"pair": "ETH/BTC"})
+    strategy._analyze_ticker_internal(data.iloc[:100].copy(), {"pair": "ETH/BTC"})
+    assert len(ind_mock.call_args[0][0]) == 100
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_analyze_workers(ohlcv_history, mocker, caplog, workers) -> None:
+    pairs = ["ETH/BTC", "LTC/BTC", "XRP/BTC", "NEO/BTC"]
+    delays = {"ETH/BTC": 0.05, "LTC/BTC": 0.0, "XRP/BTC": 0.02, "NEO/BTC": 0.0}
+
+    def analyze_ticker(dataframe, metadata):
+        if metadata["pair"] == "XRP/BTC":
+            raise ValueError("xyz")
+        # Finish in a different order than requested
+        time.sleep(delays[metadata["pair"]])
+        return dataframe.assign(pair_col=metadata["pair"])
+
+    strategy = StrategyTestV3({"internals": {"analyze_workers": workers}})
+    strategy.dp = DataProvider({}, None, None)
+    # Each pair gets its own dataframe - as from `dp.ohlcv()`
+    mocker.patch.object(
+        strategy.dp, "ohlcv", side_effect=lambda *args, **kwargs: ohlcv_history.copy()
+    )
+    mocker.patch.object(strategy, "analyze_ticker", side_effect=analyze_ticker)
+    cached_mock = mocker.patch.object(strategy.dp, "_set_cached_df")
+    emit_mock = mocker.patch.object(strategy.dp, "_emit_df")
+
+    strategy.analyze(pairs)
+
+    assert strategy.analyze_ticker.call_count == 4
+    assert [c[0][0] for c in cached_mock.call_args_list] == ["ETH/BTC", "LTC/BTC", "NEO/BTC"]
+    assert [c[0][0][0] for c in emit_mock.call_args_list] == ["ETH/BTC", "LTC/BTC", "NEO/BTC"]
+    for c in cached_mock.call_args_list:
+        assert (c[0][2]["pair_col"] == c[0][0]).all()
+    assert all(c[0][2] is True for c in emit_mock.call_args_list)
+    assert log_has("Unable to analyze candle (OHLCV) data for pair XRP/BTC: xyz", caplog)
+
+    # Already analyzed candles are neither analyzed nor published again
+    cached_mock.reset_mock()
+    strategy.analyze(pairs)
+    assert strategy.analyze_ticker.call_count == 5
+    assert cached_mock.call_count == 0
+
+
 @pytest.mark.usefixtures("init_persistence")
 def test_is_pair_locked(default_conf):
     PairLocks.timeframe = default_conf["timeframe"]
@@ -1015,6 +1118,63 @@ def test_auto_hyperopt_interface(default_conf):
         [x for x in detect_parameters(strategy, "sell")]
 
 
+def test_indicator_cache():
+    cache = IndicatorCache(max_bytes=200)
+    cache.set("a", np.zeros(10))
+    cache.set("b", np.zeros(10))
+    assert cache.size == 160
+    assert cache.get("a") is not None
+    assert cache.get("c") is None
+    assert (cache.hits, cache.misses) == (1, 1)
+    # "b" is the least recently used value
+    cache.set("c", np.zeros(10))
+    assert "b" not in cache
+    assert "a" in cache
+    assert "c" in cache
+    assert cache.size == 160
+    # Too big to be cached
+    cache.set("d", np.zeros(50))
+    assert "d" not in cache
+    assert len(cache) == 2
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.size == 0
+
+
+@pytest.mark.parametrize("runmode,cached", [(RunMode.HYPEROPT, True), (RunMode.BACKTEST, False)])
+def test_cached_indicator(default_conf, ohlcv_history, runmode, cached):
+    default_conf.update({"strategy": "HyperoptableStrategy", "runmode": runmode, "spaces": []})
+    strategy = StrategyResolver.load_strategy(default_conf)
+    strategy.ft_bot_start()
+    func = MagicMock(side_effect=lambda: ohlcv_history["close"] * strategy.buy_rsi.value)
+    metadata = {"pair": "ETH/BTC"}
+
+    res = strategy.cached_indicator(ohlcv_history, metadata, "ind", func, strategy.buy_rsi)
+    assert func.call_count == 1
+    # Modifying the result doesn't change the cached value
+    res.iloc[0] = -1
+    res2 = strategy.cached_indicator(ohlcv_history, metadata, "ind", func, strategy.buy_rsi)
+    assert func.call_count == (1 if cached else 2)
+    assert res2.iloc[0] == ohlcv_history["close"].iloc[0] * strategy.buy_rsi.value
+
+    # Different parameter value, pair or data require a new calculation
+    strategy.buy_rsi.value += 1
+    strategy.cached_indicator(ohlcv_history, metadata, "ind", func, strategy.buy_rsi)
+    assert func.call_count == (2 if cached else 3)
+    strategy.cached_indicator(ohlcv_history, {"pair": "XRP/BTC"}, "ind", func, strategy.buy_rsi)
+    assert func.call_count == (3 if cached else 4)
+    strategy.cached_indicator(ohlcv_history[1:], metadata, "ind", func, strategy.buy_rsi)
+    assert func.call_count == (4 if cached else 5)
+    # Reverting to the initial value reuses the first result
+    strategy.buy_rsi.value -= 1
+    strategy.cached_indicator(ohlcv_history, metadata, "ind", func, strategy.buy_rsi)
+    assert func.call_count == (4 if cached else 6)
+
+    default_conf["hyperopt_indicator_cache_mb"] = 0
+    strategy = StrategyResolver.load_strategy(default_conf)
+    assert strategy._ft_indicator_cache is None
+
+
 def test_auto_hyperopt_interface_loadparams(default_conf, mocker, caplog):
     default_conf.update({"strategy": "HyperoptableStrategy"})
     del default_conf["stoploss"]
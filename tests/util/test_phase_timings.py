@@ -0,0 +1,68 @@
+from freqtrade.util import PhaseTimings
+
+
+def test_phase_timings(mocker):
+    timings = PhaseTimings(buckets=(0.1, 1.0))
+    assert timings.to_json() == {"buckets": [0.1, 1.0], "timings": []}
+
+    timings.observe("refresh_data", 0.05)
+    timings.observe("refresh_data", 0.5)
+    timings.observe("refresh_data", 1.0)
+    timings.observe("refresh_data", 3.0)
+    timings.observe("analyze_pair", 0.2, pair='ETH/"USDT')
+
+    mocker.patch("freqtrade.util.phase_timings.time.perf_counter", side_effect=[10.0, 10.25])
+    with timings.measure("commit"):
+        pass
+
+    result = timings.to_json()
+    assert result["timings"] == [
+        {
+            "phase": "refresh_data",
+            "pair": None,
+            "count": 4,
+            "sum": 4.55,
+            "last": 3.0,
+            "max": 3.0,
+            "bucket_counts": [1, 3, 4],
+        },
+        {
+            "phase": "analyze_pair",
+            "pair": 'ETH/"USDT',
+            "count": 1,
+            "sum": 0.2,
+            "last": 0.2,
+            "max": 0.2,
+            "bucket_counts": [0, 1, 1],
+        },
+        {
+            "phase": "commit",
+            "pair": None,
+            "count": 1,
+            "sum": 0.25,
+            "last": 0.25,
+            "max": 0.25,
+            "bucket_counts": [0, 1, 1],
+        },
+    ]
+
+    lines = timings.to_prometheus().splitlines()
+    assert lines[:2] == [
+        "# HELP freqtrade_process_phase_seconds Duration of the phases of the bot loop.",
+        "# TYPE freqtrade_process_phase_seconds histogram",
+    ]
+    assert lines[2:7] == [
+        'freqtrade_process_phase_seconds_bucket{phase="refresh_data",le="0.1"} 1',
+        'freqtrade_process_phase_seconds_bucket{phase="refresh_data",le="1"} 3',
+        'freqtrade_process_phase_seconds_bucket{phase="refresh_data",le="+Inf"} 4',
+        'freqtrade_process_phase_seconds_sum{phase="refresh_data"} 4.55',
+        'freqtrade_process_phase_seconds_count{phase="refresh_data"} 4',
+    ]
+    assert (
+        'freqtrade_process_phase_seconds_bucket{phase="analyze_pair",pair="ETH/\\"USDT",le="1"} 1'
+        in lines
+    )
+    assert len(lines) == 2 + 3 * 5
+
+    timings.reset()
+    assert timings.to_json()["timings"] == []